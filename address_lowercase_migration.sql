@@ -0,0 +1,104 @@
+-- address_lowercase_migration.sql
+-- Jednorazowa migracja: wszystkie adresy (i tx_hash) w bazie -> lowercase.
+-- Ingesty zapisują już lowercase, a odczyty w server.py robią zwykłe
+-- "pair_address = $1" / "wallet_address = $1", żeby łapać indeksy
+-- (LOWER(kolumna) = LOWER(...) ich nie używał).
+-- Idempotentna, można puścić ponownie. Na końcu CHECK-i pilnują, żeby
+-- nic mixed-case już nie wpadło.
+
+BEGIN;
+
+-- gex_pairs (PK pair_address): jeśli para jest w obu wersjach, zostaje lowercase
+DELETE FROM gex_pairs g
+USING gex_pairs d
+WHERE g.pair_address <> LOWER(g.pair_address)
+  AND d.pair_address = LOWER(g.pair_address);
+
+UPDATE gex_pairs
+SET pair_address = LOWER(pair_address),
+    item_address = LOWER(item_address),
+    vee_address  = LOWER(vee_address)
+WHERE pair_address <> LOWER(pair_address)
+   OR item_address <> LOWER(item_address)
+   OR vee_address  <> LOWER(vee_address);
+
+-- gex_snapshots (UNIQUE pair_address, ts)
+DELETE FROM gex_snapshots s
+USING gex_snapshots d
+WHERE s.pair_address <> LOWER(s.pair_address)
+  AND d.pair_address = LOWER(s.pair_address)
+  AND d.ts = s.ts;
+
+UPDATE gex_snapshots
+SET pair_address = LOWER(pair_address),
+    item_address = LOWER(item_address),
+    vee_address  = LOWER(vee_address)
+WHERE pair_address <> LOWER(pair_address)
+   OR item_address <> LOWER(item_address)
+   OR vee_address  <> LOWER(vee_address);
+
+-- trades_ronin (UNIQUE pair_address, tx_hash, log_index)
+DELETE FROM trades_ronin t
+USING trades_ronin d
+WHERE (t.pair_address <> LOWER(t.pair_address) OR t.tx_hash <> LOWER(t.tx_hash))
+  AND d.pair_address = LOWER(t.pair_address)
+  AND d.tx_hash = LOWER(t.tx_hash)
+  AND d.log_index = t.log_index
+  AND d.id <> t.id;
+
+UPDATE trades_ronin
+SET pair_address = LOWER(pair_address),
+    vee_address  = LOWER(vee_address),
+    tx_hash      = LOWER(tx_hash)
+WHERE pair_address <> LOWER(pair_address)
+   OR vee_address  <> LOWER(vee_address)
+   OR tx_hash      <> LOWER(tx_hash);
+
+-- lp_snapshots (bez unikalnych kluczy)
+UPDATE lp_snapshots
+SET wallet_address = LOWER(wallet_address),
+    pair_address   = LOWER(pair_address)
+WHERE wallet_address <> LOWER(wallet_address)
+   OR pair_address   <> LOWER(pair_address);
+
+-- lp_cache (PK pair_address): zostaje świeższy wpis
+DELETE FROM lp_cache c
+USING lp_cache d
+WHERE c.pair_address <> LOWER(c.pair_address)
+  AND d.pair_address = LOWER(c.pair_address)
+  AND d.ts >= c.ts;
+
+DELETE FROM lp_cache c
+USING lp_cache d
+WHERE d.pair_address <> LOWER(d.pair_address)
+  AND c.pair_address = LOWER(d.pair_address);
+
+UPDATE lp_cache
+SET pair_address = LOWER(pair_address)
+WHERE pair_address <> LOWER(pair_address);
+
+-- strażnicy: mixed-case przy INSERT/UPDATE kończy się błędem zamiast
+-- po cichu omijać indeksy
+ALTER TABLE gex_pairs     DROP CONSTRAINT IF EXISTS gex_pairs_pair_address_lower;
+ALTER TABLE gex_pairs     ADD  CONSTRAINT gex_pairs_pair_address_lower
+    CHECK (pair_address = LOWER(pair_address));
+ALTER TABLE gex_snapshots DROP CONSTRAINT IF EXISTS gex_snapshots_pair_address_lower;
+ALTER TABLE gex_snapshots ADD  CONSTRAINT gex_snapshots_pair_address_lower
+    CHECK (pair_address = LOWER(pair_address));
+ALTER TABLE trades_ronin  DROP CONSTRAINT IF EXISTS trades_ronin_pair_address_lower;
+ALTER TABLE trades_ronin  ADD  CONSTRAINT trades_ronin_pair_address_lower
+    CHECK (pair_address = LOWER(pair_address));
+ALTER TABLE lp_snapshots  DROP CONSTRAINT IF EXISTS lp_snapshots_address_lower;
+ALTER TABLE lp_snapshots  ADD  CONSTRAINT lp_snapshots_address_lower
+    CHECK (wallet_address = LOWER(wallet_address) AND pair_address = LOWER(pair_address));
+ALTER TABLE lp_cache      DROP CONSTRAINT IF EXISTS lp_cache_pair_address_lower;
+ALTER TABLE lp_cache      ADD  CONSTRAINT lp_cache_pair_address_lower
+    CHECK (pair_address = LOWER(pair_address));
+
+COMMIT;
+
+ANALYZE gex_pairs;
+ANALYZE gex_snapshots;
+ANALYZE trades_ronin;
+ANALYZE lp_snapshots;
+ANALYZE lp_cache;
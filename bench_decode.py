@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Mikrobenchmark dekodowania logów Swap w ingest_trades.py: syntetyczne logi
+(domyślnie 1M), porównanie starej ścieżki (w3.codec.decode + Decimal per log)
+z batchowym decode_swaps() (jeden bufor + int.from_bytes na memoryview).
+
+Bez RPC i bazy – meta par (token0/token1) jest podstawiona w PAIR_META_CACHE.
+
+Przykład:
+    python bench_decode.py --logs 1000000 --pairs 100
+"""
+import argparse
+import os
+import random
+import time
+from decimal import Decimal
+
+from web3 import Web3
+
+import ingest_trades
+
+VEE = "0x3536ed2548a5e2fc66a8448cc62394ff6d60159e"
+
+
+def make_pairs(n, rnd):
+    """
+    n syntetycznych par: (adres lowercase, vee, pair_id, vee jako token0?).
+    """
+    pairs = []
+    for i in range(n):
+        addr = "0x" + os.urandom(20).hex()
+        item = "0x" + os.urandom(20).hex()
+        vee_is_token0 = rnd.random() < 0.5
+        ingest_trades.PAIR_META_CACHE[addr] = {
+            "token0": VEE if vee_is_token0 else item,
+            "token1": item if vee_is_token0 else VEE,
+        }
+        pairs.append((addr, VEE, i + 1))
+    return pairs
+
+
+def make_logs(n, pairs, rnd):
+    checksum = [Web3.to_checksum_address(p) for p, _, _ in pairs]
+    logs = []
+    for i in range(n):
+        # jedna strona swapu niezerowa na wejściu, druga na wyjściu
+        amounts = [0, 0, 0, 0]
+        amounts[rnd.randrange(2)] = rnd.getrandbits(80)
+        amounts[2 + rnd.randrange(2)] = rnd.getrandbits(80)
+        logs.append(
+            {
+                "address": checksum[rnd.randrange(len(checksum))],
+                "blockNumber": 40_000_000 + i // 4,
+                "logIndex": i % 4,
+                "transactionHash": rnd.getrandbits(256).to_bytes(32, "big"),
+                "data": b"".join(a.to_bytes(32, "big") for a in amounts),
+            }
+        )
+    return logs
+
+
+def reference_decode(logs, ctx):
+    """
+    Stara ścieżka (do porównania): dekodowanie ABI i Decimal dla każdego logu.
+    """
+    codec = Web3().codec
+    swaps = []
+    for log in logs:
+        pair_addr = log["address"].lower()
+        vee_addr = ctx["pair_to_vee"].get(pair_addr)
+        if not vee_addr:
+            continue
+        meta = ingest_trades.get_pair_meta(pair_addr)
+        vee_is_token0 = meta["token0"] == vee_addr
+        a0in, a1in, a0out, a1out = codec.decode(
+            ["uint256", "uint256", "uint256", "uint256"], log["data"]
+        )
+        raw = a0in + a0out if vee_is_token0 else a1in + a1out
+        if raw <= 0:
+            continue
+        vee_amount = Decimal(raw) / Decimal(2) / (Decimal(10) ** 18)
+        swaps.append(
+            (
+                int(log["blockNumber"]),
+                ctx["pair_to_id"][pair_addr],
+                int(log["logIndex"]),
+                bytes(log["transactionHash"]),
+                int(vee_amount * 2 * 10**18),
+            )
+        )
+    return swaps
+
+
+def make_ctx(pairs):
+    return {
+        "pairs": pairs,
+        "pair_to_vee": {p: v for p, v, _ in pairs},
+        "pair_to_id": {p: pid for p, _, pid in pairs},
+        "addresses": [],
+        "legs": {},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logs", type=int, default=1_000_000)
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument(
+        "--reference-logs",
+        type=int,
+        default=100_000,
+        help="na ilu logach mierzyć starą ścieżkę (wynik przeskalowany)",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    pairs = make_pairs(args.pairs, rnd)
+    t0 = time.perf_counter()
+    logs = make_logs(args.logs, pairs, rnd)
+    print(f"Wygenerowane {len(logs)} logów w {time.perf_counter() - t0:.1f}s")
+
+    ctx = make_ctx(pairs)
+    t0 = time.perf_counter()
+    swaps = ingest_trades.decode_swaps(logs, ctx)
+    batch_s = time.perf_counter() - t0
+    print(
+        f"decode_swaps:     {len(swaps)} swapów w {batch_s:.2f}s "
+        f"({len(logs) / batch_s:,.0f} logów/s)"
+    )
+
+    ref_logs = logs[: args.reference_logs]
+    t0 = time.perf_counter()
+    ref = reference_decode(ref_logs, make_ctx(pairs))
+    ref_s = time.perf_counter() - t0
+    ref_rate = len(ref_logs) / ref_s
+    print(
+        f"stara ścieżka:    {len(ref)} swapów z {len(ref_logs)} logów w {ref_s:.2f}s "
+        f"({ref_rate:,.0f} logów/s, ~{len(logs) / ref_rate:.1f}s na {len(logs)})"
+    )
+    print(f"przyspieszenie:   x{(len(logs) / ref_rate) / batch_s:.1f}")
+
+    if ref != swaps[: len(ref)]:
+        print("[FAIL] wyniki różnią się od starej ścieżki")
+        raise SystemExit(1)
+    print("[OK]   wyniki zgodne ze starą ścieżką")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark analityki LP (lp_analytics.analyze) dla dashboardu wielu
+portfeli: syntetyczne pozycje (domyślnie 100 portfeli × 100 par),
+porównanie starej ścieżki z server.py (wiersze numeric -> Decimal -> dict,
+pętla per portfel i pozycja, calc_il na floatach, await ceny VEE per para,
+target_weight przez "r in positive") z /api/lp/il/bulk (wiersze float8,
+kolumny, jeden przebieg analyze() po wszystkich portfelach).
+
+Bez bazy i API – cena VEE/USD to stała (w starej ścieżce zwracana przez
+korutynę, jak get_vee_usd_price z ciepłym cachem).
+
+Przykład:
+    python bench_lp_analytics.py --wallets 100 --pairs 100
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import lp_analytics
+
+MIN_DAYS = 3.0
+VEE_USD = 0.0123
+
+
+def make_rows(n_wallets, n_pairs, rnd):
+    """
+    Wiersze lp_positions jak z bazy (kolejność lp_analytics.POSITION_COLUMNS,
+    numeric jako Decimal): każdy portfel w każdej parze, wejścia i ostatni
+    snapshot w pełnych godzinach rund ingest_lp_snapshots.
+    """
+    now = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    pairs = [("0x" + os.urandom(20).hex(), f"ITEM{i}") for i in range(n_pairs)]
+    rows = []
+    for _ in range(n_wallets):
+        wallet = "0x" + os.urandom(20).hex()
+        for pair, item in pairs:
+            entry_price = rnd.uniform(0.1, 100.0)
+            price = entry_price * rnd.uniform(0.3, 3.0)
+            entry_item = rnd.uniform(1.0, 1000.0)
+            entry_vee = entry_item * entry_price
+            # pozycja na krzywej x*y=k przy nowej cenie
+            k_ratio = (entry_price / price) ** 0.5
+            lp_apr = rnd.uniform(-5.0, 80.0) if rnd.random() < 0.9 else None
+            rows.append(
+                (
+                    wallet,
+                    pair,
+                    item,
+                    now - timedelta(hours=rnd.randint(12, 1440)),
+                    num(entry_vee),
+                    num(entry_item),
+                    now,
+                    num(price),
+                    num(entry_vee / k_ratio),
+                    num(entry_item * k_ratio),
+                    num(lp_apr),
+                )
+            )
+    return rows
+
+
+def num(x):
+    return Decimal(f"{x:.18f}") if x is not None else None
+
+
+def float_rows(rows):
+    """
+    Te same wiersze jak z query_lp_positions_bulk (numeric::float8 w SELECT).
+    """
+    return [
+        tuple(float(v) if isinstance(v, Decimal) else v for v in r) for r in rows
+    ]
+
+
+def reference_rows(rows):
+    """
+    Stara ścieżka: dict per wiersz + float dla numeric (lp_position_rows).
+    """
+    out = []
+    for r in rows:
+        d = dict(zip(lp_analytics.POSITION_COLUMNS, r))
+        for k in ["entry_user_vee", "entry_user_item", "price_vee", "user_vee", "user_item", "lp_apr"]:
+            if d.get(k) is not None:
+                d[k] = float(d[k])
+        out.append(d)
+    return out
+
+
+def calc_il(entry_vee, entry_item, cur_vee, cur_item, price_vee):
+    if price_vee is None:
+        return 0.0, 0.0, 0.0, 0.0
+    value_hodl = entry_vee + entry_item * price_vee
+    value_lp = cur_vee + cur_item * price_vee
+    if value_hodl <= 0:
+        return 0.0, 0.0, value_hodl, value_lp
+    il = value_lp - value_hodl
+    return il, (il / value_hodl) * 100.0, value_hodl, value_lp
+
+
+async def get_vee_usd_price():
+    return VEE_USD
+
+
+async def reference_wallet(positions):
+    """
+    Stara ścieżka (do porównania): compute_lp_il_for_wallet sprzed lp_analytics.
+    """
+    results = []
+    for current in positions:
+        entry_vee = current.get("entry_user_vee") or 0.0
+        entry_item = current.get("entry_user_item") or 0.0
+        cur_vee = current.get("user_vee") or 0.0
+        cur_item = current.get("user_item") or 0.0
+        price_now = current.get("price_vee") or 0.0
+        il_vee, il_pct, value_hodl, value_lp = calc_il(
+            entry_vee, entry_item, cur_vee, cur_item, price_now
+        )
+        delta_days = max(
+            (current["last_ts"] - current["entry_ts"]).total_seconds() / 86400.0, 0.0
+        )
+        if delta_days <= 0 or delta_days < MIN_DAYS:
+            il_annualized_pct = None
+        else:
+            il_annualized_pct = il_pct * (365.0 / max(delta_days, 1e-6))
+
+        lp_apr = current.get("lp_apr")
+        net_effective_pct = None
+        if lp_apr is not None and il_annualized_pct is not None:
+            net_effective_pct = lp_apr + il_annualized_pct
+        elif lp_apr is not None:
+            net_effective_pct = lp_apr
+
+        vee_usd = await get_vee_usd_price()
+        results.append(
+            {
+                "pair_address": current["pair_address"],
+                "item_name": current.get("item_name"),
+                "entry_ts": current["entry_ts"].isoformat(),
+                "current_ts": current["last_ts"].isoformat(),
+                "days_in_position": delta_days,
+                "entry_user_vee": entry_vee,
+                "entry_user_item": entry_item,
+                "current_user_vee": cur_vee,
+                "current_user_item": cur_item,
+                "price_vee_now": price_now,
+                "value_hodl_vee": value_hodl,
+                "value_lp_vee": value_lp,
+                "il_vee": il_vee,
+                "il_pct": il_pct,
+                "il_annualized_pct": il_annualized_pct,
+                "lp_apr": lp_apr,
+                "net_effective_pct": net_effective_pct,
+                "il_usd": il_vee * vee_usd,
+                "value_hodl_usd": value_hodl * vee_usd,
+                "value_lp_usd": value_lp * vee_usd,
+            }
+        )
+
+    positive = [
+        r
+        for r in results
+        if r["net_effective_pct"] is not None and r["net_effective_pct"] > 0
+    ]
+    total_score = sum(r["net_effective_pct"] for r in positive) if positive else 0.0
+    for r in results:
+        if total_score > 0 and r in positive:
+            r["target_weight"] = r["net_effective_pct"] / total_score
+        else:
+            r["target_weight"] = 0.0
+
+    results.sort(
+        key=lambda r: (
+            r["net_effective_pct"] is None,
+            -(r["net_effective_pct"] or -1e9),
+        )
+    )
+    return results
+
+
+async def reference(rows):
+    by_wallet = {}
+    for p in reference_rows(rows):
+        by_wallet.setdefault(p["wallet_address"], []).append(p)
+    return {w: await reference_wallet(ps) for w, ps in by_wallet.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wallets", type=int, default=100)
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5, help="ile powtórzeń (bierzemy najlepszy czas)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    rows = make_rows(args.wallets, args.pairs, rnd)
+    rows_f8 = float_rows(rows)
+    n = len(rows)
+    print(f"Pozycje: {args.wallets} portfeli × {args.pairs} par = {n}")
+
+    ref_s = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        ref = asyncio.run(reference(rows))
+        ref_s = min(ref_s, time.perf_counter() - t0)
+    print(f"stara ścieżka:    {ref_s * 1000:.1f} ms ({n / ref_s:,.0f} pozycji/s)")
+
+    batch_s = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        out = lp_analytics.analyze(
+            lp_analytics.rows_to_columns(rows_f8), VEE_USD, None, MIN_DAYS
+        )
+        batch_s = min(batch_s, time.perf_counter() - t0)
+    print(f"lp_analytics:     {batch_s * 1000:.1f} ms ({n / batch_s:,.0f} pozycji/s)")
+    print(f"przyspieszenie:   x{ref_s / batch_s:.1f}")
+
+    if out != ref:
+        print("[FAIL] wyniki różnią się od starej ścieżki")
+        raise SystemExit(1)
+    print("[OK]   wyniki zgodne ze starą ścieżką")
+
+
+if __name__ == "__main__":
+    main()
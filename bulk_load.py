@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Bulk loader dla ingestów: wiersze idą przez COPY ... FROM STDIN (format
+binary) do tymczasowej tabeli stage, a potem jednym
+INSERT ... SELECT ... ON CONFLICT DO NOTHING do tabeli docelowej.
+
+Zamiast execute_batch (jeden INSERT per wiersz po stronie serwera) mamy
+jeden COPY + jeden INSERT na commit. Kiedy commitować, decyduje wołający
+(due() – liczba wierszy albo czas od ostatniego commitu); loader liczy
+wiersze/s.
+
+    loader = BulkLoader("trades_ronin", TRADES_COLUMNS, commit_rows=50000)
+    loader.add(rows)
+    if loader.due():
+        inserted = loader.flush(cur)
+        conn.commit()
+        loader.committed()
+"""
+import io
+import math
+import struct
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+NUMERIC_POS = 0x0000
+NUMERIC_NEG = 0x4000
+NUMERIC_NAN = 0xC000
+
+
+def encode_int8(value):
+    return struct.pack("!q", value)
+
+
+def encode_int4(value):
+    return struct.pack("!i", value)
+
+
+def encode_float8(value):
+    return struct.pack("!d", value)
+
+
+def encode_bool(value):
+    return b"\x01" if value else b"\x00"
+
+
+def encode_text(value):
+    return str(value).encode("utf-8")
+
+
+def encode_bytea(value):
+    return bytes(value)
+
+
+def encode_timestamptz(value):
+    """
+    Mikrosekundy od 2000-01-01 UTC (naiwny datetime traktujemy jako UTC).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - PG_EPOCH
+    return struct.pack(
+        "!q", (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    )
+
+
+def _pack_numeric(groups, weight, sign, dscale):
+    # bez zer na końcu (PG i tak je obcina, dscale trzyma skalę)
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    return struct.pack(f"!hhHH{len(groups)}H", len(groups), weight, sign, dscale, *groups)
+
+
+def encode_numeric(value):
+    """
+    numeric w formacie binarnym PG: cyfry w bazie 10000, weight = pozycja
+    pierwszej grupy względem przecinka, dscale = liczba cyfr po przecinku.
+    int (np. vee_wei) bez przechodzenia przez Decimal, float przez repr.
+    """
+    if isinstance(value, int):
+        sign = NUMERIC_NEG if value < 0 else NUMERIC_POS
+        n = abs(value)
+        groups = []
+        while n:
+            n, r = divmod(n, 10000)
+            groups.append(r)
+        groups.reverse()
+        return _pack_numeric(groups, len(groups) - 1, sign, 0)
+
+    if isinstance(value, float):
+        if math.isnan(value):
+            return _pack_numeric([], 0, NUMERIC_NAN, 0)
+        value = Decimal(repr(value))
+    else:
+        value = Decimal(value)
+    if value.is_nan():
+        return _pack_numeric([], 0, NUMERIC_NAN, 0)
+    if value.is_infinite():
+        raise ValueError("numeric: nieskończoność nie jest obsługiwana")
+
+    t = value.as_tuple()
+    digits = "".join(map(str, t.digits))
+    exp = t.exponent
+    dscale = max(0, -exp)
+    if exp > 0:
+        digits += "0" * exp
+        exp = 0
+
+    point = len(digits) + exp  # ile cyfr przed przecinkiem
+    if point >= 0:
+        int_part, frac_part = digits[:point], digits[point:]
+    else:
+        int_part, frac_part = "", "0" * (-point) + digits
+    int_part = int_part.lstrip("0")
+
+    int_part = int_part.rjust(-(-len(int_part) // 4) * 4, "0")
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, "0")
+    groups = [int(int_part[i : i + 4]) for i in range(0, len(int_part), 4)]
+    groups += [int(frac_part[i : i + 4]) for i in range(0, len(frac_part), 4)]
+    weight = len(int_part) // 4 - 1
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+
+    sign = NUMERIC_NEG if t.sign else NUMERIC_POS
+    return _pack_numeric(groups, weight, sign, dscale)
+
+
+ENCODERS = {
+    "int8": encode_int8,
+    "int4": encode_int4,
+    "float8": encode_float8,
+    "bool": encode_bool,
+    "text": encode_text,
+    "bytea": encode_bytea,
+    "timestamptz": encode_timestamptz,
+    "numeric": encode_numeric,
+}
+
+
+def copy_binary_payload(rows, types):
+    """
+    Strumień COPY BINARY: nagłówek, krotki (int16 liczba pól, potem pola
+    jako int32 długość + bajty, -1 = NULL), trailer -1.
+    """
+    encoders = [ENCODERS[t] for t in types]
+    n_fields = struct.pack("!h", len(types))
+    null = struct.pack("!i", -1)
+    pack_len = struct.Struct("!i").pack
+
+    out = [COPY_SIGNATURE, struct.pack("!ii", 0, 0)]
+    for row in rows:
+        out.append(n_fields)
+        for enc, value in zip(encoders, row):
+            if value is None:
+                out.append(null)
+            else:
+                data = enc(value)
+                out.append(pack_len(len(data)))
+                out.append(data)
+    out.append(struct.pack("!h", -1))
+    return b"".join(out)
+
+
+class BulkLoader:
+    """
+    Bufor wierszy dla jednej tabeli. columns = [(kolumna, typ)], typ z ENCODERS.
+    commit_rows / commit_seconds – próg dla due() (0 = nie dotyczy).
+    """
+
+    def __init__(self, table, columns, commit_rows=0, commit_seconds=0, conflict="ON CONFLICT DO NOTHING"):
+        self.table = table
+        self.stage = f"_stage_{table}"
+        self.names = [c for c, _ in columns]
+        self.types = [t for _, t in columns]
+        self.commit_rows = commit_rows
+        self.commit_seconds = commit_seconds
+        self.conflict = conflict
+
+        self.pending = []
+        self.last_commit = time.monotonic()
+        self.started = time.monotonic()
+        self.rows_total = 0
+        self.inserted_total = 0
+
+    def add(self, rows):
+        self.pending.extend(rows)
+
+    def due(self) -> bool:
+        if self.commit_rows and len(self.pending) >= self.commit_rows:
+            return True
+        if self.commit_seconds and time.monotonic() - self.last_commit >= self.commit_seconds:
+            return True
+        return False
+
+    def flush(self, cur) -> int:
+        """
+        COPY bufora do stage + merge do tabeli docelowej (w bieżącej
+        transakcji – commit robi wołający). Zwraca liczbę nowych wierszy.
+        """
+        if not self.pending:
+            return 0
+        cols = ", ".join(self.names)
+        cur.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {self.stage} AS
+            SELECT {cols} FROM {self.table} WITH NO DATA
+            """
+        )
+        cur.copy_expert(
+            f"COPY {self.stage} ({cols}) FROM STDIN WITH (FORMAT binary)",
+            io.BytesIO(copy_binary_payload(self.pending, self.types)),
+        )
+        cur.execute(
+            f"""
+            INSERT INTO {self.table} ({cols})
+            SELECT {cols} FROM {self.stage}
+            {self.conflict}
+            """
+        )
+        inserted = cur.rowcount
+        cur.execute(f"TRUNCATE {self.stage}")
+
+        self.rows_total += len(self.pending)
+        self.inserted_total += inserted
+        return inserted
+
+    def committed(self):
+        """
+        Po commicie: czyścimy bufor i zegar commitów.
+        """
+        self.pending = []
+        self.last_commit = time.monotonic()
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.rows_total / elapsed if elapsed > 0 else 0.0
+
+    def report(self, prefix="[BULK]"):
+        print(
+            f"{prefix} {self.table}: {self.rows_total} wierszy "
+            f"({self.inserted_total} nowych), {self.rate():,.0f} wierszy/s"
+        )
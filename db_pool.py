@@ -0,0 +1,188 @@
+"""
+Async pool połączeń PostgreSQL (asyncpg) dla server.py.
+
+- min/max rozmiar, timeout na pobranie połączenia,
+- health check (SELECT 1) dla połączeń, które długo leżały w puli,
+- statystyki (w użyciu, oczekiwania, czas oczekiwania) pod /api/db/pool.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import asyncpg
+
+
+class PoolTimeout(Exception):
+    """Nie udało się pobrać połączenia z puli w zadanym czasie."""
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        db_params: dict,
+        minconn: int = 1,
+        maxconn: int = 10,
+        timeout: float = 5.0,
+        check_idle: float = 30.0,
+    ):
+        self.db_params = dict(db_params)
+        self.minconn = max(int(minconn), 0)
+        self.maxconn = max(int(maxconn), 1, self.minconn)
+        self.timeout = float(timeout)
+        # po ilu sekundach bezczynności połączenie jest sprawdzane SELECT 1
+        self.check_idle = float(check_idle)
+
+        self._pool = None
+        self._open_lock = asyncio.Lock()
+        self._last_used = {}  # server pid -> monotonic()
+        self._in_use = 0
+        # kolejka FIFO do połączeń: pool asyncpg oddaje wolne połączenia
+        # bez kolejności (część requestów czekała wielokrotnie dłużej niż
+        # średnio), semafor wpuszcza czekających po kolei
+        self._slots = asyncio.Semaphore(self.maxconn)
+
+        self._stats = {
+            "acquired": 0,
+            "waits": 0,
+            "wait_time_total_s": 0.0,
+            "wait_time_max_s": 0.0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+        }
+
+    def _connect_kwargs(self) -> dict:
+        port = self.db_params.get("port")
+        return {
+            "host": self.db_params.get("host"),
+            "port": int(port) if port else None,
+            "database": self.db_params.get("dbname"),
+            "user": self.db_params.get("user"),
+            "password": self.db_params.get("password"),
+        }
+
+    async def open(self):
+        async with self._open_lock:
+            if self._pool is not None:
+                return
+            self._pool = await asyncpg.create_pool(
+                **self._connect_kwargs(),
+                min_size=self.minconn,
+                max_size=self.maxconn,
+            )
+
+    async def listen(self, channel: str, callback):
+        """
+        Osobne (spoza puli) połączenie z LISTEN na kanale.
+        callback(connection, pid, channel, payload) – jak w asyncpg.
+        Zwraca połączenie, żeby wołający mógł sprawdzać is_closed() / zamknąć.
+        """
+        conn = await asyncpg.connect(**self._connect_kwargs())
+        await conn.add_listener(channel, callback)
+        return conn
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def _healthy(self, conn) -> bool:
+        last_used = self._last_used.get(conn.get_server_pid())
+        if last_used is not None and time.monotonic() - last_used < self.check_idle:
+            return True
+        try:
+            await conn.fetchval("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    async def _acquire(self):
+        if self._pool is None:
+            await self.open()
+
+        started = time.monotonic()
+        deadline = started + self.timeout
+        # czekamy, jeśli wszystkie maxconn połączeń są w użyciu
+        waited = self._slots.locked()
+        if waited:
+            self._stats["waits"] += 1
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._raise_timeout(started)
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    conn = await self._pool.acquire(timeout=remaining)
+                except asyncio.TimeoutError:
+                    self._raise_timeout(started)
+
+                if await self._healthy(conn):
+                    break
+
+                # zerwane połączenie: zabijamy, pool sam otworzy nowe
+                self._stats["health_check_failures"] += 1
+                self._last_used.pop(conn.get_server_pid(), None)
+                conn.terminate()
+                await self._pool.release(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use += 1
+        wait_s = time.monotonic() - started
+        self._stats["acquired"] += 1
+        if waited:
+            self._stats["wait_time_total_s"] += wait_s
+            self._stats["wait_time_max_s"] = max(self._stats["wait_time_max_s"], wait_s)
+        return conn
+
+    def _raise_timeout(self, started):
+        self._stats["timeouts"] += 1
+        self._stats["wait_time_total_s"] += time.monotonic() - started
+        raise PoolTimeout(
+            f"no free DB connection after {self.timeout:.1f}s "
+            f"(max={self.maxconn})"
+        )
+
+    async def _release(self, conn):
+        if not conn.is_closed():
+            self._last_used[conn.get_server_pid()] = time.monotonic()
+        try:
+            await self._pool.release(conn)
+        finally:
+            self._in_use -= 1
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        async with pool.connection() as conn: ...
+        asyncpg sam resetuje stan połączenia przy oddaniu do puli.
+        """
+        conn = await self._acquire()
+        try:
+            yield conn
+        finally:
+            await self._release(conn)
+
+    def stats(self) -> dict:
+        out = dict(self._stats)
+        out.update(
+            {
+                "min": self.minconn,
+                "max": self.maxconn,
+                "total": self._pool.get_size() if self._pool else 0,
+                "in_use": self._in_use,
+                "idle": self._pool.get_idle_size() if self._pool else 0,
+            }
+        )
+        if out["waits"]:
+            out["wait_time_avg_s"] = out["wait_time_total_s"] / out["waits"]
+        else:
+            out["wait_time_avg_s"] = 0.0
+        return out
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Kontrola planów zapytań: puszcza EXPLAIN na gorących odczytach z server.py
+i sprawdza, że idą po indeksach (a nie Seq Scan po całej tabeli).
+
+Zapytania to stałe SQL_* z server.py (nie kopie), więc sprawdzamy
+dokładnie to, co wykonuje API. Pilnuje regresji typu
+LOWER(kolumna) = LOWER(...), który po cichu wyłącza indeksy.
+enable_seqscan = off, żeby na małej bazie planner i tak nie wybrał
+seq scana z powodu kosztów – jeśli indeksu nie da się użyć, Seq Scan
+zostanie w planie.
+
+Dla tabel partycjonowanych (trades_ronin, gex_snapshots) akceptujemy skany
+partycji i ich indeksów (dzieci indeksu z rodzica).
+
+Exit code 1, jeśli któreś zapytanie nie trafia w oczekiwany indeks.
+
+    python explain_check.py
+"""
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import psycopg2
+from dotenv import load_dotenv
+
+import server
+
+load_dotenv()
+
+DB_PARAMS = {
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT"),
+    "dbname": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASS"),
+}
+
+WALLET = os.getenv("LP_WALLET", "0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0").lower()
+
+# (nazwa, tabela, oczekiwany indeks, SQL z server.py, parametry $1..$n)
+# SQL to te same stałe, których używa API – EXPLAIN idzie przez
+# PREPARE / EXECUTE, więc parametry asyncpg ($1) zostają bez zmian.
+CHECKS = [
+    (
+        "lp_latest",
+        "lp_snapshots",
+        "lp_snapshots_wallet_pair_ts_idx",
+        server.SQL_LP_LATEST,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "lp_positions_asof",
+        "lp_snapshots",
+        "lp_snapshots_wallet_pair_ts_idx",
+        server.SQL_LP_POSITIONS_ASOF,
+        lambda p: (p["wallet"], p["now"]),
+    ),
+    (
+        "lp_cache_wallet",
+        "lp_cache",
+        "lp_cache_pkey",
+        server.SQL_LP_CACHE,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "lp_cache_wallet_registered",
+        "lp_wallets",
+        "lp_wallets_pkey",
+        server.SQL_LP_CACHE,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "lp_positions",
+        "lp_positions",
+        "lp_positions_open_idx",
+        server.SQL_LP_POSITIONS_OPEN,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "lp_positions_version",
+        "lp_positions",
+        "lp_positions_pkey",
+        server.SQL_LP_POSITIONS_VERSION,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "lp_positions_bulk",
+        "lp_positions",
+        "lp_positions_open_idx",
+        server.SQL_LP_POSITIONS_BULK,
+        lambda p: ([p["wallet"]],),
+    ),
+    (
+        "lp_ledger",
+        "lp_ledger",
+        "lp_ledger_pkey",
+        server.SQL_LP_LEDGER,
+        lambda p: (p["wallet"],),
+    ),
+    (
+        "history_trades",
+        "trades_ronin",
+        "trades_ronin_pair_ts_idx",
+        server.SQL_PAIR_HISTORY_RAW,
+        lambda p: (p["pair"], "5 minutes", p["now"] - timedelta(days=1), p["now"]),
+    ),
+    (
+        "history_snapshots",
+        "gex_snapshots",
+        "gex_snapshots_pair_ts_uniq",
+        server.SQL_PAIR_HISTORY_RAW,
+        lambda p: (p["pair"], "5 minutes", p["now"] - timedelta(days=1), p["now"]),
+    ),
+    (
+        "market_at_block",
+        "gex_snapshots",
+        "gex_snapshots_pair_block_idx",
+        server.SQL_MARKET_AT_BLOCK,
+        lambda p: (p["block"],),
+    ),
+    (
+        "history_hourly",
+        "pair_hourly",
+        "pair_hourly_pkey",
+        server.SQL_PAIR_HISTORY_HOURLY,
+        lambda p: (p["pair"], "1 hour", p["now"] - timedelta(days=30), p["now"]),
+    ),
+]
+
+INDEX_NODES = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+
+def walk(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def with_children(cur, relation):
+    """
+    Nazwa relacji + nazwy jej partycji (dla indeksu: indeksy na partycjach).
+    """
+    cur.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        (relation,),
+    )
+    return {relation} | {r[0] for r in cur.fetchall()}
+
+
+def check_plan(plan, tables, indexes):
+    """
+    Zwraca None jeśli OK, albo opis problemu.
+    """
+    nodes = list(walk(plan))
+    for node in nodes:
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in tables:
+            return f"Seq Scan on {node['Relation Name']}"
+    for node in nodes:
+        if node.get("Node Type") in INDEX_NODES and node.get("Index Name") in indexes:
+            return None
+    return "index not used"
+
+
+def main():
+    conn = psycopg2.connect(**DB_PARAMS)
+    cur = conn.cursor()
+    cur.execute("SELECT pair_address FROM gex_pairs ORDER BY pair_address LIMIT 1")
+    row = cur.fetchone()
+    params = {
+        "pair": row[0] if row else "0x0",
+        "wallet": WALLET,
+        "block": 2**62,
+        "now": datetime.now(timezone.utc),
+    }
+
+    cur.execute("SET enable_seqscan = off")
+
+    failed = 0
+    for name, table, index, sql, args in CHECKS:
+        values = args(params)
+        cur.execute("PREPARE explain_check AS " + sql.strip().rstrip(";"))
+        cur.execute(
+            "EXPLAIN (FORMAT JSON) EXECUTE explain_check ("
+            + ", ".join(["%s"] * len(values))
+            + ")",
+            values,
+        )
+        plan = cur.fetchone()[0]
+        cur.execute("DEALLOCATE explain_check")
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        problem = check_plan(
+            plan[0]["Plan"], with_children(cur, table), with_children(cur, index)
+        )
+        if problem:
+            failed += 1
+            print(f"[FAIL] {name}: {problem}")
+        else:
+            print(f"[OK]   {name}: {index}")
+
+    cur.close()
+    conn.close()
+
+    if failed:
+        print(f"{failed} zapytań nie używa indeksów.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -31,10 +31,12 @@ async function loadItem() {
   }
 
   // snapshot + LP z tego samego setupu co index
-  const [baseData, walletData, historyData] = await Promise.all([
+  // historia: cena w bucketach 1h (30 dni), wolumen w bucketach 1d
+  const [baseData, walletData, priceHistory, volumeHistory] = await Promise.all([
     fetch(API_URL_BASE).then((r) => r.json()),
     fetch(API_URL_WALLET).then((r) => r.json()),
-    fetch(`${API_URL_HISTORY}/${pair}`).then((r) => r.json()),
+    fetch(`${API_URL_HISTORY}/${pair}?resolution=1h`).then((r) => r.json()),
+    fetch(`${API_URL_HISTORY}/${pair}?resolution=1d`).then((r) => r.json()),
   ]);
 
   const row =
@@ -97,18 +99,20 @@ async function loadItem() {
     tbody.appendChild(tr);
   });
 
-  buildCharts(historyData);
+  buildCharts(priceHistory, volumeHistory);
 }
 
-function buildCharts(history) {
-  const snaps = history.snapshots || [];
-  const vols = history.daily_volume || [];
+function buildCharts(priceHistory, volumeHistory) {
+  const snaps = (priceHistory.buckets || []).filter(
+    (b) => b.price_close != null
+  );
+  const vols = volumeHistory.buckets || [];
 
   const priceCtx = document.getElementById("price-chart").getContext("2d");
   const volCtx = document.getElementById("volume-chart").getContext("2d");
 
   const priceLabels = snaps.map((s) => s.ts);
-  const priceData = snaps.map((s) => s.price_vee || 0);
+  const priceData = snaps.map((s) => s.price_close);
 
   new Chart(priceCtx, {
     type: "line",
@@ -141,7 +145,7 @@ function buildCharts(history) {
     },
   });
 
-  const volLabels = vols.map((v) => v.day);
+  const volLabels = vols.map((v) => v.ts.slice(0, 10));
   const volData = vols.map((v) => v.volume_vee || 0);
 
   new Chart(volCtx, {
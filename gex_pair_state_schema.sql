@@ -0,0 +1,70 @@
+-- gex_pair_state_schema.sql
+-- Aktualny stan każdej pary (1 wiersz na parę) – zamiast odtwarzania
+-- "ostatniego snapshotu" z historii gex_snapshots (DISTINCT ON / MAX(ts)).
+-- Utrzymywane przez ingest_pairs.py (w tej samej transakcji co insert
+-- snapshotów) i ingest_trades.py (last_trade_block).
+-- price_24h_ago / price_7d_ago = ostatni close z pair_hourly sprzed 24h / 7d
+-- względem ts snapshotu.
+
+CREATE TABLE IF NOT EXISTS gex_pair_state (
+    pair_address      text PRIMARY KEY,
+    ts                timestamptz,
+    price_vee         numeric(38,18),
+    reserve_vee       numeric(38,18),
+    reserve_item      numeric(38,18),
+    price_24h_ago     numeric(38,18),
+    price_7d_ago      numeric(38,18),
+    last_trade_block  bigint
+);
+
+-- Jednorazowy backfill (idempotentny, można puścić ponownie).
+
+INSERT INTO gex_pair_state (
+    pair_address, ts, price_vee, reserve_vee, reserve_item,
+    price_24h_ago, price_7d_ago
+)
+SELECT
+    s.pair_address,
+    s.ts,
+    s.price_vee,
+    s.reserve_vee,
+    s.reserve_item,
+    (
+        SELECT h.price_close
+        FROM pair_hourly h
+        WHERE h.pair_address = s.pair_address
+          AND h.bucket <= s.ts - INTERVAL '24 hours'
+          AND h.price_close IS NOT NULL
+        ORDER BY h.bucket DESC
+        LIMIT 1
+    ),
+    (
+        SELECT h.price_close
+        FROM pair_hourly h
+        WHERE h.pair_address = s.pair_address
+          AND h.bucket <= s.ts - INTERVAL '7 days'
+          AND h.price_close IS NOT NULL
+        ORDER BY h.bucket DESC
+        LIMIT 1
+    )
+FROM (
+    SELECT DISTINCT ON (pair_address)
+        pair_address, ts, price_vee, reserve_vee, reserve_item
+    FROM gex_snapshots
+    ORDER BY pair_address, ts DESC
+) s
+ON CONFLICT (pair_address) DO UPDATE SET
+    ts            = EXCLUDED.ts,
+    price_vee     = EXCLUDED.price_vee,
+    reserve_vee   = EXCLUDED.reserve_vee,
+    reserve_item  = EXCLUDED.reserve_item,
+    price_24h_ago = EXCLUDED.price_24h_ago,
+    price_7d_ago  = EXCLUDED.price_7d_ago;
+
+INSERT INTO gex_pair_state (pair_address, last_trade_block)
+SELECT g.pair_address, MAX(t.block_number)
+FROM trades_ronin t
+JOIN gex_pairs g ON g.pair_id = t.pair_id
+GROUP BY g.pair_address
+ON CONFLICT (pair_address) DO UPDATE SET
+    last_trade_block = EXCLUDED.last_trade_block;
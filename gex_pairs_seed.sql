@@ -1,103 +1,103 @@
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf2a9DdD2E20c5Fd34ddeFD6E4166a9055fDa903a', '$PEPEDROX', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xAaB423828dd5E7b154D65977B2333cB2037146ab', 'Blessed Axe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x922F93Fe06069c2d2Be094F432371CaBA55b08A1', 'Bronze Ingot', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa12D27eF52959a6f2434E8c803fF61c49C6Afb72', 'Bronze Mace', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xD781145aDbF3DAdf800DD31716EAb77b209Db8Cd', 'Bronze Mask', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xDD188725C551809A0FD5541Df5C46d7bedfac62e', 'Bronze Pants', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7F742dcDC8ba91718196a47a61C82e605554B6d6', 'Bronze Pickaxe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x42A2a62e76842adcCA5C814A0BC43f61D06bcC2a', 'Bronze Shield', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xdDe65Fe4aAb59cb53aF3E7cb3b422dF0bcF47C24', 'Bronze Top', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4B951077768e8dA74Fe904E8806d1c52FD0E574a', 'Bucket of Water', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x18207a7a55ff9Ed14a7c5E648A4c0bAAE40c1c2A', 'Charm of Earth', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xA2873c20340f44b6a490B7547fa305Fd356c468D', 'Coal Ore', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x02dABCb519A80aC76d846E816364Eb2281d49Beb', 'Common Axe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xF43c6eD7a1Bd10fC1175F69D3984f69a3dB0f534', 'Compost', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x6f3F8564300BaFcbff097E85e2D9599037df0Cb2', 'Copper Ore', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x677857D64f175AD814fb55ca819Da397E754d915', 'Crimsoncap', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf09E8A93FFB8d62c6030017DE388c0736C4CFD81', 'Crimsoncap Potion Mix', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xb4e031B2992d65b2Ac69adc5C8bCD2Dd4766B939', 'Crimsoncap Spore', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xBe69f6F48bc30403F6eE096A288537558dE26986', 'Cure Sickness Potion', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xF22Ff82d4929e3c5FFE65557C23bcb8B5422d705', 'Elder Wood Plank', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x93014497bC23427F1aC38824c6b0CeAcbeA2f9d5', 'Elder Wood Rod', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2A616a726114Fba13A0123673C94060A06f6B1aF', 'Elder Wood Trunk', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x3E58bC4390CAe647f1E342144A8D14C21B3990D4', 'Empty Soul', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xED220303782Ce8b2314129827f93E2961458F37b', 'Empty Vial', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbF20B788ed5834a2a8254Fa9794f8e5c8B1Cfed3', 'Energy Potion', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x3cB6e162469Eb167D22583eea7927843bFaf3e47', 'Essence of Earth', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x6c6EE2e60232816323aaaC79a2FF76534E22322D', 'Essence of Fire', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa57615711A9518A0CEa01fB389Af7DE2f86fdEF4', 'Essence of Water', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xB8d13f34Da2a1B826EdB425a1C8dae78Dc024ab1', 'Fishing Bait', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1CeBAB3cD84AfFD4c585B601a1b2FF41662dED8A', 'Frozen Scales', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd03371DB349524E4E7617e8F6705eB7D0fa1AF73', 'Garden Rake', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xDeA0A67c15C7C016CAc6Fad265eDa2C0A50aB020', 'Garden Scissors', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x87Af694948d0B5da51F79EA2617047e7aB40Aa95', 'Gloop', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0A2d7fD52538506fddd9F68a3891355873D7288a', 'Glooper', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1729718723ec1F672ee08ad5183ab8a4a8E74A5C', 'Glooper raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7906A583300dd5d7831Da9655b5d90b71C2EAc1d', 'Hammer', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x03A9d8590C7a42ca907F83f700a82AB3b599180a', 'Iron Bottoms', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xA3cC2225F643D5474d55875C44d87D942220FeAc', 'Iron Ingot', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbb05d68C2Dc7151fec04b125606aAcE446B6AB2e', 'Iron Mace', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x895f234D83E944E2341D3c008cbbb8b6f0d96540', 'Iron Mask', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xafd89EBD445C1E952E365030Ed159F91CcD8B3eC', 'Iron Ore', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xFf77EC8Dd736339DBC023f0f4Df22faFBb53fFad', 'Iron Pickaxe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4Da6569F8D78563a55d39dA868059C89b71aFac9', 'Iron Talisman', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa6435De84eae486747E0d4dBe479297e192B6c7D', 'Iron Top', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd51Fb304FA912C256Ae78f4DEE406B53B595Dc99', 'Lumigloop', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x57cC5a5e6c2e5DE75B37e543feA8a163Ec64C78c', 'Lumigloop raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x149b649cdB1Dcfbe1472C389859eC7656685F01c', 'Luminara Surge', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xFdc1e2d6F7B06714d3e89259939f1EBc44393312', 'Luminara Surge raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x773545fC2691f7827629CeAaBC27623916b4CCF9', 'Metal Axe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4b86886653BB07891883494dD25d2C5D7C8Ce26A', 'Metal Axe ???', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x05eC6748BA283C76057712444a4a23B98EEDbFaa', 'Moonbloom', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xFA21207CfA2D131dD916Ab571C7308AB775Fe56B', 'Moonbloom Potion Mix', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7fF48e95cc1752e89407a4107d65633c6eF45a8E', 'Moonbloom Seed', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1eC973E25f9CB9543097f8a1338932f51B89DA4f', 'Noble Spirit Logs', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xCCfB7E2aD85541b58b28Fd6248b8956A6ccC5c2E', 'Noble Wood Plank', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xE6f6590BC18F95CA23d5eB03AA83eAf7e0239a6C', 'Noble Wood Rod', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4DefC424ebDf02838C4B18c4AacD747E3952d7b2', 'Noble Wood Trunk', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd0Ce185aaDa19Ff4Cdb3F1DFb4bdBe6C51620B92', 'Potion of Fortuity', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4613dde2e2f60960139b75c456001ea3125dd4Ae', 'Potion of Guarding', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1f3aBC26273aC815fA7913eb87a1f7d7a6875f6A', 'Potion of Power', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x748335065F11C1C746da3b7B86533eCa233DEcdd', 'Potion of Swiftness', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x9038472C83b787C285c9fE22645b564Ee8E575A0', 'Prime Spirit Logs', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x425701B34b697671F494Beb61ED842bf7F2f4211', 'Prime Wood Plank', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x90D01fA393D05cf22E741e08857A8aB15E27F530', 'Prime Wood Rod', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xE3FFa8c9B56b771E5349a3Aa1f62f6c27038fe7e', 'Prime Wood Trunk', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xF896096dbD1055a583c72084896b4871B065B7BD', 'Snork', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xAf032CA29995D43AaE315E5a3ce3e5e2E6B53842', 'Snork raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0079221b58Fbf5a231bDa10f23BafCa8EBc46CD7', 'Snorkara Spark', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x08788754d96e7b0c29A1BF67facec92d7dE8FD8A', 'Snorkara Spark raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2cAE6104269C6d3b57B7eD0b53140b4c326a3F0d', 'Snorker', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0a5263B6cAA93098BE57451bd2086845C1aB6413', 'Snorker raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xB4f620235bbaC6c0708fd9e4b77d6D9cC40DAb27', 'Snorklum', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x861593CDf4189d0fB08eb0beFDAbfd12b2afcdd9', 'Snorklum raw', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x474791f66742562c319D426e30FA8889910712f7', 'Soul of Earth', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1Ce28d7dDd3F0c23640f3c717B77Ff1bfF3be9b2', 'Soul of Echo', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x06AFfFDb07995EDFC20a57598c76e6feF183263F', 'Soul of Fire', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xeC1AE3d973D2b9E75613885230d1c3D0A9fD1845', 'Soul of Ruin', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x16b3fAc1EC8FEE41262e962A366A2BA17973AdBe', 'Soul of Water', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7341F6192a3a0E2c7E81117c88376910Fcb56B69', 'Soul of Wither', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xBd4D792a29dAb5AB92E63cE670bddFA685773020', 'Spirit Logs', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2c56Fd97424718aB6376941eb5bEEf754dbfaf95', 'Spirit Logs (Elder)', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2618F10476B5fdca7b77639da3E8358132b3137C', 'Spirit Wood Plank', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x27351968Cd72C85cA1b2F6E6123D1d6F3493FFfe', 'Spirit Wood Rod', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa7B4EA0780a80b33EE0e166397A89a1B1b81D48B', 'Spirit Wood Trunk', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf83ff85D19a9304949E58BE57Cb87DD5d2505772', 'Steel Bottoms', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x632a15155CA9c4f6fc05Bf8E0fc73C9D5916E40F', 'Steel Ingot', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xC687674176c6DF26031bc910873760A95D396f8F', 'Steel Mask', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7B587d1485249A3287E105Ae99F52D36058a8597', 'Steel Pickaxe', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xA4E882Db038d4609671fA1d73bCa7A2298c9c932', 'Steel Shield', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa2275b6CD9C3455352E7e7fFA5AF995eD5483348', 'Steel Staff', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x5a72874f7184e180db8E57D540f6968147795BEa', 'Steel Top', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xEF769F50c70D1c17738c82Fe1b44D7a65A5609Fd', 'Strange Cake', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xBE581A48c394F94D35ab03C18b8a6c5933D11f6D', 'Stray Teeth', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xF3D654b0718d63FA3F99DF11717B780b72d175c2', 'Sunflare', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xD38b675E064Eae18Ae6F647Df600B7B57fCf85BB', 'Sunflare Potion Mix', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x28634c6CE07d062A93e4E784C3C6E86013Abe78F', 'Sunflare Seed', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xda569480C86a730C1aBAfCb9F0821586831b2ad3', 'Tentaflora', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x533008935a284FAAd2f247D6177B3DA33955ccDE', 'Tentaflora Potion Mix', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x71d8c3889A61897392C2356777fDA687Df08cff0', 'Tentaflora Seed', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x783905Ec5b90087Db4A527346eafB2Da7afc22fd', 'Tickly Feather', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0493b82bD11509173F7C79Be06407fC629165C60', 'Tin Ore', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf59F3aca79F943Ec59A15CFB2fc950D5028B5D9e', 'Vial of Water', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
-INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xCAD93757A32aa504EDA3c9B6b4576a85cbE45807', 'Vulcan’s Coal', '0x13bFE24ecb2BBBaA154c510bb96BA899Ab73277C', '0x3536eD2548A5e2Fc66A8448cC62394ff6d60159E', TRUE) ON CONFLICT (pair_address) DO NOTHING;
\ No newline at end of file
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf2a9ddd2e20c5fd34ddefd6e4166a9055fda903a', '$PEPEDROX', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xaab423828dd5e7b154d65977b2333cb2037146ab', 'Blessed Axe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x922f93fe06069c2d2be094f432371caba55b08a1', 'Bronze Ingot', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa12d27ef52959a6f2434e8c803ff61c49c6afb72', 'Bronze Mace', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd781145adbf3dadf800dd31716eab77b209db8cd', 'Bronze Mask', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xdd188725c551809a0fd5541df5c46d7bedfac62e', 'Bronze Pants', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7f742dcdc8ba91718196a47a61c82e605554b6d6', 'Bronze Pickaxe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x42a2a62e76842adcca5c814a0bc43f61d06bcc2a', 'Bronze Shield', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xdde65fe4aab59cb53af3e7cb3b422df0bcf47c24', 'Bronze Top', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4b951077768e8da74fe904e8806d1c52fd0e574a', 'Bucket of Water', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x18207a7a55ff9ed14a7c5e648a4c0baae40c1c2a', 'Charm of Earth', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa2873c20340f44b6a490b7547fa305fd356c468d', 'Coal Ore', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x02dabcb519a80ac76d846e816364eb2281d49beb', 'Common Axe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf43c6ed7a1bd10fc1175f69d3984f69a3db0f534', 'Compost', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x6f3f8564300bafcbff097e85e2d9599037df0cb2', 'Copper Ore', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x677857d64f175ad814fb55ca819da397e754d915', 'Crimsoncap', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf09e8a93ffb8d62c6030017de388c0736c4cfd81', 'Crimsoncap Potion Mix', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xb4e031b2992d65b2ac69adc5c8bcd2dd4766b939', 'Crimsoncap Spore', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbe69f6f48bc30403f6ee096a288537558de26986', 'Cure Sickness Potion', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf22ff82d4929e3c5ffe65557c23bcb8b5422d705', 'Elder Wood Plank', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x93014497bc23427f1ac38824c6b0ceacbea2f9d5', 'Elder Wood Rod', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2a616a726114fba13a0123673c94060a06f6b1af', 'Elder Wood Trunk', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x3e58bc4390cae647f1e342144a8d14c21b3990d4', 'Empty Soul', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xed220303782ce8b2314129827f93e2961458f37b', 'Empty Vial', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbf20b788ed5834a2a8254fa9794f8e5c8b1cfed3', 'Energy Potion', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x3cb6e162469eb167d22583eea7927843bfaf3e47', 'Essence of Earth', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x6c6ee2e60232816323aaac79a2ff76534e22322d', 'Essence of Fire', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa57615711a9518a0cea01fb389af7de2f86fdef4', 'Essence of Water', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xb8d13f34da2a1b826edb425a1c8dae78dc024ab1', 'Fishing Bait', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1cebab3cd84affd4c585b601a1b2ff41662ded8a', 'Frozen Scales', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd03371db349524e4e7617e8f6705eb7d0fa1af73', 'Garden Rake', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xdea0a67c15c7c016cac6fad265eda2c0a50ab020', 'Garden Scissors', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x87af694948d0b5da51f79ea2617047e7ab40aa95', 'Gloop', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0a2d7fd52538506fddd9f68a3891355873d7288a', 'Glooper', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1729718723ec1f672ee08ad5183ab8a4a8e74a5c', 'Glooper raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7906a583300dd5d7831da9655b5d90b71c2eac1d', 'Hammer', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x03a9d8590c7a42ca907f83f700a82ab3b599180a', 'Iron Bottoms', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa3cc2225f643d5474d55875c44d87d942220feac', 'Iron Ingot', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbb05d68c2dc7151fec04b125606aace446b6ab2e', 'Iron Mace', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x895f234d83e944e2341d3c008cbbb8b6f0d96540', 'Iron Mask', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xafd89ebd445c1e952e365030ed159f91ccd8b3ec', 'Iron Ore', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xff77ec8dd736339dbc023f0f4df22fafbb53ffad', 'Iron Pickaxe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4da6569f8d78563a55d39da868059c89b71afac9', 'Iron Talisman', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa6435de84eae486747e0d4dbe479297e192b6c7d', 'Iron Top', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd51fb304fa912c256ae78f4dee406b53b595dc99', 'Lumigloop', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x57cc5a5e6c2e5de75b37e543fea8a163ec64c78c', 'Lumigloop raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x149b649cdb1dcfbe1472c389859ec7656685f01c', 'Luminara Surge', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xfdc1e2d6f7b06714d3e89259939f1ebc44393312', 'Luminara Surge raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x773545fc2691f7827629ceaabc27623916b4ccf9', 'Metal Axe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4b86886653bb07891883494dd25d2c5d7c8ce26a', 'Metal Axe ???', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x05ec6748ba283c76057712444a4a23b98eedbfaa', 'Moonbloom', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xfa21207cfa2d131dd916ab571c7308ab775fe56b', 'Moonbloom Potion Mix', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7ff48e95cc1752e89407a4107d65633c6ef45a8e', 'Moonbloom Seed', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1ec973e25f9cb9543097f8a1338932f51b89da4f', 'Noble Spirit Logs', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xccfb7e2ad85541b58b28fd6248b8956a6ccc5c2e', 'Noble Wood Plank', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xe6f6590bc18f95ca23d5eb03aa83eaf7e0239a6c', 'Noble Wood Rod', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4defc424ebdf02838c4b18c4aacd747e3952d7b2', 'Noble Wood Trunk', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd0ce185aada19ff4cdb3f1dfb4bdbe6c51620b92', 'Potion of Fortuity', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x4613dde2e2f60960139b75c456001ea3125dd4ae', 'Potion of Guarding', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1f3abc26273ac815fa7913eb87a1f7d7a6875f6a', 'Potion of Power', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x748335065f11c1c746da3b7b86533eca233decdd', 'Potion of Swiftness', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x9038472c83b787c285c9fe22645b564ee8e575a0', 'Prime Spirit Logs', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x425701b34b697671f494beb61ed842bf7f2f4211', 'Prime Wood Plank', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x90d01fa393d05cf22e741e08857a8ab15e27f530', 'Prime Wood Rod', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xe3ffa8c9b56b771e5349a3aa1f62f6c27038fe7e', 'Prime Wood Trunk', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf896096dbd1055a583c72084896b4871b065b7bd', 'Snork', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xaf032ca29995d43aae315e5a3ce3e5e2e6b53842', 'Snork raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0079221b58fbf5a231bda10f23bafca8ebc46cd7', 'Snorkara Spark', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x08788754d96e7b0c29a1bf67facec92d7de8fd8a', 'Snorkara Spark raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2cae6104269c6d3b57b7ed0b53140b4c326a3f0d', 'Snorker', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0a5263b6caa93098be57451bd2086845c1ab6413', 'Snorker raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xb4f620235bbac6c0708fd9e4b77d6d9cc40dab27', 'Snorklum', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x861593cdf4189d0fb08eb0befdabfd12b2afcdd9', 'Snorklum raw', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x474791f66742562c319d426e30fa8889910712f7', 'Soul of Earth', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x1ce28d7ddd3f0c23640f3c717b77ff1bff3be9b2', 'Soul of Echo', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x06afffdb07995edfc20a57598c76e6fef183263f', 'Soul of Fire', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xec1ae3d973d2b9e75613885230d1c3d0a9fd1845', 'Soul of Ruin', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x16b3fac1ec8fee41262e962a366a2ba17973adbe', 'Soul of Water', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7341f6192a3a0e2c7e81117c88376910fcb56b69', 'Soul of Wither', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbd4d792a29dab5ab92e63ce670bddfa685773020', 'Spirit Logs', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2c56fd97424718ab6376941eb5beef754dbfaf95', 'Spirit Logs (Elder)', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x2618f10476b5fdca7b77639da3e8358132b3137c', 'Spirit Wood Plank', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x27351968cd72c85ca1b2f6e6123d1d6f3493fffe', 'Spirit Wood Rod', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa7b4ea0780a80b33ee0e166397a89a1b1b81d48b', 'Spirit Wood Trunk', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf83ff85d19a9304949e58be57cb87dd5d2505772', 'Steel Bottoms', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x632a15155ca9c4f6fc05bf8e0fc73c9d5916e40f', 'Steel Ingot', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xc687674176c6df26031bc910873760a95d396f8f', 'Steel Mask', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x7b587d1485249a3287e105ae99f52d36058a8597', 'Steel Pickaxe', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa4e882db038d4609671fa1d73bca7a2298c9c932', 'Steel Shield', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xa2275b6cd9c3455352e7e7ffa5af995ed5483348', 'Steel Staff', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x5a72874f7184e180db8e57d540f6968147795bea', 'Steel Top', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xef769f50c70d1c17738c82fe1b44d7a65a5609fd', 'Strange Cake', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xbe581a48c394f94d35ab03c18b8a6c5933d11f6d', 'Stray Teeth', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf3d654b0718d63fa3f99df11717b780b72d175c2', 'Sunflare', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xd38b675e064eae18ae6f647df600b7b57fcf85bb', 'Sunflare Potion Mix', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x28634c6ce07d062a93e4e784c3c6e86013abe78f', 'Sunflare Seed', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xda569480c86a730c1abafcb9f0821586831b2ad3', 'Tentaflora', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x533008935a284faad2f247d6177b3da33955ccde', 'Tentaflora Potion Mix', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x71d8c3889a61897392c2356777fda687df08cff0', 'Tentaflora Seed', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x783905ec5b90087db4a527346eafb2da7afc22fd', 'Tickly Feather', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0x0493b82bd11509173f7c79be06407fc629165c60', 'Tin Ore', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xf59f3aca79f943ec59a15cfb2fc950d5028b5d9e', 'Vial of Water', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
+INSERT INTO gex_pairs (pair_address, item_name, item_address, vee_address, enabled) VALUES ('0xcad93757a32aa504eda3c9b6b4576a85cbe45807', 'Vulcan’s Coal', '0x13bfe24ecb2bbbaa154c510bb96ba899ab73277c', '0x3536ed2548a5e2fc66a8448cc62394ff6d60159e', TRUE) ON CONFLICT (pair_address) DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,812 @@
+#!/usr/bin/env python3
+"""
+Księga pozycji LP z eventów: Mint / Burn / Transfer tokenu LP par
+(gex_pairs) dla portfeli z lp_wallets -> lp_events, złożone do lp_ledger
+(balans LP, koszt wejścia, wpłaty / wypłaty), plus totalSupply i rezerwy
+par w lp_pair_supply. Schemat: lp_ledger_schema.sql.
+
+Skaner z ingest_trades.py: te same okna eth_getLogs (iter_windows –
+równolegle, adaptacyjny rozmiar, retry), timestampy bloków
+(block_timestamps), bulk_load i kursor commitowany razem z wierszami.
+Własny kursor (lp_events_cursor), więc można go puścić od dowolnego bloku
+niezależnie od trade'ów.
+
+Portfel dodany do lp_wallets dostaje przy najbliższym biegu pozycje
+otwarcia (balanceOf + udział w rezerwach na bloku kursora, kind = open),
+a dalej liczy się już z eventów.
+
+    python ingest_lp_events.py            # jednorazowo do bieżącego bloku
+    python ingest_lp_events.py --follow   # demon (reorg jak w ingest_trades)
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from psycopg2.extras import execute_values
+from web3 import Web3
+
+import bulk_load
+import ingest_trades as trades
+import rpc_client
+from ingest_lp_snapshots import get_wallets
+
+# ================== CONFIG ==================
+
+# pierwszy bieg: od którego bloku (pusty = od bieżącego, tylko pozycje otwarcia)
+LP_EVENTS_START_BLOCK_ENV = os.getenv("LP_EVENTS_START_BLOCK", "").strip()
+COMMIT_ROWS = int(os.getenv("LP_EVENTS_COMMIT_ROWS", "5000"))
+COMMIT_SECONDS = float(os.getenv("LP_EVENTS_COMMIT_SECONDS", "10"))
+ADVISORY_LOCK = 987654323
+
+TRANSFER_TOPIC = Web3.to_hex(Web3.keccak(text="Transfer(address,address,uint256)"))
+MINT_TOPIC = Web3.to_hex(Web3.keccak(text="Mint(address,uint256,uint256)"))
+BURN_TOPIC = Web3.to_hex(Web3.keccak(text="Burn(address,uint256,uint256,address)"))
+TRANSFER_TOPIC_BYTES = bytes.fromhex(TRANSFER_TOPIC.removeprefix("0x"))
+MINT_TOPIC_BYTES = bytes.fromhex(MINT_TOPIC.removeprefix("0x"))
+BURN_TOPIC_BYTES = bytes.fromhex(BURN_TOPIC.removeprefix("0x"))
+# jeden eth_getLogs na wszystkie trzy eventy (topic0 = OR)
+LP_TOPICS = [[TRANSFER_TOPIC, MINT_TOPIC, BURN_TOPIC]]
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+SEL_GET_RESERVES = Web3.keccak(text="getReserves()")[:4]
+SEL_TOTAL_SUPPLY = Web3.keccak(text="totalSupply()")[:4]
+SEL_BALANCE_OF = Web3.keccak(text="balanceOf(address)")[:4]
+
+# kolumny lp_events dla COPY (binary) w bulk_load
+LP_EVENT_COLUMNS = [
+    ("pair_address", "text"),
+    ("block_number", "int8"),
+    ("log_index", "int4"),
+    ("wallet_address", "text"),
+    ("ts", "timestamptz"),
+    ("tx_hash", "bytea"),
+    ("kind", "text"),
+    ("counterparty", "text"),
+    ("lp_wei", "numeric"),
+    ("vee_wei", "numeric"),
+    ("item_wei", "numeric"),
+]
+
+LEDGER_COLUMNS = [
+    "wallet_address",
+    "pair_address",
+    "lp_wei",
+    "basis_vee_wei",
+    "basis_item_wei",
+    "basis_liq",
+    "deposited_vee_wei",
+    "deposited_item_wei",
+    "withdrawn_vee_wei",
+    "withdrawn_item_wei",
+    "basis_complete",
+    "entry_ts",
+    "entry_block",
+    "last_block",
+    "events",
+]
+
+
+# ================== DB ==================
+
+def schema_ready(conn) -> bool:
+    cur = conn.cursor()
+    cur.execute("SELECT to_regclass('lp_events') IS NOT NULL")
+    ok = cur.fetchone()[0]
+    cur.close()
+    conn.commit()
+    return ok
+
+
+def get_last_block(conn):
+    cur = conn.cursor()
+    cur.execute("SELECT last_block FROM lp_events_cursor WHERE id = 1")
+    row = cur.fetchone()
+    cur.close()
+    if row:
+        return int(row[0])
+
+    latest = trades.w3.eth.block_number
+    start = latest
+    if LP_EVENTS_START_BLOCK_ENV:
+        try:
+            start = min(int(LP_EVENTS_START_BLOCK_ENV), latest)
+        except ValueError:
+            pass
+    print(f"[LPEV] Pierwszy raz, startuję od bloku {start}")
+    return start
+
+
+def save_last_block(cur, last_block):
+    cur.execute(
+        """
+        INSERT INTO lp_events_cursor (id, last_block)
+        VALUES (1, %s)
+        ON CONFLICT (id) DO UPDATE SET last_block = EXCLUDED.last_block
+        """,
+        (int(last_block),),
+    )
+
+
+def get_tracked_wallets(cur):
+    cur.execute("SELECT wallet_address FROM lp_events_wallets")
+    return {r[0] for r in cur.fetchall()}
+
+
+def load_ctx(conn):
+    """
+    Pary jak w trades.load_pairs + strona VEE z gex_pairs.vee_is_token0
+    (uzupełnia raz na parę ingest_pairs.py), więc bez eth_call
+    token0/token1 per para. Pary bez vee_is_token0 (jeszcze niesprawdzone
+    albo bez VEE) wypadają z filtra eth_getLogs i z Multicalla.
+    """
+    ctx = trades.load_pairs(conn)
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'gex_pairs' AND column_name = 'vee_is_token0'
+        """
+    )
+    sides = {}
+    if cur.fetchone():
+        cur.execute(
+            """
+            SELECT pair_address, vee_is_token0
+            FROM gex_pairs
+            WHERE enabled = TRUE
+              AND vee_is_token0 IS NOT NULL
+            """
+        )
+        sides = {p.lower(): v for p, v in cur.fetchall() if p}
+    cur.close()
+
+    skipped = [p for p, _, _ in ctx["pairs"] if p in ctx["info"] and p not in sides]
+    if skipped:
+        print(f"[LPEV] {len(skipped)} par bez gex_pairs.vee_is_token0 – pomijam (uruchom ingest_pairs.py)")
+    ctx["sides"] = sides
+    ctx["pairs"] = [row for row in ctx["pairs"] if row[0] in sides]
+    ctx["addresses"] = [trades.w3.to_checksum_address(p) for p, _, _ in ctx["pairs"]]
+    return ctx
+
+
+# ================== RPC ==================
+
+def pair_state_at(pairs, block, ctx, wallets=()):
+    """
+    Jeden Multicall3 na bloku block: getReserves + totalSupply par
+    (+ balanceOf portfeli). Zwraca ({pair: (reserve_vee, reserve_item,
+    total_supply)}, {(wallet, pair): balans}), wszystko w wei; pary /
+    pozycje z nieudanym odczytem pomijamy.
+    """
+    pairs = sorted(pairs)
+    targets = [trades.w3.to_checksum_address(p) for p in pairs]
+    calls = []
+    for t in targets:
+        calls.append((t, SEL_GET_RESERVES))
+        calls.append((t, SEL_TOTAL_SUPPLY))
+    for wallet in wallets:
+        arg = trades.w3.codec.encode(["address"], [trades.w3.to_checksum_address(wallet)])
+        calls.extend((t, SEL_BALANCE_OF + arg) for t in targets)
+    results = rpc_client.multicall(calls, block, trades.w3)
+
+    state = {}
+    for i, pair in enumerate(pairs):
+        (ok_r, ret_r), (ok_s, ret_s) = results[2 * i], results[2 * i + 1]
+        vee_is_token0 = ctx["sides"].get(pair)
+        if not (ok_r and ok_s) or len(ret_r) < 64 or len(ret_s) < 32 or vee_is_token0 is None:
+            continue
+        reserve0 = int.from_bytes(ret_r[:32], "big")
+        reserve1 = int.from_bytes(ret_r[32:64], "big")
+        supply = int.from_bytes(ret_s[:32], "big")
+        if vee_is_token0:
+            state[pair] = (reserve0, reserve1, supply)
+        else:
+            state[pair] = (reserve1, reserve0, supply)
+
+    balances = {}
+    base = 2 * len(pairs)
+    for w, wallet in enumerate(wallets):
+        for i, pair in enumerate(pairs):
+            ok, ret = results[base + w * len(pairs) + i]
+            if ok and len(ret) >= 32:
+                balances[(wallet, pair)] = int.from_bytes(ret[:32], "big")
+    return state, balances
+
+
+def share_of(lp_wei, state):
+    """
+    (vee_wei, item_wei) przypadające na lp_wei LP przy stanie pary
+    (reserve_vee, reserve_item, total_supply), albo (None, None).
+    """
+    if state is None or state[2] <= 0:
+        return None, None
+    reserve_vee, reserve_item, supply = state
+    return lp_wei * reserve_vee // supply, lp_wei * reserve_item // supply
+
+
+# ================== DEKODOWANIE ==================
+
+def as_bytes(data):
+    if isinstance(data, str):
+        return bytes.fromhex(data.removeprefix("0x"))
+    return bytes(data)
+
+
+def topic_address(topic) -> str:
+    return "0x" + as_bytes(topic)[-20:].hex()
+
+
+def lp_event(log, wallet, pair, kind, lp_wei, vee_wei=None, item_wei=None, counterparty=None):
+    return {
+        "pair_address": pair,
+        "block_number": int(log["blockNumber"]),
+        "log_index": int(log["logIndex"]),
+        "wallet_address": wallet,
+        "tx_hash": bytes(log["transactionHash"]),
+        "kind": kind,
+        "counterparty": counterparty,
+        "lp_wei": lp_wei,
+        "vee_wei": vee_wei,
+        "item_wei": item_wei,
+    }
+
+
+def transfer_events(log, pair, src, dst, value, wallets):
+    """
+    Zwykłe przeniesienie LP: transfer_out dla nadawcy i transfer_in dla
+    odbiorcy (jeśli są śledzone; oba = przeniesienie kosztu między portfelami).
+    """
+    if src == dst:
+        return []
+    out = []
+    if src in wallets:
+        out.append(lp_event(log, src, pair, "transfer_out", value, counterparty=dst))
+    if dst in wallets:
+        out.append(lp_event(log, dst, pair, "transfer_in", value, counterparty=src))
+    return out
+
+
+def decode_lp_logs(logs, ctx, wallets, where=""):
+    """
+    Logi Transfer / Mint / Burn okna -> eventy lp_events śledzonych portfeli
+    (bez ts i wyceny transferów – te dochodzą w scan()).
+
+    Per transakcja, po logIndex (jak w UniswapV2Pair):
+    - mint: Transfer(0 -> X) ... Mint – LP dla X to ostatni Transfer z zera
+      przed Mint (wcześniejsze to fee protokołu / MINIMUM_LIQUIDITY),
+      kwoty z Mint;
+    - burn: Transfer(X -> para) ... Burn – LP oddane przez X to ostatni
+      Transfer do pary przed Burn, kwoty z Burn;
+    - reszta Transferów (i niesparowane powyżej) = transfer_in / transfer_out.
+    """
+    by_tx = {}
+    for log in sorted(logs, key=lambda l: (int(l["blockNumber"]), int(l["logIndex"]))):
+        by_tx.setdefault(bytes(log["transactionHash"]), []).append(log)
+
+    events = []
+    for tx_logs in by_tx.values():
+        minted = {}    # para -> [(log, X, lp)] Transfer(0 -> X) czekające na Mint
+        returned = {}  # para -> [(log, X, lp)] Transfer(X -> para) czekające na Burn
+        for log in tx_logs:
+            pair = log["address"].lower()
+            vee_is_token0 = ctx["sides"].get(pair)
+            if vee_is_token0 is None or not log.get("topics"):
+                continue
+            topics = log["topics"]
+            topic0 = as_bytes(topics[0])
+            data = as_bytes(log["data"])
+
+            if topic0 == TRANSFER_TOPIC_BYTES:
+                if len(topics) != 3 or len(data) != 32:
+                    print(f"[LPEV] ERROR parsing Transfer in {where}: {len(topics)} topiców, data {len(data)} B")
+                    continue
+                src = topic_address(topics[1])
+                dst = topic_address(topics[2])
+                value = int.from_bytes(data, "big")
+                if src == ZERO_ADDRESS:
+                    if dst != ZERO_ADDRESS:  # MINIMUM_LIQUIDITY idzie na adres zero
+                        minted.setdefault(pair, []).append((log, dst, value))
+                elif dst == pair:
+                    returned.setdefault(pair, []).append((log, src, value))
+                else:
+                    events.extend(transfer_events(log, pair, src, dst, value, wallets))
+                continue
+
+            if topic0 not in (MINT_TOPIC_BYTES, BURN_TOPIC_BYTES):
+                continue
+            if len(data) != 64:
+                print(f"[LPEV] ERROR parsing Mint/Burn in {where}: data {len(data)} B zamiast 64")
+                continue
+            amount0 = int.from_bytes(data[:32], "big")
+            amount1 = int.from_bytes(data[32:], "big")
+            vee_wei, item_wei = (amount0, amount1) if vee_is_token0 else (amount1, amount0)
+
+            if topic0 == MINT_TOPIC_BYTES:
+                pending = minted.pop(pair, [])
+                if not pending:
+                    continue
+                for plog, dst, value in pending[:-1]:
+                    events.extend(transfer_events(plog, pair, ZERO_ADDRESS, dst, value, wallets))
+                plog, dst, value = pending[-1]
+                if dst in wallets:
+                    events.append(lp_event(plog, dst, pair, "mint", value, vee_wei, item_wei))
+            else:
+                pending = returned.pop(pair, [])
+                if not pending:
+                    continue
+                for plog, src, value in pending[:-1]:
+                    events.extend(transfer_events(plog, pair, src, pair, value, wallets))
+                plog, src, value = pending[-1]
+                if src in wallets:
+                    events.append(lp_event(plog, src, pair, "burn", value, vee_wei, item_wei))
+
+        for pair, pending in minted.items():
+            for plog, dst, value in pending:
+                events.extend(transfer_events(plog, pair, ZERO_ADDRESS, dst, value, wallets))
+        for pair, pending in returned.items():
+            for plog, src, value in pending:
+                events.extend(transfer_events(plog, pair, src, pair, value, wallets))
+    return events
+
+
+def value_transfers(events, ctx):
+    """
+    Wycena transfer_in / transfer_out: udział w rezerwach na końcu bloku
+    (jeden Multicall3 na blok z transferami). Bez stanu z tego bloku
+    (węzeł bez archiwum) kwoty zostają NULL – koszt pozycji jest wtedy
+    oznaczony jako niepełny (basis_complete).
+    """
+    by_block = {}
+    for ev in events:
+        if ev["kind"] in ("transfer_in", "transfer_out"):
+            by_block.setdefault(ev["block_number"], []).append(ev)
+    for block, block_events in sorted(by_block.items()):
+        try:
+            state, _ = pair_state_at({ev["pair_address"] for ev in block_events}, block, ctx)
+        except Exception as e:
+            print(f"[LPEV] Brak stanu par z bloku {block} ({e}) – transfery bez wyceny")
+            continue
+        for ev in block_events:
+            ev["vee_wei"], ev["item_wei"] = share_of(ev["lp_wei"], state.get(ev["pair_address"]))
+
+
+def event_rows(events, block_ts):
+    return [
+        (
+            ev["pair_address"],
+            ev["block_number"],
+            ev["log_index"],
+            ev["wallet_address"],
+            datetime.fromtimestamp(block_ts[ev["block_number"]], timezone.utc),
+            ev["tx_hash"],
+            ev["kind"],
+            ev["counterparty"],
+            ev["lp_wei"],
+            ev["vee_wei"],
+            ev["item_wei"],
+        )
+        for ev in events
+    ]
+
+
+# ================== KSIĘGA ==================
+
+def new_position():
+    return {
+        "lp_wei": 0,
+        "basis_vee_wei": 0,
+        "basis_item_wei": 0,
+        "basis_liq": 0,
+        "deposited_vee_wei": 0,
+        "deposited_item_wei": 0,
+        "withdrawn_vee_wei": 0,
+        "withdrawn_item_wei": 0,
+        "basis_complete": True,
+        "entry_ts": None,
+        "entry_block": None,
+        "last_block": None,
+        "events": 0,
+    }
+
+
+def replay(events):
+    """
+    Złożenie eventów jednej pary (wszystkie portfele, po kolei: blok,
+    log_index, transfer_out przed transfer_in) -> {wallet: pozycja}.
+    Arytmetyka na intach (wei), bez zaokrągleń poza proporcją przy wyjściu.
+
+    - open / mint / transfer_in: balans += LP, koszt += kwoty; pozycja
+      z zerowego balansu zaczyna się od nowa (entry_ts). transfer_in od
+      śledzonego portfela przejmuje jego koszt zamiast wyceny rynkowej.
+    - burn / transfer_out: koszt maleje proporcjonalnie do oddanego LP,
+      wypłata = kwoty z Burn (transfer: wycena albo zdjęty koszt).
+    basis_liq = sqrt(vee * item) wejść – wzrost sqrt(k) na LP ponad to = fee.
+    """
+    positions = {}
+    moved = {}  # (blok, log_index) -> koszt zdjęty przez transfer_out
+    for ev in events:
+        pos = positions.setdefault(ev["wallet_address"], new_position())
+        kind = ev["kind"]
+        lp = int(ev["lp_wei"])
+        vee = None if ev["vee_wei"] is None else int(ev["vee_wei"])
+        item = None if ev["item_wei"] is None else int(ev["item_wei"])
+        key = (ev["block_number"], ev["log_index"])
+
+        if kind in ("open", "mint", "transfer_in"):
+            if lp <= 0:
+                continue
+            if kind == "transfer_in" and key in moved:
+                vee, item, liq, complete = moved.pop(key)
+            else:
+                complete = vee is not None and item is not None
+                vee, item = vee or 0, item or 0
+                liq = math.isqrt(vee * item)
+            if pos["lp_wei"] == 0:
+                events_before = pos["events"]
+                pos.update(new_position())
+                pos["events"] = events_before
+                pos["entry_ts"] = ev["ts"]
+                pos["entry_block"] = ev["block_number"]
+            pos["lp_wei"] += lp
+            pos["basis_vee_wei"] += vee
+            pos["basis_item_wei"] += item
+            pos["basis_liq"] += liq
+            pos["deposited_vee_wei"] += vee
+            pos["deposited_item_wei"] += item
+            pos["basis_complete"] = pos["basis_complete"] and complete
+        else:
+            balance = pos["lp_wei"]
+            if balance <= 0:
+                # LP sprzed śledzenia / spoza księgi – nie ma czego zdjąć
+                continue
+            take = min(lp, balance)
+            out_vee = pos["basis_vee_wei"] * take // balance
+            out_item = pos["basis_item_wei"] * take // balance
+            out_liq = pos["basis_liq"] * take // balance
+            pos["basis_vee_wei"] -= out_vee
+            pos["basis_item_wei"] -= out_item
+            pos["basis_liq"] -= out_liq
+            pos["lp_wei"] -= take
+            if kind == "transfer_out":
+                moved[key] = (out_vee, out_item, out_liq, pos["basis_complete"])
+            if vee is None or item is None:
+                vee, item = out_vee, out_item
+            pos["withdrawn_vee_wei"] += vee
+            pos["withdrawn_item_wei"] += item
+
+        pos["events"] += 1
+        pos["last_block"] = ev["block_number"]
+    return positions
+
+
+def rebuild_ledger(cur, pairs):
+    """
+    lp_ledger dla par od nowa z lp_events (w bieżącej transakcji).
+    Eventów na parę jest niewiele (tylko śledzone portfele), więc pełne
+    złożenie jest tańsze i pewniejsze niż inkrementacja (reorg, poprawki).
+    """
+    pairs = sorted(pairs)
+    if not pairs:
+        return
+    cur.execute(
+        """
+        SELECT pair_address, block_number, log_index, wallet_address, ts,
+               kind, lp_wei, vee_wei, item_wei
+        FROM lp_events
+        WHERE pair_address = ANY(%s)
+        ORDER BY pair_address, block_number, log_index, (kind <> 'transfer_out')
+        """,
+        (pairs,),
+    )
+    per_pair = {}
+    for pair, block, log_index, wallet, ts, kind, lp_wei, vee_wei, item_wei in cur.fetchall():
+        per_pair.setdefault(pair, []).append(
+            {
+                "block_number": block,
+                "log_index": log_index,
+                "wallet_address": wallet,
+                "ts": ts,
+                "kind": kind,
+                "lp_wei": lp_wei,
+                "vee_wei": vee_wei,
+                "item_wei": item_wei,
+            }
+        )
+
+    rows = []
+    for pair, events in per_pair.items():
+        for wallet, pos in replay(events).items():
+            pos = dict(pos, wallet_address=wallet, pair_address=pair)
+            rows.append(tuple(pos[c] for c in LEDGER_COLUMNS))
+
+    cur.execute("DELETE FROM lp_ledger WHERE pair_address = ANY(%s)", (pairs,))
+    if rows:
+        execute_values(
+            cur,
+            f"INSERT INTO lp_ledger ({', '.join(LEDGER_COLUMNS)}) VALUES %s",
+            rows,
+        )
+
+
+def update_pair_supply(conn, cur, ctx, block):
+    """
+    totalSupply + rezerwy wszystkich par na bloku block -> lp_pair_supply
+    (jeden Multicall3; z tego API liczy bieżący udział pozycji).
+    """
+    pairs = [p for p, _, _ in ctx["pairs"]]
+    try:
+        state, _ = pair_state_at(pairs, block, ctx)
+    except Exception as e:
+        print(f"[LPEV] Nie mogę odczytać totalSupply par ({e})")
+        return
+    if not state:
+        return
+    execute_values(
+        cur,
+        """
+        INSERT INTO lp_pair_supply (
+            pair_address, block_number, total_supply_wei, reserve_vee_wei, reserve_item_wei
+        ) VALUES %s
+        ON CONFLICT (pair_address) DO UPDATE SET
+            block_number     = EXCLUDED.block_number,
+            total_supply_wei = EXCLUDED.total_supply_wei,
+            reserve_vee_wei  = EXCLUDED.reserve_vee_wei,
+            reserve_item_wei = EXCLUDED.reserve_item_wei
+        WHERE lp_pair_supply.block_number <= EXCLUDED.block_number
+        """,
+        [(p, block, s, rv, ri) for p, (rv, ri, s) in state.items()],
+    )
+    conn.commit()
+
+
+def open_wallets(conn, cur, ctx, wallets, block):
+    """
+    Portfele z lp_wallets, których skaner jeszcze nie śledzi: pozycje
+    otwarcia z bloku block (balanceOf + udział w rezerwach), od block + 1
+    już eventy. Zwraca zbiór śledzonych portfeli. Jeśli odczyt na bloku
+    się nie uda (np. node bez archiwum, a kursor w przeszłości), nowe
+    portfele czekają do następnej rundy – skan idzie dalej bez nich.
+    """
+    tracked = get_tracked_wallets(cur)
+    new = sorted(set(wallets) - tracked)
+    if not new:
+        conn.commit()
+        return tracked
+
+    pairs = [p for p, _, _ in ctx["pairs"]]
+    try:
+        state, balances = pair_state_at(pairs, block, ctx, new)
+        block_ts = trades.get_block_timestamps(cur, [block])
+    except Exception as e:
+        print(f"[LPEV] Nie mogę odczytać pozycji otwarcia na bloku {block} ({e}) – nowe portfele ({len(new)}) w następnej rundzie")
+        conn.rollback()
+        return tracked
+    opened = []
+    for (wallet, pair), lp in sorted(balances.items()):
+        if lp <= 0:
+            continue
+        vee, item = share_of(lp, state.get(pair))
+        opened.append(
+            (
+                pair,
+                block,
+                -1,
+                wallet,
+                datetime.fromtimestamp(block_ts[block], timezone.utc),
+                None,
+                "open",
+                None,
+                lp,
+                vee,
+                item,
+            )
+        )
+
+    loader = bulk_load.BulkLoader("lp_events", LP_EVENT_COLUMNS)
+    loader.add(opened)
+    loader.flush(cur)
+    execute_values(
+        cur,
+        """
+        INSERT INTO lp_events_wallets (wallet_address, from_block) VALUES %s
+        ON CONFLICT (wallet_address) DO NOTHING
+        """,
+        [(w, block) for w in new],
+    )
+    rebuild_ledger(cur, {r[0] for r in opened})
+    conn.commit()
+    loader.committed()
+    print(f"[LPEV] Nowe portfele: {len(new)}, pozycje otwarcia na bloku {block}: {len(opened)}")
+    return tracked | set(new)
+
+
+# ================== SKAN ==================
+
+def commit_events(conn, cur, loader, touched, last_block):
+    inserted = loader.flush(cur)
+    rebuild_ledger(cur, touched)
+    save_last_block(cur, last_block)
+    conn.commit()
+    loader.committed()
+    touched.clear()
+    return inserted
+
+
+def scan(conn, cur, pool, ctx, wallets, start_block, latest_block):
+    """
+    Bloki (start_block, latest_block] oknami z ingest_trades.iter_windows,
+    eventy commitowane razem z kursorem i przeliczoną księgą dotkniętych par.
+    Zwraca (ostatni zapisany blok, nowe eventy, ok).
+    """
+    done = start_block
+    pending_to = start_block
+    total = 0
+    touched = set()
+    loader = bulk_load.BulkLoader(
+        "lp_events",
+        LP_EVENT_COLUMNS,
+        commit_rows=COMMIT_ROWS,
+        commit_seconds=COMMIT_SECONDS,
+    )
+    try:
+        for current_from, current_to, logs in trades.iter_windows(
+            pool, start_block, latest_block, ctx["addresses"], LP_TOPICS
+        ):
+            where = f"{current_from}-{current_to}"
+            events = decode_lp_logs(logs, ctx, wallets, where)
+            if events:
+                print(f"[LPEV] Bloki {where}: {len(events)} eventów LP")
+                try:
+                    block_ts = trades.get_block_timestamps(
+                        cur, [ev["block_number"] for ev in events], latest_block
+                    )
+                except Exception as e:
+                    print(f"[LPEV] Brak timestampów bloków {where} ({e}), przerywam bieg.")
+                    conn.rollback()
+                    return done, total, False
+                value_transfers(events, ctx)
+                loader.add(event_rows(events, block_ts))
+                touched.update(ev["pair_address"] for ev in events)
+            pending_to = current_to
+
+            if loader.due() or current_to >= latest_block:
+                total += commit_events(conn, cur, loader, touched, pending_to)
+                done = pending_to
+    except trades.WindowError as e:
+        print(f"[LPEV] ZA DUŻO BŁĘDÓW dla bloków {e.from_block}-{e.to_block} ({e}), przerywam bieg.")
+        if pending_to > done:
+            total += commit_events(conn, cur, loader, touched, pending_to)
+            done = pending_to
+        return done, total, False
+    return done, total, True
+
+
+def check_reorg(conn, cur, ctx, wallets, cursor):
+    """
+    Eventy z ostatnich REORG_DEPTH bloków w łańcuchu vs lp_events. Przy
+    różnicy: kasujemy od pierwszego różnego bloku (razem z pozycjami
+    otwarcia z tych bloków – portfel zostanie otwarty ponownie),
+    przeliczamy księgę dotkniętych par i cofamy kursor.
+    """
+    if trades.REORG_DEPTH <= 0 or cursor <= 0:
+        return cursor
+    from_block = max(cursor - trades.REORG_DEPTH + 1, 0)
+    logs = trades.fetch_logs(from_block, cursor, ctx["addresses"], LP_TOPICS)
+    on_chain = {
+        (ev["pair_address"], ev["block_number"], ev["log_index"], ev["wallet_address"], ev["kind"])
+        for ev in decode_lp_logs(logs, ctx, wallets, "reorg check")
+    }
+    cur.execute(
+        """
+        SELECT pair_address, block_number, log_index, wallet_address, kind
+        FROM lp_events
+        WHERE block_number BETWEEN %s AND %s
+          AND log_index >= 0
+        """,
+        (from_block, cursor),
+    )
+    stored = set(cur.fetchall())
+    diff = on_chain ^ stored
+    if not diff:
+        conn.commit()
+        return cursor
+
+    fork = min(k[1] for k in diff)
+    cur.execute(
+        "DELETE FROM lp_events WHERE block_number >= %s RETURNING pair_address",
+        (fork,),
+    )
+    touched = {r[0] for r in cur.fetchall()}
+    cur.execute("DELETE FROM lp_events_wallets WHERE from_block >= %s", (fork,))
+    rebuild_ledger(cur, touched)
+    save_last_block(cur, fork - 1)
+    conn.commit()
+    print(f"[LPEV] Reorg od bloku {fork}: przeliczone pary {len(touched)}, skanuję ponownie")
+    return fork - 1
+
+
+def run(follow_mode=False):
+    conn = trades.get_conn()
+    if not schema_ready(conn):
+        print("[LPEV] Brak tabel księgi LP – najpierw psql -f lp_ledger_schema.sql")
+        conn.close()
+        return
+
+    cur = conn.cursor()
+    cur.execute("SELECT pg_try_advisory_lock(%s)", (ADVISORY_LOCK,))
+    if not cur.fetchone()[0]:
+        print("[LPEV] Inna instancja ingest_lp_events już działa – wychodzę.")
+        conn.close()
+        return
+
+    ctx = load_ctx(conn)
+    wallets = get_wallets(conn)
+    conn.commit()
+    if not ctx["pairs"] or not wallets:
+        print("[LPEV] Brak par albo portfeli – nie mam czego śledzić.")
+        conn.close()
+        return
+
+    pool = ThreadPoolExecutor(max_workers=trades.SCAN_WORKERS)
+    cursor = get_last_block(conn)
+    conn.commit()
+    refreshed = time.time()
+    try:
+        while True:
+            if follow_mode and time.time() - refreshed > trades.PAIRS_REFRESH_SECONDS:
+                try:
+                    ctx = load_ctx(conn)
+                    wallets = get_wallets(conn)
+                    conn.commit()
+                except Exception as e:
+                    print(f"[LPEV] Nie mogę odświeżyć par / portfeli: {e}")
+                    conn.rollback()
+                refreshed = time.time()
+
+            tracked = open_wallets(conn, cur, ctx, wallets, cursor)
+            save_last_block(cur, cursor)
+            conn.commit()
+
+            head = trades.w3.eth.block_number
+            if follow_mode:
+                try:
+                    cursor = check_reorg(conn, cur, ctx, tracked, cursor)
+                except Exception as e:
+                    print(f"[LPEV] Reorg check failed: {e}")
+                    conn.rollback()
+
+            ok = True
+            if head > cursor:
+                cursor, n_events, ok = scan(conn, cur, pool, ctx, tracked, cursor, head)
+                if n_events:
+                    print(f"[LPEV] Do bloku {cursor}: nowe eventy {n_events}")
+            update_pair_supply(conn, cur, ctx, cursor)
+
+            if not follow_mode:
+                if not ok:
+                    print("[LPEV] Bieg przerwany – spróbuję w następnym runie.")
+                break
+            trades.wait_for_head(cursor)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        if not conn.closed:
+            conn.close()
+        rpc_client.get_client().report("[LPEV]")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="tryb demona: śledź nowe bloki na bieżąco",
+    )
+    args = parser.parse_args()
+    try:
+        run(follow_mode=args.follow)
+    except KeyboardInterrupt:
+        print("[LPEV] Przerwane przez użytkownika.")
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 import os
-import json
 
 import psycopg2
-from psycopg2.extras import execute_batch
 from dotenv import load_dotenv
-from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
+from psycopg2.extras import execute_values
+
+import bulk_load
+import rpc_client
 
 load_dotenv()
 
@@ -18,38 +18,41 @@ DB_PARAMS = {
     "password": os.getenv("DB_PASS"),
 }
 
+# portfele bierzemy z lp_wallets (lp_wallets_schema.sql); LP_WALLET tylko
+# jako fallback, gdy tabeli jeszcze nie ma
 WALLET = os.getenv(
     "LP_WALLET",
     "0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0"
 ).lower()
 
-RPC_DEFAULT = "https://ronin-mainnet.g.alchemy.com/v2/IJPvvQ6YdcbcF85OD8jNsjBrpGo3-Xh0"
-RPC_RAW = os.getenv("RONIN_RPC", RPC_DEFAULT)
-if RPC_RAW.startswith("wss://"):
-    RPC_HTTP = "https://" + RPC_RAW.removeprefix("wss://")
-else:
-    RPC_HTTP = RPC_RAW
-
-w3 = Web3(Web3.HTTPProvider(RPC_HTTP))
-w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-
-ABI_ERC20 = json.loads("""
-[
-  { "constant": true, "inputs": [], "name": "totalSupply",
-    "outputs": [{ "name": "", "type": "uint256" }],
-    "stateMutability": "view", "type": "function"
-  },
-  { "constant": true, "inputs": [{ "name": "owner", "type": "address" }],
-    "name": "balanceOf",
-    "outputs": [{ "name": "", "type": "uint256" }],
-    "stateMutability": "view", "type": "function"
-  }
-]
-""")
+# RONIN_RPC (lista z failoverem), limit zapytań, retry, POA – rpc_client.py
+w3 = rpc_client.get_web3()
+
+SEL_TOTAL_SUPPLY = w3.keccak(text="totalSupply()")[:4]
+SEL_BALANCE_OF = w3.keccak(text="balanceOf(address)")[:4]
 
 FEE_RATE = float(os.getenv("LP_FEE_RATE", "0.05"))      # 5% fee model
 LP_MIN_SHARE = float(os.getenv("LP_MIN_SHARE", "0.0001"))  # ignoruj resztki LP
 
+# kolumny lp_snapshots dla COPY (binary) w bulk_load; ts = DEFAULT now()
+LP_COLUMNS = [
+    ("wallet_address", "text"),
+    ("pair_address", "text"),
+    ("item_name", "text"),
+    ("price_vee", "numeric"),
+    ("reserve_vee", "numeric"),
+    ("reserve_item", "numeric"),
+    ("lp_balance", "numeric"),
+    ("lp_share", "numeric"),
+    ("user_vee", "numeric"),
+    ("user_item", "numeric"),
+    ("volume_24h_vee", "numeric"),
+    ("volume_7d_vee", "numeric"),
+    ("lp_earn_vee_24h", "numeric"),
+    ("lp_earn_vee_7d", "numeric"),
+    ("lp_apr", "numeric"),
+]
+
 
 def get_conn():
     return psycopg2.connect(**DB_PARAMS)
@@ -60,34 +63,36 @@ def query_latest(conn):
     cur.execute(
         """
         WITH latest AS (
-            SELECT DISTINCT ON (pair_address)
-                pair_address,
-                LOWER(pair_address) AS pair_lower,
-                item_name,
-                price_vee,
-                reserve_vee,
-                reserve_item,
-                vee_address,
-                item_address,
-                ts
-            FROM gex_snapshots
-            ORDER BY pair_address, ts DESC
+            SELECT
+                s.pair_address,
+                g.item_name,
+                s.price_vee,
+                s.reserve_vee,
+                s.reserve_item,
+                g.vee_address,
+                g.item_address,
+                s.ts
+            FROM gex_pair_state s
+            JOIN gex_pairs g ON g.pair_address = s.pair_address
+            WHERE s.price_vee IS NOT NULL
         ),
         vol24 AS (
             SELECT
-                LOWER(pair_address) AS pair_lower,
-                COALESCE(SUM(vee_amount), 0) AS volume_24h_vee
-            FROM trades_ronin
-            WHERE ts >= NOW() - INTERVAL '24 hours'
-            GROUP BY LOWER(pair_address)
+                g.pair_address,
+                COALESCE(SUM(t.vee_wei), 0) / 2e18 AS volume_24h_vee
+            FROM trades_ronin t
+            JOIN gex_pairs g ON g.pair_id = t.pair_id
+            WHERE t.ts >= NOW() - INTERVAL '24 hours'
+            GROUP BY g.pair_address
         ),
         vol7 AS (
             SELECT
-                LOWER(pair_address) AS pair_lower,
-                COALESCE(SUM(vee_amount), 0) AS volume_7d_vee
-            FROM trades_ronin
-            WHERE ts >= NOW() - INTERVAL '7 days'
-            GROUP BY LOWER(pair_address)
+                g.pair_address,
+                COALESCE(SUM(t.vee_wei), 0) / 2e18 AS volume_7d_vee
+            FROM trades_ronin t
+            JOIN gex_pairs g ON g.pair_id = t.pair_id
+            WHERE t.ts >= NOW() - INTERVAL '7 days'
+            GROUP BY g.pair_address
         )
         SELECT
             l.pair_address,
@@ -101,8 +106,8 @@ def query_latest(conn):
             COALESCE(v24.volume_24h_vee, 0) AS volume_24h_vee,
             COALESCE(v7.volume_7d_vee, 0)   AS volume_7d_vee
         FROM latest l
-        LEFT JOIN vol24 v24 ON v24.pair_lower = l.pair_lower
-        LEFT JOIN vol7  v7  ON v7.pair_lower  = l.pair_lower;
+        LEFT JOIN vol24 v24 ON v24.pair_address = l.pair_address
+        LEFT JOIN vol7  v7  ON v7.pair_address  = l.pair_address;
         """
     )
     rows = cur.fetchall()
@@ -122,20 +127,135 @@ def query_latest(conn):
     return [dict(zip(columns, r)) for r in rows]
 
 
-def get_lp_info(pair_address: str, wallet_checksum: str):
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(pair_address), abi=ABI_ERC20
+def get_wallets(conn):
+    """
+    Włączone portfele z lp_wallets (lowercase). Bez tabeli – sam LP_WALLET.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT to_regclass('lp_wallets') IS NOT NULL")
+    if not cur.fetchone()[0]:
+        cur.close()
+        print("[LP] Brak tabeli lp_wallets (lp_wallets_schema.sql) – tylko LP_WALLET.")
+        return [WALLET]
+    cur.execute(
+        """
+        SELECT wallet_address
+        FROM lp_wallets
+        WHERE enabled = TRUE
+        ORDER BY wallet_address
+        """
     )
-    total = contract.functions.totalSupply().call()
-    bal = contract.functions.balanceOf(wallet_checksum).call()
-
-    if total == 0:
-        return 0.0, 0.0
+    wallets = [r[0] for r in cur.fetchall()]
+    cur.close()
+    return wallets
+
+
+def read_lp_positions(pairs, wallets, block):
+    """
+    totalSupply każdej pary + balanceOf każdego (portfel, para) w jednej
+    rundzie Multicall3 na bloku block (rpc_client.multicall, po
+    MULTICALL_CHUNK wywołań na eth_call) – zamiast 2 × pary × portfele
+    osobnych eth_call. Zwraca {(wallet, pair): (lp_balance, lp_share)}
+    dla par z udanym odczytem (wallet / pair lowercase).
+    """
+    targets = [w3.to_checksum_address(p) for p in pairs]
+    calls = [(t, SEL_TOTAL_SUPPLY) for t in targets]
+    for wallet in wallets:
+        arg = w3.codec.encode(["address"], [w3.to_checksum_address(wallet)])
+        calls.extend((t, SEL_BALANCE_OF + arg) for t in targets)
+    results = rpc_client.multicall(calls, block, w3)
+
+    totals = {}
+    for pair, (ok, ret) in zip(pairs, results[: len(pairs)]):
+        if not ok or len(ret) < 32:
+            print(f"[LP] Błąd przy odczycie totalSupply dla {pair}")
+            continue
+        totals[pair] = int.from_bytes(ret[:32], "big")
+
+    out = {}
+    n = len(pairs)
+    for w, wallet in enumerate(wallets):
+        for i, pair in enumerate(pairs):
+            ok, ret = results[n * (w + 1) + i]
+            total = totals.get(pair)
+            if total is None or not ok or len(ret) < 32:
+                continue
+            bal = int.from_bytes(ret[:32], "big")
+            if total == 0:
+                out[(wallet, pair)] = (0.0, 0.0)
+                continue
+            total_f = total / 1e18
+            bal_f = bal / 1e18
+            out[(wallet, pair)] = (bal_f, bal_f / total_f if total_f > 0 else 0.0)
+    return out
+
+
+def update_positions(cur, rows, closed):
+    """
+    lp_positions w transakcji zapisu lp_snapshots (now() = ts snapshotu).
+    rows = wiersze lp_snapshots (LP_COLUMNS): otwarta pozycja dostaje nowy
+    ostatni snapshot, a brak otwartej = nowe wejście (entry = ten snapshot).
+    closed = [(wallet, pair)] z odczytanym zerowym balansem: otwarta
+    pozycja się zamyka (reset), następny niezerowy snapshot otwiera nową.
+    """
+    cur.execute("SELECT to_regclass('lp_positions') IS NOT NULL")
+    if not cur.fetchone()[0]:
+        print("[LP] Brak tabeli lp_positions (lp_positions_schema.sql) – pomijam pozycje.")
+        return
 
-    total_f = total / 1e18
-    bal_f = bal / 1e18
-    share = bal_f / total_f if total_f > 0 else 0.0
-    return bal_f, share
+    names = [c for c, _ in LP_COLUMNS]
+    if rows:
+        execute_values(
+            cur,
+            """
+            INSERT INTO lp_positions (
+                wallet_address, pair_address, entry_ts, item_name,
+                entry_price_vee, entry_lp_balance, entry_user_vee, entry_user_item,
+                last_ts, price_vee, lp_balance, user_vee, user_item, lp_apr
+            )
+            SELECT
+                v.wallet_address, v.pair_address, now(), v.item_name,
+                v.price_vee, v.lp_balance, v.user_vee, v.user_item,
+                now(), v.price_vee, v.lp_balance, v.user_vee, v.user_item, v.lp_apr
+            FROM (VALUES %s) AS v (
+                wallet_address, pair_address, item_name,
+                price_vee, lp_balance, user_vee, user_item, lp_apr
+            )
+            ON CONFLICT (wallet_address, pair_address) WHERE closed_ts IS NULL
+            DO UPDATE SET
+                item_name  = EXCLUDED.item_name,
+                last_ts    = EXCLUDED.last_ts,
+                price_vee  = EXCLUDED.price_vee,
+                lp_balance = EXCLUDED.lp_balance,
+                user_vee   = EXCLUDED.user_vee,
+                user_item  = EXCLUDED.user_item,
+                lp_apr     = EXCLUDED.lp_apr
+            """,
+            [
+                tuple(
+                    d[k]
+                    for k in (
+                        "wallet_address", "pair_address", "item_name", "price_vee",
+                        "lp_balance", "user_vee", "user_item", "lp_apr",
+                    )
+                )
+                for d in (dict(zip(names, row)) for row in rows)
+            ],
+            template="(%s, %s, %s, %s::numeric, %s::numeric, %s::numeric, %s::numeric, %s::numeric)",
+        )
+    if closed:
+        execute_values(
+            cur,
+            """
+            UPDATE lp_positions p
+            SET closed_ts = now()
+            FROM (VALUES %s) AS v (wallet_address, pair_address)
+            WHERE p.wallet_address = v.wallet_address
+              AND p.pair_address = v.pair_address
+              AND p.closed_ts IS NULL
+            """,
+            closed,
+        )
 
 
 def main():
@@ -152,21 +272,33 @@ def main():
         return
     cur.close()
 
-    wallet_checksum = w3.to_checksum_address(WALLET)
+    wallets = get_wallets(conn)
     latest = query_latest(conn)
+    conn.commit()
+
+    # wszystkie portfele i pary z jednego bloku
+    block = w3.eth.block_number
+    pairs = [row["pair_address"].lower() for row in latest]
+    try:
+        positions = read_lp_positions(pairs, wallets, block) if wallets else {}
+    except Exception as e:
+        print(f"[LP] Błąd przy odczycie LP (blok {block}): {e}")
+        positions = {}
+    print(f"[LP] Blok {block}: {len(wallets)} portfeli × {len(pairs)} par")
 
     rows_to_insert = []
+    closed = []
 
-    for row in latest:
-        pair = row["pair_address"]
-        try:
-            lp_balance, lp_share = get_lp_info(pair, wallet_checksum)
-        except Exception as e:
-            print(f"[LP] Błąd przy odczycie LP dla {pair}: {e}")
+    for wallet, row in [(w, r) for w in wallets for r in latest]:
+        pair = row["pair_address"].lower()
+        position = positions.get((wallet, pair))
+        if position is None:
             continue
+        lp_balance, lp_share = position
 
         if lp_share < LP_MIN_SHARE:
-            continue  # praktycznie brak pozycji
+            closed.append((wallet, pair))  # praktycznie brak pozycji
+            continue
 
         reserve_vee = float(row["reserve_vee"] or 0)
         reserve_item = float(row["reserve_item"] or 0)
@@ -188,7 +320,7 @@ def main():
 
         rows_to_insert.append(
             (
-                WALLET,
+                wallet,
                 pair,
                 row["item_name"],
                 price_vee,
@@ -206,36 +338,18 @@ def main():
             )
         )
 
+    cur = conn.cursor()
+    loader = bulk_load.BulkLoader("lp_snapshots", LP_COLUMNS)
+    if rows_to_insert:
+        loader.add(rows_to_insert)
+        loader.flush(cur)
+    update_positions(cur, rows_to_insert, closed)
+    conn.commit()
+    loader.committed()
+    cur.close()
     if rows_to_insert:
-        cur = conn.cursor()
-        execute_batch(
-            cur,
-            """
-            INSERT INTO lp_snapshots (
-                wallet_address,
-                pair_address,
-                item_name,
-                price_vee,
-                reserve_vee,
-                reserve_item,
-                lp_balance,
-                lp_share,
-                user_vee,
-                user_item,
-                volume_24h_vee,
-                volume_7d_vee,
-                lp_earn_vee_24h,
-                lp_earn_vee_7d,
-                lp_apr
-            ) VALUES (
-                %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s
-            )
-            """,
-            rows_to_insert,
-        )
-        conn.commit()
-        cur.close()
         print(f"[LP] Zapisano {len(rows_to_insert)} snapshotów LP.")
+        loader.report("[LP]")
 
     # unlock
     cur = conn.cursor()
@@ -243,6 +357,7 @@ def main():
     conn.commit()
     cur.close()
     conn.close()
+    rpc_client.get_client().report("[LP]")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
 import os
-import json
-import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import psycopg2
 from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware  # <– DODAJ TEN IMPORT
+
+import pair_snapshots
+import rpc_client
 
 load_dotenv()
 
@@ -21,57 +21,73 @@ DB_PARAMS = {
 }
 
 # === KONFIGURACJA BLOCKCHAIN (ZAWSZE HTTP) ===
-RPC_DEFAULT = "https://ronin-mainnet.g.alchemy.com/v2/IJPvvQ6YdcbcF85OD8jNsjBrpGo3-Xh0"
-RPC_RAW = os.getenv("RONIN_RPC", RPC_DEFAULT)
-
-# jeśli wpiszesz kiedyś w .env wss://..., to tu się zamieni na https://
-if RPC_RAW.startswith("wss://"):
-    RPC_HTTP = "https://" + RPC_RAW.removeprefix("wss://")
-else:
-    RPC_HTTP = RPC_RAW
-
-w3 = Web3(Web3.HTTPProvider(RPC_HTTP))
-
-# Ronin = POA, więc dokładnie jak w server.py
-try:
-    w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-except Exception:
-    # jak już wstrzyknięte / nie trzeba – olewamy
-    pass
-
-# === ABI: UNISWAP V2 PAIR ===
-ABI_PAIR = json.loads("""
-[
-  {
-    "constant": true,
-    "inputs": [],
-    "name": "getReserves",
-    "outputs": [
-      {"internalType":"uint112","name":"_reserve0","type":"uint112"},
-      {"internalType":"uint112","name":"_reserve1","type":"uint112"},
-      {"internalType":"uint32","name":"_blockTimestampLast","type":"uint32"}
-    ],
-    "stateMutability": "view",
-    "type": "function"
-  },
-  {
-    "constant": true,
-    "inputs": [],
-    "name": "token0",
-    "outputs": [{"internalType":"address","name":"","type":"address"}],
-    "stateMutability": "view",
-    "type": "function"
-  },
-  {
-    "constant": true,
-    "inputs": [],
-    "name": "token1",
-    "outputs": [{"internalType":"address","name":"","type":"address"}],
-    "stateMutability": "view",
-    "type": "function"
-  }
+# RONIN_RPC (lista z failoverem), limit zapytań, retry, POA – rpc_client.py
+w3 = rpc_client.get_web3()
+
+# === MULTICALL3 ===
+# wszystkie getReserves jednej rundy idą w kilku eth_call aggregate3,
+# przypiętych do jednego bloku (rpc_client.multicall, MULTICALL3_ADDRESS /
+# MULTICALL_CHUNK; pusty MULTICALL3_ADDRESS = fallback na osobne eth_call)
+MULTICALL3_ADDRESS = rpc_client.MULTICALL3_ADDRESS
+
+# zapisujemy tylko pary, którym zmieniły się rezerwy od stanu w gex_pair_state,
+# a niezmienione co najwyżej raz na SNAPSHOT_HEARTBEAT_MINUTES (heartbeat –
+# każda godzina w pair_hourly ma close, więc "cena N godzin temu" się
+# znajduje); 0 = zapis wszystkich par w każdej rundzie
+SNAPSHOT_HEARTBEAT_MINUTES = int(os.getenv("SNAPSHOT_HEARTBEAT_MINUTES", "60"))
+
+SEL_GET_RESERVES = Web3.keccak(text="getReserves()")[:4]
+SEL_TOKEN0 = Web3.keccak(text="token0()")[:4]
+SEL_TOKEN1 = Web3.keccak(text="token1()")[:4]
+SEL_BLOCK_TIMESTAMP = Web3.keccak(text="getCurrentBlockTimestamp()")[:4]
+
+# (nazwa, zapytanie "czy już jest", DDL) – patrz ensure_columns()
+# gex_pairs.vee_is_token0 / meta_checked_at: kolejność tokenów i kontrola
+#   bytecode liczone raz na parę (NULL meta_checked_at = niesprawdzona,
+#   NULL vee_is_token0 po sprawdzeniu = para do pominięcia: brak kontraktu
+#   albo brak VEE; ponowne sprawdzenie: meta_checked_at = NULL)
+# gex_snapshots.block_number: blok, na którym runda czytała rezerwy
+#   (ts snapshotu = timestamp tego bloku)
+SCHEMA_ADDITIONS = [
+    (
+        "gex_pairs.vee_is_token0",
+        """
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'gex_pairs' AND column_name = 'vee_is_token0'
+        """,
+        "ALTER TABLE gex_pairs ADD COLUMN IF NOT EXISTS vee_is_token0 boolean",
+    ),
+    (
+        "gex_pairs.meta_checked_at",
+        """
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'gex_pairs' AND column_name = 'meta_checked_at'
+        """,
+        "ALTER TABLE gex_pairs ADD COLUMN IF NOT EXISTS meta_checked_at timestamptz",
+    ),
+    (
+        "gex_snapshots.block_number",
+        """
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'gex_snapshots' AND column_name = 'block_number'
+        """,
+        "ALTER TABLE gex_snapshots ADD COLUMN IF NOT EXISTS block_number bigint",
+    ),
+    (
+        "gex_snapshots_pair_block_idx",
+        """
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'gex_snapshots_pair_block_idx'
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS gex_snapshots_pair_block_idx
+        ON gex_snapshots (pair_address, block_number)
+        """,
+    ),
 ]
-""")
+
+# kanał NOTIFY, na którym server.py unieważnia cache /api/market
+MARKET_NOTIFY_CHANNEL = "gex_market"
 
 # === FUNKCJE POMOCNICZE ===
 
@@ -79,104 +95,262 @@ def connect_db():
     return psycopg2.connect(**DB_PARAMS)
 
 
-def get_active_pairs():
-    with connect_db() as conn, conn.cursor() as cur:
-        cur.execute("""
-            SELECT pair_address, item_name, item_address, vee_address
-            FROM gex_pairs
-            WHERE enabled = TRUE;
-        """)
-        return cur.fetchall()
-
-
-def to_checksum_all(w3, pair_address, item_address, vee_address):
-    pa = w3.to_checksum_address(pair_address)
-    ia = w3.to_checksum_address(item_address) if item_address else None
-    va = w3.to_checksum_address(vee_address) if vee_address else None
-    return pa, ia, va
-
-
-def get_reserves_for_pair(w3, pair_address, item_name, item_address, vee_address):
+def ensure_columns(conn):
+    """
+    Kolumny / indeksy dokładane przez ingest_pairs (SCHEMA_ADDITIONS).
+    ALTER bierze ACCESS EXCLUSIVE nawet przy IF NOT EXISTS, więc DDL
+    puszczamy tylko, gdy katalog mówi, że czegoś brakuje.
+    """
+    cur = conn.cursor()
+    for name, check_sql, ddl in SCHEMA_ADDITIONS:
+        cur.execute(check_sql)
+        if cur.fetchone():
+            continue
+        try:
+            cur.execute(ddl)
+            conn.commit()
+            print(f"Dodane: {name}")
+        except Exception as e:
+            print(f"WARNING: nie mogę dodać {name} ({e})")
+            conn.rollback()
+    conn.commit()
+    cur.close()
+
+
+def get_active_pairs(conn):
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT pair_address, item_name, item_address, vee_address,
+               vee_is_token0, meta_checked_at IS NOT NULL
+        FROM gex_pairs
+        WHERE enabled = TRUE;
+    """)
+    rows = cur.fetchall()
+    cur.close()
+    return rows
+
+
+def check_pair_meta(conn, pairs, block):
     """
-    Pobiera rezerwy i oblicza cenę z 5% markupiem (jak w GEX UI).
+    Jednorazowo dla niesprawdzonych par: token0/token1 przez multicall
+    i zapis vee_is_token0 do gex_pairs. Pusta odpowiedź token0() = pod
+    adresem nie ma bytecode (wywołanie EOA "udaje się", ale nic nie zwraca).
+    Zwraca {pair_address: vee_is_token0 albo None}.
     """
-    pair_address, item_address, vee_address = to_checksum_all(
-        w3, pair_address, item_address, vee_address
+    calls = []
+    for pair_address, *_ in pairs:
+        target = w3.to_checksum_address(pair_address)
+        calls.append((target, SEL_TOKEN0))
+        calls.append((target, SEL_TOKEN1))
+    results = rpc_client.multicall(calls, block, w3)
+
+    checked = {}
+    for n, (pair_address, item_name, item_address, vee_address, *_) in enumerate(pairs):
+        (ok0, ret0), (ok1, ret1) = results[2 * n], results[2 * n + 1]
+        vee_is_token0 = None
+        if not (ok0 and ok1) or len(ret0) < 32 or len(ret1) < 32:
+            print(f"Błąd przy {item_name} [{pair_address}]: brak bytecode / token0() — to nie jest LP.")
+        else:
+            token0 = w3.codec.decode(["address"], ret0)[0].lower()
+            token1 = w3.codec.decode(["address"], ret1)[0].lower()
+            vee = (vee_address or "").lower()
+            if token0 == vee:
+                vee_is_token0 = True
+            elif token1 == vee:
+                vee_is_token0 = False
+            else:
+                print(f"Błąd przy {item_name} [{pair_address}]: LP nie zawiera VEE.")
+        checked[pair_address] = vee_is_token0
+
+    cur = conn.cursor()
+    execute_values(
+        cur,
+        """
+        UPDATE gex_pairs g
+        SET vee_is_token0 = v.vee_is_token0,
+            meta_checked_at = NOW()
+        FROM (VALUES %s) AS v (pair_address, vee_is_token0)
+        WHERE g.pair_address = v.pair_address
+        """,
+        list(checked.items()),
+        template="(%s, %s::boolean)",
     )
+    conn.commit()
+    cur.close()
+    return checked
 
-    code = w3.eth.get_code(pair_address)
-    if code in (b"", b"\x00"):
-        raise RuntimeError(f"{pair_address} nie ma bytecode — to nie jest LP.")
 
-    pair = w3.eth.contract(address=pair_address, abi=ABI_PAIR)
-
-    token0 = pair.functions.token0().call()
-    token1 = pair.functions.token1().call()
-
-    r0, r1, _ = pair.functions.getReserves().call()
+def snapshot_row(ts, block, pair_address, item_name, item_address, vee_address, vee_is_token0, ret):
+    """
+    Wiersz snapshotu z odpowiedzi getReserves() (cena z 5% markupiem
+    jak w GEX UI – pair_snapshots.snapshot_row).
+    """
+    r0, r1, _ = w3.codec.decode(["uint112", "uint112", "uint32"], ret)
     reserve0 = r0 / 1e18
     reserve1 = r1 / 1e18
 
-    if token0.lower() == vee_address.lower():
+    if vee_is_token0:
         reserve_vee = reserve0
         reserve_item = reserve1
-    elif token1.lower() == vee_address.lower():
+    else:
         reserve_vee = reserve1
         reserve_item = reserve0
-    else:
-        raise RuntimeError(f"LP {pair_address} nie zawiera VEE.")
 
-    # === CENY: surowa + 5% markup (jak w GEX UI) ===
-    raw_price = reserve_vee / reserve_item if reserve_item > 0 else 0.0
-    price_vee = raw_price * 1.05  # 5% fee z GEX
-
-    return {
-        "pair_address": pair_address,
-        "item_name": item_name,
-        "price_vee": price_vee,
-        "reserve_vee": reserve_vee,
-        "reserve_item": reserve_item,
-        "vee_address": vee_address,
-        "item_address": item_address
-    }
+    return pair_snapshots.snapshot_row(
+        ts, block, pair_address, item_name, vee_address, item_address,
+        reserve_vee, reserve_item,
+    )
 
 
-def insert_snapshots(rows):
-    if not rows:
-        return
+def read_snapshots(pairs, block):
+    """
+    getReserves wszystkich par jednym (kilkoma) aggregate3 na bloku block
+    – spójny obraz rynku zamiast pętli po parach. W tym samym wywołaniu
+    Multicall3.getCurrentBlockTimestamp() = timestamp bloku (ts snapshotu).
+    Zwraca (snapshoty, ts bloku).
+    """
+    calls = [(w3.to_checksum_address(p[0]), SEL_GET_RESERVES) for p in pairs]
+    if MULTICALL3_ADDRESS:
+        calls.insert(0, (w3.to_checksum_address(MULTICALL3_ADDRESS), SEL_BLOCK_TIMESTAMP))
+    results = rpc_client.multicall(calls, block, w3)
+
+    if MULTICALL3_ADDRESS:
+        ok, ret = results.pop(0)
+        if not ok:
+            raise RuntimeError("Multicall3.getCurrentBlockTimestamp() nie powiodło się")
+        block_ts = w3.codec.decode(["uint256"], ret)[0]
+    else:
+        block_ts = w3.eth.get_block(block)["timestamp"]
+    ts = datetime.fromtimestamp(block_ts, timezone.utc)
 
-    ts = datetime.now(timezone.utc)
-    values = [
-        (
-            ts,
-            r["pair_address"],
-            r["item_name"],
-            r["price_vee"],
-            r["reserve_vee"],
-            r["reserve_item"],
-            r["vee_address"],
-            r["item_address"],
+    snapshots = []
+    for (pair_address, item_name, item_address, vee_address, vee_is_token0), (ok, ret) in zip(
+        pairs, results
+    ):
+        if not ok or len(ret) < 96:
+            print(f"Błąd przy {item_name} [{pair_address}]: getReserves() nie powiodło się")
+            continue
+        snapshots.append(
+            snapshot_row(
+                ts, block, pair_address, item_name, item_address, vee_address,
+                vee_is_token0, ret,
+            )
         )
-        for r in rows
-    ]
-
-    sql = """
-        INSERT INTO gex_snapshots (
-            ts, pair_address, item_name,
-            price_vee,
-            reserve_vee, reserve_item,
-            vee_address, item_address
-        ) VALUES %s
-        ON CONFLICT (pair_address, ts) DO NOTHING;
+    return snapshots, ts
+
+
+def select_changed(conn, rows, ts):
+    """
+    Snapshoty do zapisu: pary ze zmienionymi rezerwami względem
+    gex_pair_state + heartbeat dla niezmienionych, których stan jest starszy
+    niż SNAPSHOT_HEARTBEAT_MINUTES. Zwraca (wiersze, zmienione, heartbeat).
     """
+    if SNAPSHOT_HEARTBEAT_MINUTES <= 0 or not rows:
+        return rows, len(rows), 0
+
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT pair_address, ts, reserve_vee, reserve_item
+        FROM gex_pair_state
+        WHERE pair_address = ANY(%s)
+        """,
+        ([r["pair_address"] for r in rows],),
+    )
+    state = {p: (st, rv, ri) for p, st, rv, ri in cur.fetchall()}
+    conn.commit()
+    cur.close()
+
+    heartbeat = timedelta(minutes=SNAPSHOT_HEARTBEAT_MINUTES)
+    out = []
+    changed = 0
+    beats = 0
+    for r in rows:
+        prev_ts, prev_vee, prev_item = state.get(r["pair_address"], (None, None, None))
+        if prev_ts is None or prev_vee is None or prev_item is None or pair_snapshots.reserves_differ(
+            (float(prev_vee), float(prev_item)), (r["reserve_vee"], r["reserve_item"])
+        ):
+            changed += 1
+        elif ts - prev_ts >= heartbeat:
+            beats += 1
+        else:
+            continue
+        out.append(r)
+    return out, changed, beats
+
+
+def check_against_events(conn, rows, block):
+    """
+    Kontrola spójności ze snapshotami z eventów Sync (ingest_trades.py):
+    jeśli skaner swapów doszedł już do bloku rundy, ostatni snapshot pary
+    <= block musi mieć te same rezerwy co getReserves na tym bloku.
+    Rozjazd = zgubiony event / dziura w skanie; snapshot z pollingu
+    i tak zapisujemy, więc stan pary się naprawia. Zwraca (porównane pary,
+    rozjazdy) albo None, jeśli skaner jeszcze nie doszedł do bloku.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT last_block FROM trades_cursor WHERE id = 1")
+    row = cur.fetchone()
+    if not row or row[0] is None or row[0] < block:
+        cur.close()
+        return None
+
+    cur.execute(
+        """
+        SELECT p.pair_address, s.block_number, s.reserve_vee, s.reserve_item
+        FROM unnest(%s::text[]) AS p (pair_address)
+        CROSS JOIN LATERAL (
+            SELECT block_number, reserve_vee, reserve_item
+            FROM gex_snapshots s
+            WHERE s.pair_address = p.pair_address
+              AND s.block_number <= %s
+            ORDER BY s.block_number DESC
+            LIMIT 1
+        ) s
+        """,
+        ([r["pair_address"] for r in rows], block),
+    )
+    stored = {p: (b, float(rv), float(ri)) for p, b, rv, ri in cur.fetchall()}
+    conn.commit()
+    cur.close()
 
+    compared = 0
+    mismatched = 0
+    for r in rows:
+        prev = stored.get(r["pair_address"])
+        if prev is None:
+            continue
+        compared += 1
+        prev_block, prev_vee, prev_item = prev
+        if pair_snapshots.reserves_differ((prev_vee, prev_item), (r["reserve_vee"], r["reserve_item"])):
+            mismatched += 1
+            print(
+                f"[CHECK] {r['item_name']} [{r['pair_address']}]: rezerwy z bloku "
+                f"{prev_block} ({prev_vee:.6f} / {prev_item:.6f}) != getReserves na {block} "
+                f"({r['reserve_vee']:.6f} / {r['reserve_item']:.6f})"
+            )
+    return compared, mismatched
+
+
+def insert_snapshots(rows, ts):
+    """
+    Snapshoty jednej rundy: wszystkie z tego samego bloku (block_number),
+    ts = timestamp tego bloku, więc da się je łączyć z trades_ronin
+    po block_number. Zapis (gex_snapshots, pair_hourly, gex_pair_state)
+    w pair_snapshots – ten sam co dla snapshotów z eventów Sync.
+    Ceny referencyjne 24h / 7d odświeżane co rundę dla wszystkich par
+    (także tych bez zapisu).
+    """
     with connect_db() as conn, conn.cursor() as cur:
-        execute_values(cur, sql, values)
+        pair_snapshots.write_snapshots(cur, rows)
+        refreshed = pair_snapshots.refresh_reference_prices(cur, ts)
+        if rows or refreshed:
+            cur.execute("SELECT pg_notify(%s, %s)", (MARKET_NOTIFY_CHANNEL, "pairs"))
         conn.commit()
 
     for r in rows:
         raw = r['reserve_vee'] / r['reserve_item'] if r['reserve_item'] > 0 else 0
-        print(f"[{ts}] {r['item_name']}: {r['price_vee']:.6f} VEE (surowa: {raw:.6f})")
+        print(f"[{r['ts']}] {r['item_name']}: {r['price_vee']:.6f} VEE (surowa: {raw:.6f})")
 
 
 def main():
@@ -185,21 +359,41 @@ def main():
         print("Brak połączenia z Ronin RPC!")
         return
 
-    pairs = get_active_pairs()
+    conn = connect_db()
+    ensure_columns(conn)
+    pairs = get_active_pairs(conn)
     if not pairs:
         print("Brak aktywnych par w gex_pairs.")
+        conn.close()
         return
 
-    snapshots = []
-    for pair_address, item_name, item_address, vee_address in pairs:
-        try:
-            data = get_reserves_for_pair(w3, pair_address, item_name, item_address, vee_address)
-            snapshots.append(data)
-        except Exception as e:
-            print(f"Błąd przy {item_name} [{pair_address}]: {e}")
-        time.sleep(0.15)
+    # cała runda czyta stan z jednego bloku
+    block = w3.eth.block_number
+
+    unchecked = [p for p in pairs if not p[5]]
+    checked = check_pair_meta(conn, unchecked, block) if unchecked else {}
+
+    active = []
+    for pair_address, item_name, item_address, vee_address, vee_is_token0, _ in pairs:
+        vee_is_token0 = checked.get(pair_address, vee_is_token0)
+        if vee_is_token0 is None:
+            continue  # nie-LP / bez VEE (sprawdzone wcześniej)
+        active.append((pair_address, item_name, item_address, vee_address, vee_is_token0))
+
+    snapshots, ts = read_snapshots(active, block)
+    print(f"Blok {block} ({ts.isoformat()}): {len(snapshots)}/{len(pairs)} par")
+
+    check = check_against_events(conn, snapshots, block)
+    if check is not None:
+        compared, mismatched = check
+        print(f"[CHECK] Zgodność z eventami Sync: {compared - mismatched}/{compared} par")
+
+    snapshots, changed, beats = select_changed(conn, snapshots, ts)
+    conn.close()
+    print(f"Zapis: {len(snapshots)} par (zmienione: {changed}, heartbeat: {beats})")
 
-    insert_snapshots(snapshots)
+    insert_snapshots(snapshots, ts)
+    rpc_client.get_client().report()
 
 
 if __name__ == "__main__":
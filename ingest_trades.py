@@ -1,16 +1,22 @@
 import os
 import time
 import json
+import asyncio
+import argparse
+import threading
 import traceback
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
-from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
-from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+
+import bulk_load
+import pair_snapshots
+import partitions
+import rpc_client
 
 # ================== CONFIG / INIT ==================
 
@@ -24,20 +30,45 @@ DB_PARAMS = {
     "password": os.getenv("DB_PASS"),
 }
 
-# RPC: używamy tego samego co w server.py, default Alchemy Ronin
-RPC_DEFAULT = "https://ronin-mainnet.g.alchemy.com/v2/IJPvvQ6YdcbcF85OD8jNsjBrpGo3-Xh0"
-RPC_RAW = os.getenv("RONIN_RPC", RPC_DEFAULT)
-if RPC_RAW.startswith("wss://"):
-    RPC_HTTP = "https://" + RPC_RAW.removeprefix("wss://")
-else:
-    RPC_HTTP = RPC_RAW
+# RPC (RONIN_RPC, lista z failoverem, limit, retry) – rpc_client.py.
+# wss:// -> zapytania (get_logs, batch) idą po HTTP tego samego endpointu,
+# a w trybie --follow nowe bloki przychodzą z subskrypcji newHeads po WS
+RPC_WS = rpc_client.RPC_WS_URLS[0] if rpc_client.RPC_WS_URLS else None
 
-w3 = Web3(Web3.HTTPProvider(RPC_HTTP))
-w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+w3 = rpc_client.get_web3()
+RPC = rpc_client.get_client()
 
 TRADES_START_BLOCK_ENV = os.getenv("TRADES_START_BLOCK", "").strip()
-BLOCK_STEP = 10  # bo Alchemy na free tierze ma limit 10 bloków dla eth_getLogs
-VEE_DECIMALS = 18
+# okno eth_getLogs: startowe (10, bo Alchemy na free tierze ma limit 10 bloków),
+# rośnie x2 gdy odpowiedzi są małe, spada o połowę na błędach zakresu/limitu
+BLOCK_STEP = int(os.getenv("TRADES_BLOCK_STEP", "10"))
+BLOCK_STEP_MIN = 1
+BLOCK_STEP_MAX = int(os.getenv("TRADES_BLOCK_STEP_MAX", "2000"))
+# okno rośnie tylko, jeśli odpowiedź miała mniej logów niż to
+TARGET_LOGS_PER_CALL = int(os.getenv("TRADES_TARGET_LOGS", "1000"))
+# ile okien get_logs równolegle w locie
+SCAN_WORKERS = int(os.getenv("TRADES_WORKERS", "4"))
+
+# timestampy bloków: "exact" = każdy blok z RPC (batch JSON-RPC, zapis do
+# block_timestamps), "interpolate" = tylko kotwice co TS_ANCHOR_EVERY bloków,
+# reszta liczona liniowo między kotwicami (Ronin: stały czas bloku)
+TS_MODE = os.getenv("TRADES_TS_MODE", "exact").strip().lower()
+TS_ANCHOR_EVERY = int(os.getenv("TRADES_TS_ANCHOR_EVERY", "1000"))
+RONIN_BLOCK_TIME = 3  # sekundy
+# limit wpisów BLOCK_TS_CACHE (po przekroczeniu czyścimy – źródłem prawdy jest tabela)
+BLOCK_TS_CACHE_MAX = 50000
+# commit (trade'y + kursor) co tyle wierszy albo sekund – przy backfillu
+# duże transakcje, przy --follow i tak commit na końcu każdego skanu
+COMMIT_ROWS = int(os.getenv("TRADES_COMMIT_ROWS", "50000"))
+COMMIT_SECONDS = float(os.getenv("TRADES_COMMIT_SECONDS", "10"))
+# tryb --follow: co ile sekund pytamy o nowy blok (HTTP / gdy WS leży),
+# ile ostatnich bloków sprawdzamy pod kątem reorgu, co ile odświeżamy gex_pairs
+FOLLOW_POLL_SECONDS = float(os.getenv("TRADES_POLL_SECONDS", "3"))
+REORG_DEPTH = int(os.getenv("TRADES_REORG_DEPTH", "30"))
+PAIRS_REFRESH_SECONDS = int(os.getenv("TRADES_PAIRS_REFRESH", "300"))
+# eventy Sync (rezerwy po każdej zmianie) w tym samym eth_getLogs co Swap
+# -> snapshoty w gex_snapshots dokładnie w blokach zmian (0 = tylko swapy)
+SYNC_SNAPSHOTS = os.getenv("TRADES_SYNC_SNAPSHOTS", "1").strip() not in ("0", "false", "no")
 MAX_RETRIES = int(os.getenv("TRADES_MAX_RETRIES", "5"))
 RETRY_SLEEP_BASE = float(os.getenv("TRADES_RETRY_SLEEP", "1.0"))
 
@@ -80,10 +111,49 @@ ABI_PAIR = json.loads(
 SWAP_TOPIC = Web3.to_hex(
     Web3.keccak(text="Swap(address,uint256,uint256,uint256,uint256,address)")
 )
+SYNC_TOPIC = Web3.to_hex(Web3.keccak(text="Sync(uint112,uint112)"))
+SYNC_TOPIC_BYTES = bytes.fromhex(SYNC_TOPIC.removeprefix("0x"))
+
+# filtr topic0 dla eth_getLogs: Swap albo Sync (lista w pozycji = OR)
+LOG_TOPICS = [[SWAP_TOPIC, SYNC_TOPIC]] if SYNC_SNAPSHOTS else [SWAP_TOPIC]
+
+# kolumny trades_ronin dla COPY (binary) w bulk_load
+TRADES_COLUMNS = [
+    ("block_number", "int8"),
+    ("ts", "timestamptz"),
+    ("pair_id", "int4"),
+    ("log_index", "int4"),
+    ("tx_hash", "bytea"),
+    ("vee_wei", "numeric"),
+]
+
+# kanał NOTIFY, na którym server.py unieważnia cache /api/market
+MARKET_NOTIFY_CHANNEL = "gex_market"
 
 PAIR_META_CACHE = {}
 BLOCK_TS_CACHE = {}
 
+# stan adaptacyjnego okna (współdzielony przez wątki skanera)
+SCAN_STATE = {"step": BLOCK_STEP, "ceiling": None}
+SCAN_LOCK = threading.Lock()
+
+# najnowszy blok z subskrypcji newHeads (wątek WS -> pętla --follow)
+HEAD_STATE = {"block": None, "connected": False}
+HEAD_EVENT = threading.Event()
+
+# fragmenty komunikatów RPC oznaczających "za duży zakres / za dużo logów"
+# (bez "rate limit" / "too many requests" – to zwykły retry, nie dzielenie okna)
+RANGE_ERROR_HINTS = (
+    "block range",
+    "range is too",
+    "range too",
+    "too large",
+    "too many results",
+    "more than",
+    "response size",
+    "up to a",
+)
+
 
 # ================== DB HELPERS ==================
 
@@ -94,7 +164,29 @@ def get_conn():
 def ensure_tables(conn):
     cur = conn.cursor()
 
-    # trades_ronin
+    # gex_pairs.pair_id – krótki klucz pary używany w trades_ronin
+    try:
+        cur.execute(
+            """
+            ALTER TABLE gex_pairs
+            ADD COLUMN IF NOT EXISTS pair_id integer GENERATED BY DEFAULT AS IDENTITY;
+            """
+        )
+        cur.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS gex_pairs_pair_id_uniq
+            ON gex_pairs (pair_id);
+            """
+        )
+        conn.commit()
+    except Exception as e:
+        print(f"[INGEST] WARNING: cannot add gex_pairs.pair_id ({e})")
+        conn.rollback()
+
+    # trades_ronin (kompaktowo: pair_id zamiast adresu, tx_hash jako bytea,
+    # vee_wei = surowe VEE in + VEE out w wei; migracja ze starego formatu:
+    # trades_ronin_compact_migration.sql). Partycjonowana miesięcznie po ts,
+    # starą niepartycjonowaną przerabia: python partitions.py --migrate
     cur.execute("SELECT to_regclass('public.trades_ronin')")
     trades_exists = cur.fetchone()[0] is not None
     if not trades_exists:
@@ -102,36 +194,93 @@ def ensure_tables(conn):
             cur.execute(
                 """
                 CREATE TABLE trades_ronin (
-                    id           bigserial PRIMARY KEY,
-                    pair_address text        NOT NULL,
-                    vee_address  text        NOT NULL,
-                    block_number bigint      NOT NULL,
-                    tx_hash      text        NOT NULL,
-                    log_index    integer     NOT NULL,
-                    ts           timestamptz NOT NULL,
-                    vee_amount   numeric(38,18) NOT NULL
-                );
+                    block_number bigint        NOT NULL,
+                    ts           timestamptz   NOT NULL,
+                    pair_id      integer       NOT NULL REFERENCES gex_pairs (pair_id),
+                    log_index    integer       NOT NULL,
+                    tx_hash      bytea         NOT NULL,
+                    vee_wei      numeric(78,0) NOT NULL
+                ) PARTITION BY RANGE (ts);
                 """
             )
+            conn.commit()
         except Exception as e:
             print(f"[INGEST] WARNING: cannot create trades_ronin ({e}), assuming it exists")
+            conn.rollback()
 
-    # indexes (best-effort; may fail if we are not the owner)
+    # indexes + partycje na bieżący i kolejne miesiące
+    # (best-effort; may fail if we are not the owner)
+    try:
+        for ddl in partitions.TABLE_INDEXES["trades_ronin"]:
+            cur.execute(ddl)
+        if partitions.is_partitioned(cur, "trades_ronin"):
+            partitions.ensure_partitions_ahead(cur, "trades_ronin")
+        else:
+            print(
+                "[INGEST] WARNING: trades_ronin nie jest partycjonowana "
+                "(python partitions.py --migrate)"
+            )
+        conn.commit()
+    except Exception as e:
+        print(f"[INGEST] WARNING: cannot create indexes/partitions on trades_ronin ({e})")
+        conn.rollback()
+
+    # pair_hourly (rollup pod /api/market, patrz pair_hourly_schema.sql)
+    try:
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pair_hourly (
+                pair_address  text           NOT NULL,
+                bucket        timestamptz    NOT NULL,
+                volume_vee    numeric(38,18) NOT NULL DEFAULT 0,
+                trade_count   integer        NOT NULL DEFAULT 0,
+                price_open    numeric(38,18),
+                price_high    numeric(38,18),
+                price_low     numeric(38,18),
+                price_close   numeric(38,18),
+                reserve_vee   numeric(38,18),
+                reserve_item  numeric(38,18),
+                last_ts       timestamptz,
+                PRIMARY KEY (pair_address, bucket)
+            );
+            """
+        )
+    except Exception as e:
+        print(f"[INGEST] WARNING: cannot create pair_hourly ({e})")
+        conn.rollback()
+
+    # block_timestamps (trwały cache numer bloku -> timestamp)
     try:
         cur.execute(
             """
-            CREATE UNIQUE INDEX IF NOT EXISTS trades_ronin_unique
-            ON trades_ronin (pair_address, tx_hash, log_index);
+            CREATE TABLE IF NOT EXISTS block_timestamps (
+                block_number bigint      PRIMARY KEY,
+                ts           timestamptz NOT NULL
+            );
             """
         )
+    except Exception as e:
+        print(f"[INGEST] WARNING: cannot create block_timestamps ({e})")
+        conn.rollback()
+
+    # gex_pair_state (stan bieżący pary, patrz gex_pair_state_schema.sql)
+    try:
         cur.execute(
             """
-            CREATE INDEX IF NOT EXISTS trades_ronin_pair_ts_idx
-            ON trades_ronin (pair_address, ts);
+            CREATE TABLE IF NOT EXISTS gex_pair_state (
+                pair_address      text PRIMARY KEY,
+                ts                timestamptz,
+                price_vee         numeric(38,18),
+                reserve_vee       numeric(38,18),
+                reserve_item      numeric(38,18),
+                price_24h_ago     numeric(38,18),
+                price_7d_ago      numeric(38,18),
+                last_trade_block  bigint
+            );
             """
         )
     except Exception as e:
-        print(f"[INGEST] WARNING: cannot create indexes on trades_ronin ({e})")
+        print(f"[INGEST] WARNING: cannot create gex_pair_state ({e})")
         conn.rollback()
 
     # trades_cursor
@@ -154,34 +303,52 @@ def ensure_tables(conn):
 
 def get_pairs(conn):
     """
-    Bierzemy wszystkie pary, które znasz z gex_snapshots
-    (pair_address + vee_address). Duplikaty kasujemy w pythonie.
+    Bierzemy wszystkie pary z gex_pairs (pair_address + vee_address + pair_id).
     """
     cur = conn.cursor()
     cur.execute(
         """
-        SELECT DISTINCT pair_address, vee_address
-        FROM gex_snapshots
+        SELECT pair_address, vee_address, pair_id
+        FROM gex_pairs
+        WHERE vee_address IS NOT NULL
         """
     )
     rows = cur.fetchall()
     cur.close()
 
     pairs = []
-    for pair_address, vee_address in rows:
+    for pair_address, vee_address, pair_id in rows:
         if not pair_address or not vee_address:
             continue
         pairs.append(
             (
                 pair_address.lower(),
                 vee_address.lower(),
+                pair_id,
             )
         )
-    # usuwamy duplikaty
-    pairs = list({(p, v) for p, v in pairs})
     return pairs
 
 
+def get_pair_info(conn):
+    """
+    pair_address -> (item_name, item_address, vee_address) dla włączonych
+    par – do snapshotów z eventów Sync (jak w ingest_pairs.py).
+    """
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT pair_address, item_name, item_address, vee_address
+        FROM gex_pairs
+        WHERE enabled = TRUE
+          AND vee_address IS NOT NULL
+        """
+    )
+    rows = cur.fetchall()
+    cur.close()
+    return {p.lower(): (name, item, vee) for p, name, item, vee in rows if p}
+
+
 def get_last_block(conn):
     cur = conn.cursor()
     cur.execute("SELECT last_block FROM trades_cursor WHERE id = 1")
@@ -218,6 +385,71 @@ def save_last_block(conn, last_block):
     cur.close()
 
 
+def update_pair_hourly(cur, rows):
+    """
+    Przelicza wolumen/liczbę trade'ów w pair_hourly dla godzin dotkniętych
+    przez nowe wiersze. Liczymy od nowa z trades_ronin (po indeksie pair+ts),
+    więc ponowny ingest tych samych bloków nie dubluje wolumenu.
+    """
+    touched = {
+        (r[2], r[1].replace(minute=0, second=0, microsecond=0))
+        for r in rows
+    }
+    if not touched:
+        return
+
+    execute_values(
+        cur,
+        """
+        INSERT INTO pair_hourly (pair_address, bucket, volume_vee, trade_count)
+        SELECT
+            g.pair_address,
+            t.bucket,
+            COALESCE(SUM(tr.vee_wei), 0) / 2e18,
+            COUNT(tr.ts)
+        FROM (VALUES %s) AS t (pair_id, bucket)
+        JOIN gex_pairs g ON g.pair_id = t.pair_id
+        LEFT JOIN trades_ronin tr
+               ON tr.pair_id = t.pair_id
+              AND tr.ts >= t.bucket
+              AND tr.ts <  t.bucket + INTERVAL '1 hour'
+        GROUP BY g.pair_address, t.bucket
+        ON CONFLICT (pair_address, bucket) DO UPDATE SET
+            volume_vee  = EXCLUDED.volume_vee,
+            trade_count = EXCLUDED.trade_count
+        """,
+        sorted(touched),
+        template="(%s::integer, %s::timestamptz)",
+    )
+
+
+def update_pair_state(cur, rows):
+    """
+    gex_pair_state.last_trade_block = najnowszy blok z trade'em per para.
+    """
+    last_block = {}
+    for r in rows:
+        last_block[r[2]] = max(last_block.get(r[2], 0), r[0])
+    if not last_block:
+        return
+
+    execute_values(
+        cur,
+        """
+        INSERT INTO gex_pair_state (pair_address, last_trade_block)
+        SELECT g.pair_address, t.block_number
+        FROM (VALUES %s) AS t (pair_id, block_number)
+        JOIN gex_pairs g ON g.pair_id = t.pair_id
+        ON CONFLICT (pair_address) DO UPDATE SET
+            last_trade_block = GREATEST(
+                gex_pair_state.last_trade_block, EXCLUDED.last_trade_block
+            )
+        """,
+        sorted(last_block.items()),
+        template="(%s::integer, %s::bigint)",
+    )
+
+
 # ================== WEB3 HELPERS ==================
 
 def get_pair_meta(pair_address: str):
@@ -239,43 +471,850 @@ def get_pair_meta(pair_address: str):
     return meta
 
 
-def get_block_timestamp(block_number: int) -> int:
-    cached = BLOCK_TS_CACHE.get(block_number)
-    if cached is not None:
-        return cached
+def fetch_block_timestamps(blocks):
+    """
+    Dokładne timestampy z RPC: jeden batch eth_getBlockByNumber dla wszystkich.
+    """
+    blocks = sorted(blocks)
+    attempt = 0
+    while True:
+        try:
+            results = RPC.batch(
+                [("eth_getBlockByNumber", [hex(b), False]) for b in blocks]
+            )
+            return {b: int(r["timestamp"], 16) for b, r in zip(blocks, results)}
+        except Exception as e:
+            attempt += 1
+            print(
+                f"[INGEST] eth_getBlockByNumber batch ({len(blocks)} bloków) failed "
+                f"(attempt {attempt}/{MAX_RETRIES}): {e}"
+            )
+            if attempt >= MAX_RETRIES:
+                raise
+            time.sleep(min(60.0, RETRY_SLEEP_BASE * attempt))
+
+
+def interpolate_timestamp(block, anchors):
+    """
+    Timestamp bloku z najbliższych znanych kotwic (liniowo między nimi,
+    albo stały czas bloku od jednej kotwicy, jeśli druga nie istnieje).
+    anchors = posortowana lista (block_number, ts).
+    """
+    lo = hi = None
+    for a in anchors:
+        if a[0] <= block:
+            lo = a
+        elif hi is None:
+            hi = a
+            break
+    if lo and hi:
+        return lo[1] + round((block - lo[0]) * (hi[1] - lo[1]) / (hi[0] - lo[0]))
+    if lo:
+        return lo[1] + (block - lo[0]) * RONIN_BLOCK_TIME
+    return hi[1] - (hi[0] - block) * RONIN_BLOCK_TIME
+
+
+def get_block_timestamps(cur, blocks, latest_block=None):
+    """
+    {block_number: unix ts} dla podanych bloków. Kolejność źródeł:
+    pamięć -> tabela block_timestamps -> RPC (jeden batch na wywołanie).
+    W trybie TS_MODE="interpolate" z RPC pobieramy tylko kotwice
+    (wielokrotności TS_ANCHOR_EVERY obejmujące brakujące bloki), a resztę
+    interpolujemy. Dokładne timestampy z RPC zapisujemy do block_timestamps
+    (commit razem z chunkiem trade'ów).
+    """
+    out = {}
+    missing = set()
+    for b in set(blocks):
+        cached = BLOCK_TS_CACHE.get(b)
+        if cached is None:
+            missing.add(b)
+        else:
+            out[b] = cached
+    if not missing:
+        return out
+
+    cur.execute(
+        """
+        SELECT block_number, EXTRACT(EPOCH FROM ts)::bigint
+        FROM block_timestamps
+        WHERE block_number = ANY(%s)
+        """,
+        (sorted(missing),),
+    )
+    for b, ts in cur.fetchall():
+        out[b] = ts
+        missing.discard(b)
+
+    if missing and TS_MODE == "interpolate":
+        anchor_blocks = set()
+        for b in missing:
+            base = b - b % TS_ANCHOR_EVERY
+            anchor_blocks.add(base)
+            if latest_block is None or base + TS_ANCHOR_EVERY <= latest_block:
+                anchor_blocks.add(base + TS_ANCHOR_EVERY)
+
+        cur.execute(
+            """
+            SELECT block_number, EXTRACT(EPOCH FROM ts)::bigint
+            FROM block_timestamps
+            WHERE block_number = ANY(%s)
+            """,
+            (sorted(anchor_blocks),),
+        )
+        anchors = dict(cur.fetchall())
+        to_fetch = anchor_blocks - set(anchors)
+        fetched = fetch_block_timestamps(to_fetch) if to_fetch else {}
+        anchors.update(fetched)
+
+        anchor_list = sorted(anchors.items())
+        interpolated = {b: interpolate_timestamp(b, anchor_list) for b in missing}
+        # kotwice (i bloki, które same są kotwicami) mamy dokładnie
+        for b in missing & set(anchors):
+            interpolated[b] = anchors[b]
+    else:
+        fetched = fetch_block_timestamps(missing) if missing else {}
+        interpolated = {}
+
+    if fetched:
+        execute_values(
+            cur,
+            """
+            INSERT INTO block_timestamps (block_number, ts)
+            VALUES %s
+            ON CONFLICT (block_number) DO NOTHING
+            """,
+            [(b, datetime.fromtimestamp(ts, timezone.utc)) for b, ts in fetched.items()],
+        )
+
+    for b in missing:
+        out[b] = fetched[b] if b in fetched else interpolated[b]
+
+    if len(BLOCK_TS_CACHE) > BLOCK_TS_CACHE_MAX:
+        BLOCK_TS_CACHE.clear()
+    BLOCK_TS_CACHE.update(out)
+    return out
+
+
+# ================== LOG SCANNER ==================
+
+def is_range_error(e) -> bool:
+    msg = str(e).lower()
+    return any(hint in msg for hint in RANGE_ERROR_HINTS)
+
+
+def current_step() -> int:
+    with SCAN_LOCK:
+        return SCAN_STATE["step"]
+
+
+def on_window_ok(size: int, n_logs: int):
+    """
+    Mała odpowiedź na pełnym oknie -> okno x2 (ale poniżej znanego sufitu).
+    """
+    with SCAN_LOCK:
+        step = SCAN_STATE["step"]
+        if n_logs >= TARGET_LOGS_PER_CALL or size < step:
+            return
+        limit = BLOCK_STEP_MAX
+        if SCAN_STATE["ceiling"] is not None:
+            limit = min(limit, SCAN_STATE["ceiling"] - 1)
+        SCAN_STATE["step"] = max(BLOCK_STEP_MIN, min(step * 2, limit))
+
+
+def on_window_too_large(size: int):
+    """
+    Błąd zakresu/limitu na oknie o rozmiarze size -> zapamiętaj sufit, okno /2.
+    """
+    with SCAN_LOCK:
+        ceiling = SCAN_STATE["ceiling"]
+        SCAN_STATE["ceiling"] = size if ceiling is None else min(ceiling, size)
+        SCAN_STATE["step"] = max(BLOCK_STEP_MIN, min(SCAN_STATE["step"], size // 2))
+
+
+def fetch_logs(from_block: int, to_block: int, addresses, topics=None):
+    """
+    eth_getLogs dla [from_block, to_block] z retry. Na błędzie zakresu/limitu
+    dzielimy okno na pół (bez zużywania prób) i sklejamy wyniki.
+    Po MAX_RETRIES zwykłych błędach rzuca wyjątek.
+    topics – filtr topiców (domyślnie LOG_TOPICS: Swap + Sync).
+    """
+    if topics is None:
+        topics = LOG_TOPICS
+    attempt = 0
+    while True:
+        try:
+            logs = w3.eth.get_logs(
+                {
+                    "fromBlock": hex(int(from_block)),
+                    "toBlock": hex(int(to_block)),
+                    "address": addresses,
+                    "topics": topics,
+                }
+            )
+            on_window_ok(to_block - from_block + 1, len(logs))
+            return list(logs)
+        except Exception as e:
+            size = to_block - from_block + 1
+            if size > 1 and is_range_error(e):
+                on_window_too_large(size)
+                mid = from_block + size // 2 - 1
+                return fetch_logs(from_block, mid, addresses, topics) + fetch_logs(
+                    mid + 1, to_block, addresses, topics
+                )
+
+            attempt += 1
+            print(
+                f"[INGEST] get_logs failed for {from_block}-{to_block} "
+                f"(attempt {attempt}/{MAX_RETRIES}): {e}"
+            )
+            if attempt >= MAX_RETRIES:
+                raise
+
+            sleep_for = min(60.0, RETRY_SLEEP_BASE * attempt)
+            print(f"[INGEST] czekam {sleep_for:.1f}s przed kolejną próbą...")
+            time.sleep(sleep_for)
+
+
+class WindowError(Exception):
+    """Okno [from_block, to_block] nie dało się pobrać (po MAX_RETRIES)."""
+
+    def __init__(self, from_block, to_block, error):
+        super().__init__(str(error))
+        self.from_block = from_block
+        self.to_block = to_block
+
+
+def iter_windows(pool, start_block, latest_block, addresses, topics=None):
+    """
+    Okna bloków (start_block, latest_block] jako (from, to, logi), ściśle
+    po kolei. Pobierane równolegle (max SCAN_WORKERS w locie) z adaptacyjnym
+    rozmiarem okna (current_step). Okno, którego nie udało się pobrać ->
+    WindowError, a okna w locie są anulowane (też przy przerwaniu pętli
+    wołającego). Wspólne dla scan() i ingest_lp_events.py.
+    """
+    inflight = {}  # from_block -> (to_block, future)
+    next_from = start_block + 1
+    try:
+        while next_from <= latest_block or inflight:
+            while len(inflight) < SCAN_WORKERS and next_from <= latest_block:
+                window_to = min(next_from + current_step() - 1, latest_block)
+                inflight[next_from] = (
+                    window_to,
+                    pool.submit(fetch_logs, next_from, window_to, addresses, topics),
+                )
+                next_from = window_to + 1
 
-    block = w3.eth.get_block(block_number)
-    ts = int(block["timestamp"])
-    BLOCK_TS_CACHE[block_number] = ts
-    return ts
+            current_from = min(inflight)
+            current_to, future = inflight.pop(current_from)
+            try:
+                logs = future.result()
+            except Exception as e:
+                raise WindowError(current_from, current_to, e)
+            yield current_from, current_to, logs
+    finally:
+        for _, pending in inflight.values():
+            pending.cancel()
 
 
 # ================== CORE INGEST ==================
 
-def decode_swap(log, vee_is_token0: bool):
+# offsety (amountIn, amountOut) nogi VEE w 128-bajtowym data eventu Swap:
+# amount0In | amount1In | amount0Out | amount1Out (po 32 bajty, big-endian)
+SWAP_DATA_SIZE = 128
+VEE_LEG_TOKEN0 = (0, 64)
+VEE_LEG_TOKEN1 = (32, 96)
+
+
+def load_pairs(conn):
+    """
+    Pary z gex_pairs w postaci potrzebnej w pętli: para -> vee / pair_id,
+    lista adresów (checksum) do filtra eth_getLogs i cache "nogi VEE"
+    per adres z logu (uzupełniany leniwie w swap_leg).
+    """
+    pairs = get_pairs(conn)
+    return {
+        "pairs": pairs,
+        "pair_to_vee": {p: v for p, v, _ in pairs},
+        "pair_to_id": {p: pid for p, _, pid in pairs},
+        "addresses": [w3.to_checksum_address(p) for p, _, _ in pairs],
+        "legs": {},
+        "info": get_pair_info(conn),
+        "sync_pairs": {},
+    }
+
+
+def swap_leg(address, ctx):
+    """
+    (pair_id, offset amountIn VEE, offset amountOut VEE) dla adresu pary
+    z logu, albo None jeśli para jest spoza listy / nie ma VEE.
+    Liczone raz na adres (token0/token1 z get_pair_meta).
+    """
+    legs = ctx["legs"]
+    if address in legs:
+        return legs[address]
+
+    pair_addr = address.lower()
+    vee_addr = ctx["pair_to_vee"].get(pair_addr)
+    leg = None
+    if vee_addr:
+        meta = get_pair_meta(pair_addr)
+        if meta["token0"] == vee_addr:
+            leg = (ctx["pair_to_id"][pair_addr],) + VEE_LEG_TOKEN0
+        elif meta["token1"] == vee_addr:
+            leg = (ctx["pair_to_id"][pair_addr],) + VEE_LEG_TOKEN1
+        else:
+            # coś bardzo nie tak, ale nie zabijamy ingestu
+            print(f"[INGEST] WARNING: para {pair_addr} nie ma VEE ({vee_addr}) w token0/token1")
+    legs[address] = leg
+    return leg
+
+
+def split_logs(logs):
+    """
+    Logi okna -> (Swap, Sync) po topic0 (jeden eth_getLogs na oba eventy).
+    """
+    swaps = []
+    syncs = []
+    for log in logs:
+        topics = log.get("topics")
+        if topics and bytes(topics[0]) == SYNC_TOPIC_BYTES:
+            syncs.append(log)
+        else:
+            swaps.append(log)
+    return swaps, syncs
+
+
+def sync_pair(address, ctx):
+    """
+    (pair_address, vee jako token0?) dla adresu pary z logu Sync, albo None
+    jeśli para nie jest włączona / nie ma VEE. Liczone raz na adres
+    (strona VEE z swap_leg).
+    """
+    sync_pairs = ctx["sync_pairs"]
+    if address in sync_pairs:
+        return sync_pairs[address]
+
+    pair_addr = address.lower()
+    target = None
+    if pair_addr in ctx["info"]:
+        leg = swap_leg(address, ctx)
+        if leg is not None:
+            target = (pair_addr, leg[1] == VEE_LEG_TOKEN0[0])
+    sync_pairs[address] = target
+    return target
+
+
+def decode_syncs(logs, ctx, where=""):
+    """
+    Logi Sync okna -> [(block_number, pair_address, reserve_vee_wei, reserve_item_wei)],
+    jeden wiersz na (parę, blok): rezerwy z ostatniego Sync w bloku
+    (najwyższy logIndex) = stan po bloku, tak jak getReserves na tym bloku.
+    data = reserve0 | reserve1 (po 32 bajty, big-endian).
+    """
+    last = {}
+    for log in logs:
+        try:
+            target = sync_pair(log["address"], ctx)
+        except Exception as e:
+            print(f"[INGEST] ERROR reading pair meta in {where}: {e}")
+            traceback.print_exc()
+            continue
+        if target is None:
+            continue
+        data = log["data"]
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix("0x"))
+        if len(data) != 64:
+            print(f"[INGEST] ERROR parsing Sync in {where}: data {len(data)} B zamiast 64")
+            continue
+        key = (int(log["blockNumber"]), target[0])
+        log_index = int(log["logIndex"])
+        prev = last.get(key)
+        if prev is None or log_index > prev[0]:
+            last[key] = (log_index, target[1], data)
+
+    out = []
+    for (block_number, pair_addr), (_, vee_is_token0, data) in sorted(last.items()):
+        reserve0 = int.from_bytes(data[:32], "big")
+        reserve1 = int.from_bytes(data[32:], "big")
+        if vee_is_token0:
+            out.append((block_number, pair_addr, reserve0, reserve1))
+        else:
+            out.append((block_number, pair_addr, reserve1, reserve0))
+    return out
+
+
+def sync_snapshot_rows(syncs, block_ts, ctx):
+    """
+    Wynik decode_syncs + timestampy bloków -> wiersze gex_snapshots.
+    """
+    rows = []
+    for block_number, pair_addr, reserve_vee, reserve_item in syncs:
+        item_name, item_address, vee_address = ctx["info"][pair_addr]
+        rows.append(
+            pair_snapshots.snapshot_row(
+                datetime.fromtimestamp(block_ts[block_number], timezone.utc),
+                block_number,
+                pair_addr,
+                item_name,
+                vee_address,
+                item_address,
+                reserve_vee / 1e18,
+                reserve_item / 1e18,
+            )
+        )
+    return rows
+
+
+def decode_swaps(logs, ctx, where=""):
+    """
+    Logi Swap całego okna -> [(block_number, pair_id, log_index, tx_hash, vee_wei)].
+    vee_wei = VEE in + VEE out w wei (wolumen = vee_wei / 2, żeby nie dublować).
+
+    Bez dekodowania ABI: data wszystkich logów sklejamy w jeden bufor
+    i z memoryview czytamy tylko dwa słowa nogi VEE (int.from_bytes),
+    noga per para jest policzona raz (swap_leg). Pary spoza listy, pary bez
+    VEE, swapy bez VEE i logi z nietypowym data są pomijane.
+    """
+    selected = []
+    payloads = []
+    for log in logs:
+        try:
+            leg = swap_leg(log["address"], ctx)
+        except Exception as e:
+            print(f"[INGEST] ERROR reading pair meta in {where}: {e}")
+            traceback.print_exc()
+            continue
+        if leg is None:
+            continue
+        data = log["data"]
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix("0x"))
+        if len(data) != SWAP_DATA_SIZE:
+            print(f"[INGEST] ERROR parsing log in {where}: data {len(data)} B zamiast 128")
+            continue
+        selected.append((log, leg))
+        payloads.append(data)
+
+    buf = memoryview(b"".join(payloads))
+    from_bytes = int.from_bytes
+    swaps = []
+    for i, (log, (pair_id, off_in, off_out)) in enumerate(selected):
+        base = i * SWAP_DATA_SIZE
+        raw = from_bytes(buf[base + off_in : base + off_in + 32], "big") + from_bytes(
+            buf[base + off_out : base + off_out + 32], "big"
+        )
+        if raw <= 0:
+            continue
+        swaps.append(
+            (
+                int(log["blockNumber"]),
+                pair_id,
+                int(log["logIndex"]),
+                bytes(log["transactionHash"]),
+                raw,
+            )
+        )
+    return swaps
+
+
+def commit_rows(conn, cur, loader, last_block, snapshots):
+    """
+    Zebrane wiersze -> trades_ronin (COPY + merge), pair_hourly,
+    gex_pair_state, snapshoty z Sync -> gex_snapshots (pair_snapshots),
+    kursor = last_block; jeden commit. Zwraca nowe wiersze trade'ów.
+    snapshots jest czyszczona po commicie (jak bufor loadera).
+    """
+    rows = loader.pending
+    inserted = 0
+    if rows:
+        # resync starych bloków może trafić w miesiąc bez partycji
+        partitions.ensure_partitions_for(cur, "trades_ronin", {r[1] for r in rows})
+        inserted = loader.flush(cur)
+        update_pair_hourly(cur, rows)
+        update_pair_state(cur, rows)
+    if snapshots:
+        pair_snapshots.write_snapshots(cur, snapshots)
+    if rows or snapshots:
+        # NOTIFY dochodzi dopiero po commit
+        cur.execute("SELECT pg_notify(%s, %s)", (MARKET_NOTIFY_CHANNEL, "trades"))
+
+    # okna przetworzone (nawet jeśli bez logów) -> przesuwamy cursor
+    save_last_block(conn, last_block)
+    conn.commit()
+    loader.committed()
+    snapshots.clear()
+    return inserted
+
+
+def scan(conn, cur, pool, ctx, start_block, latest_block):
     """
-    Z dekodowanego eventu Swap wylicza ilość VEE.
-    Volume liczymy jako (VEE in + VEE out) / 2, żeby nie dublować wolumenu.
+    Skan bloków (start_block, latest_block]. Okna pobieramy równolegle
+    (max SCAN_WORKERS w locie), ale przetwarzamy ściśle po kolei, a wiersze
+    zbieramy w bulk loaderze i commitujemy razem z kursorem co
+    COMMIT_ROWS / COMMIT_SECONDS – trades_cursor nigdy nie przeskakuje
+    nieprzetworzonego okna, więc po crashu wznawiamy od właściwego bloku.
+    Zwraca (ostatni zapisany blok, liczba logów, wstawione wiersze, ok).
     """
-    amount0_in, amount1_in, amount0_out, amount1_out = w3.codec.decode(
-        ["uint256", "uint256", "uint256", "uint256"],
-        HexBytes(log["data"]),
+    total_inserted = 0
+    total_logs = 0
+    done = start_block
+    pending_to = start_block
+    loader = bulk_load.BulkLoader(
+        "trades_ronin",
+        TRADES_COLUMNS,
+        commit_rows=COMMIT_ROWS,
+        commit_seconds=COMMIT_SECONDS,
     )
+    snapshots = []  # snapshoty z Sync czekające na commit (razem z trade'ami)
 
-    if vee_is_token0:
-        raw = amount0_in + amount0_out
-    else:
-        raw = amount1_in + amount1_out
+    def commit_pending():
+        nonlocal done, total_inserted
+        total_inserted += commit_rows(conn, cur, loader, pending_to, snapshots)
+        done = pending_to
+
+    try:
+        for current_from, current_to, logs in iter_windows(
+            pool, start_block, latest_block, ctx["addresses"]
+        ):
+            if logs:
+                print(f"[INGEST] Bloki {current_from}-{current_to}: {len(logs)} logów")
+            total_logs += len(logs)
+
+            swap_logs, sync_logs = split_logs(logs)
+            swaps = decode_swaps(swap_logs, ctx, f"{current_from}-{current_to}")
+            syncs = decode_syncs(sync_logs, ctx, f"{current_from}-{current_to}")
+
+            try:
+                block_ts = get_block_timestamps(
+                    cur, [sw[0] for sw in swaps] + [sy[0] for sy in syncs], latest_block
+                )
+            except Exception as e:
+                print(
+                    f"[INGEST] Brak timestampów bloków {current_from}-{current_to} ({e}), "
+                    f"przerywam bieg bez aktualizacji kursora."
+                )
+                conn.rollback()
+                return done, total_logs, total_inserted, False
+
+            rows_to_insert = [
+                (
+                    block_number,
+                    datetime.fromtimestamp(block_ts[block_number], timezone.utc),
+                    pair_id,
+                    log_index,
+                    tx_hash,
+                    vee_wei,
+                )
+                for block_number, pair_id, log_index, tx_hash, vee_wei in swaps
+            ]
+
+            loader.add(rows_to_insert)
+            snapshots.extend(sync_snapshot_rows(syncs, block_ts, ctx))
+            pending_to = current_to
+
+            # commit co TRADES_COMMIT_ROWS wierszy / TRADES_COMMIT_SECONDS
+            # (i zawsze na końcu skanu)
+            if loader.due() or current_to >= latest_block:
+                try:
+                    commit_pending()
+                except Exception as e:
+                    print(f"[INGEST] ERROR during insert/update batch: {e}")
+                    conn.rollback()
+                    return done, total_logs, total_inserted, False
+    except WindowError as e:
+        print(
+            f"[INGEST] ZA DUŻO BŁĘDÓW dla bloków {e.from_block}-{e.to_block} ({e}), "
+            f"przerywam bieg (kursor zostaje na ostatnim przetworzonym oknie)."
+        )
+        if pending_to > done:
+            try:
+                commit_pending()
+            except Exception as e2:
+                print(f"[INGEST] ERROR during insert/update batch: {e2}")
+                conn.rollback()
+        return done, total_logs, total_inserted, False
+
+    if loader.rows_total:
+        loader.report("[INGEST]")
+    return done, total_logs, total_inserted, True
+
+
+# ================== FOLLOW / REORG ==================
+
+def sync_fork(cur, syncs, from_block, cursor, min_ts):
+    """
+    Pierwszy blok okna reorga, w którym rezerwy w gex_snapshots nie
+    zgadzają się z eventami Sync w łańcuchu (syncs z decode_syncs), albo
+    None. Stan pary na bloku N = ostatni Sync <= N w oknie, a bez Sync
+    w oknie – ostatni snapshot sprzed okna (starszy niż REORG_DEPTH).
+    Łapie bloki bez Swap (same Mint / Burn / Sync): Sync z łańcucha bez
+    snapshotu albo z innymi rezerwami oraz snapshoty (z Sync i z pollingu)
+    z rezerwami z odrzuconej gałęzi.
+    """
+    chain = {}  # para -> [(blok, reserve_vee, reserve_item)] rosnąco po bloku
+    for block_number, pair_addr, reserve_vee, reserve_item in syncs:
+        chain.setdefault(pair_addr, []).append(
+            (block_number, reserve_vee / 1e18, reserve_item / 1e18)
+        )
+
+    cur.execute(
+        """
+        SELECT block_number, pair_address, reserve_vee, reserve_item
+        FROM gex_snapshots
+        WHERE block_number BETWEEN %s AND %s
+          AND ts >= %s
+        """,
+        (from_block, cursor, min_ts),
+    )
+    stored = {(b, p): (float(rv), float(ri)) for b, p, rv, ri in cur.fetchall()}
+
+    forks = []
+    for pair_addr, events in chain.items():
+        for block_number, reserve_vee, reserve_item in events:
+            prev = stored.get((block_number, pair_addr))
+            if prev is None or pair_snapshots.reserves_differ(prev, (reserve_vee, reserve_item)):
+                forks.append(block_number)
+                break
+
+    pairs = sorted({p for _, p in stored})
+    base = {}
+    if pairs:
+        cur.execute(
+            """
+            SELECT p.pair_address, s.reserve_vee, s.reserve_item
+            FROM unnest(%s::text[]) AS p (pair_address)
+            CROSS JOIN LATERAL (
+                SELECT reserve_vee, reserve_item
+                FROM gex_snapshots s
+                WHERE s.pair_address = p.pair_address
+                  AND s.block_number < %s
+                ORDER BY s.block_number DESC
+                LIMIT 1
+            ) s
+            """,
+            (pairs, from_block),
+        )
+        base = {p: (float(rv), float(ri)) for p, rv, ri in cur.fetchall()}
+    for (block_number, pair_addr), reserves in stored.items():
+        expected = base.get(pair_addr)
+        for event_block, reserve_vee, reserve_item in chain.get(pair_addr, []):
+            if event_block > block_number:
+                break
+            expected = (reserve_vee, reserve_item)
+        if expected is not None and pair_snapshots.reserves_differ(reserves, expected):
+            forks.append(block_number)
+
+    return min(forks) if forks else None
+
+
+def check_reorg(conn, cur, ctx, cursor):
+    """
+    Porównuje swapy z ostatnich REORG_DEPTH bloków (do cursor) w łańcuchu
+    z tym, co jest w trades_ronin, a przy TRADES_SYNC_SNAPSHOTS także
+    eventy Sync z gex_snapshots (sync_fork). Przy różnicy kasuje wszystko
+    od pierwszego różniącego się bloku (trade'y, snapshoty, timestampy),
+    przelicza dotknięte godziny w pair_hourly i cofa kursor – kolejny skan
+    wczyta te bloki od nowa. Zwraca (ewentualnie cofnięty) kursor.
+    """
+    if REORG_DEPTH <= 0 or cursor <= 0:
+        return cursor
+    from_block = max(cursor - REORG_DEPTH + 1, 0)
+
+    swap_logs, sync_logs = split_logs(fetch_logs(from_block, cursor, ctx["addresses"]))
+    on_chain = {
+        (b, pid, li, tx) for b, pid, li, tx, _ in decode_swaps(swap_logs, ctx, "reorg check")
+    }
+
+    # dolne ograniczenie ts (pruning partycji): ts znanego bloku <= from_block,
+    # z zapasem na interpolowane timestampy
+    cur.execute(
+        """
+        SELECT ts - INTERVAL '1 hour'
+        FROM block_timestamps
+        WHERE block_number <= %s
+        ORDER BY block_number DESC
+        LIMIT 1
+        """,
+        (from_block,),
+    )
+    row = cur.fetchone()
+    min_ts = row[0] if row else datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    cur.execute(
+        """
+        SELECT block_number, pair_id, log_index, tx_hash
+        FROM trades_ronin
+        WHERE block_number BETWEEN %s AND %s
+          AND ts >= %s
+        """,
+        (from_block, cursor, min_ts),
+    )
+    stored = {(b, pid, li, bytes(tx)) for b, pid, li, tx in cur.fetchall()}
+
+    diff = on_chain ^ stored
+    forks = [min(k[0] for k in diff)] if diff else []
+    if SYNC_SNAPSHOTS:
+        fork = sync_fork(
+            cur, decode_syncs(sync_logs, ctx, "reorg check"), from_block, cursor, min_ts
+        )
+        if fork is not None:
+            forks.append(fork)
+    if not forks:
+        conn.commit()
+        return cursor
+
+    fork = min(forks)
+    cur.execute(
+        """
+        DELETE FROM trades_ronin
+        WHERE block_number >= %s
+          AND ts >= %s
+        RETURNING block_number, ts, pair_id
+        """,
+        (fork, min_ts),
+    )
+    removed = cur.fetchall()
+    # snapshoty z odrzuconych bloków (Sync i polling) – skan wczyta je od nowa
+    removed_snapshots = pair_snapshots.delete_from_block(cur, fork, min_ts)
+    cur.execute("DELETE FROM block_timestamps WHERE block_number >= %s", (fork,))
+    for b in [b for b in BLOCK_TS_CACHE if b >= fork]:
+        del BLOCK_TS_CACHE[b]
+
+    update_pair_hourly(cur, removed)
+    pair_ids = sorted({r[2] for r in removed})
+    if pair_ids:
+        cur.execute(
+            """
+            UPDATE gex_pair_state s
+            SET last_trade_block = (
+                SELECT MAX(t.block_number) FROM trades_ronin t WHERE t.pair_id = g.pair_id
+            )
+            FROM gex_pairs g
+            WHERE g.pair_address = s.pair_address
+              AND g.pair_id = ANY(%s)
+            """,
+            (pair_ids,),
+        )
+    save_last_block(conn, fork - 1)
+    cur.execute("SELECT pg_notify(%s, %s)", (MARKET_NOTIFY_CHANNEL, "trades"))
+    conn.commit()
+
+    print(
+        f"[FOLLOW] Reorg od bloku {fork}: usunięte {len(removed)} trade'ów "
+        f"i {removed_snapshots} snapshotów, "
+        f"skanuję ponownie od {fork}"
+    )
+    return fork - 1
+
+
+def watch_heads_ws(url):
+    """
+    Wątek: subskrypcja newHeads po WebSocket, numer najnowszego bloku
+    trafia do HEAD_STATE + HEAD_EVENT. Po zerwaniu łączy się ponownie;
+    w tym czasie pętla --follow odpytuje HTTP co FOLLOW_POLL_SECONDS.
+    """
+    async def run():
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(url)) as aw3:
+                    await aw3.eth.subscribe("newHeads")
+                    HEAD_STATE["connected"] = True
+                    print("[FOLLOW] Subskrypcja newHeads po WebSocket")
+                    async for msg in aw3.socket.process_subscriptions():
+                        number = msg["result"]["number"]
+                        if isinstance(number, str):
+                            number = int(number, 16)
+                        HEAD_STATE["block"] = int(number)
+                        HEAD_EVENT.set()
+            except Exception as e:
+                print(f"[FOLLOW] WebSocket: {e}, ponawiam za {RETRY_SLEEP_BASE * 5:.0f}s")
+            HEAD_STATE["connected"] = False
+            await asyncio.sleep(RETRY_SLEEP_BASE * 5)
+
+    asyncio.run(run())
 
-    if raw <= 0:
-        return None
 
-    vee_base = Decimal(raw) / Decimal(2)
-    vee_amount = vee_base / (Decimal(10) ** VEE_DECIMALS)
-    return vee_amount, amount0_in, amount1_in, amount0_out, amount1_out
+def wait_for_head(known_head):
+    """
+    Czeka na blok nowszy niż known_head: z subskrypcji WS (jeśli jest
+    połączona), inaczej odpytuje eth_blockNumber co FOLLOW_POLL_SECONDS.
+    """
+    while True:
+        if HEAD_STATE["connected"]:
+            HEAD_EVENT.wait(timeout=max(FOLLOW_POLL_SECONDS, 30.0))
+            HEAD_EVENT.clear()
+            head = HEAD_STATE["block"]
+            if head is not None and head > known_head:
+                return head
+            # cisza na WS -> dla pewności pytamy HTTP
+        else:
+            time.sleep(FOLLOW_POLL_SECONDS)
+
+        try:
+            head = w3.eth.block_number
+        except Exception as e:
+            print(f"[FOLLOW] eth_blockNumber failed: {e}")
+            continue
+        if head > known_head:
+            return head
+
+
+def follow(conn, cur, pool, ctx):
+    """
+    Tryb demona: stan (połączenie, pary, meta par, cache timestampów, okno
+    skanera) zostaje w pamięci, nowe bloki wczytujemy zaraz po ich pojawieniu
+    się. Przed każdym skanem sprawdzamy ostatnie REORG_DEPTH bloków.
+    """
+    if RPC_WS:
+        threading.Thread(target=watch_heads_ws, args=(RPC_WS,), daemon=True).start()
+
+    cursor = get_last_block(conn)
+    pairs_loaded = time.time()
+    head = w3.eth.block_number
+    print(
+        f"[FOLLOW] Start od bloku {cursor + 1} (head {head}, reorg depth {REORG_DEPTH}, "
+        f"{'WebSocket newHeads' if RPC_WS else f'polling co {FOLLOW_POLL_SECONDS:g}s'})"
+    )
+
+    while True:
+        if time.time() - pairs_loaded > PAIRS_REFRESH_SECONDS:
+            try:
+                fresh = load_pairs(conn)
+                conn.commit()
+                if fresh["pairs"] and (fresh["pairs"], fresh["info"]) != (
+                    ctx["pairs"],
+                    ctx["info"],
+                ):
+                    print(f"[FOLLOW] Zmiana listy par: {len(fresh['pairs'])}")
+                    ctx = fresh
+            except Exception as e:
+                print(f"[FOLLOW] Nie mogę odświeżyć gex_pairs: {e}")
+                conn.rollback()
+            pairs_loaded = time.time()
+            RPC.report("[FOLLOW]")
+
+        if head > cursor:
+            try:
+                cursor = check_reorg(conn, cur, ctx, cursor)
+            except Exception as e:
+                print(f"[FOLLOW] Reorg check failed: {e}")
+                conn.rollback()
+
+            cursor, n_logs, inserted, ok = scan(conn, cur, pool, ctx, cursor, head)
+            if inserted:
+                print(f"[FOLLOW] Do bloku {cursor}: {n_logs} logów, nowe wiersze: ~{inserted}")
+            if conn.closed:
+                raise RuntimeError("połączenie z bazą zamknięte")
+            if not ok:
+                time.sleep(FOLLOW_POLL_SECONDS)
+                continue
+
+        head = wait_for_head(cursor)
 
 
-def ingest():
+def ingest(follow_mode=False):
     conn = get_conn()
     ensure_tables(conn)
 
@@ -290,9 +1329,10 @@ def ingest():
         return
     cur.close()
 
-    pairs = get_pairs(conn)
+    ctx = load_pairs(conn)
+    pairs = ctx["pairs"]
     if not pairs:
-        print("[INGEST] Brak par w gex_snapshots - nie mam czego śledzić.")
+        print("[INGEST] Brak par w gex_pairs - nie mam czego śledzić.")
         # zwalniamy lock przed wyjściem
         cur = conn.cursor()
         cur.execute("SELECT pg_advisory_unlock(987654321)")
@@ -302,14 +1342,20 @@ def ingest():
         return
 
     print(f"[INGEST] Pary do śledzenia: {len(pairs)}")
-    for p, v in pairs:
+    for p, v, _ in pairs:
         print(f"    {p}  (VEE: {v})")
 
-    # mapowanie para -> vee, żeby szybko ogarnąć w pętli
-    pair_to_vee = {p: v for p, v in pairs}
-    pair_addresses_checksum = [
-        w3.to_checksum_address(p) for p, _ in pairs
-    ]
+    cur = conn.cursor()
+    pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+
+    if follow_mode:
+        try:
+            follow(conn, cur, pool, ctx)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if not conn.closed:
+                conn.close()
+        return
 
     latest_block = w3.eth.block_number
     start_block = get_last_block(conn)
@@ -317,8 +1363,8 @@ def ingest():
         print(
             f"[INGEST] Nic do zrobienia (start_block={start_block}, latest={latest_block})"
         )
+        pool.shutdown(wait=True)
         # zwolnij lock i wyjdź
-        cur = conn.cursor()
         cur.execute("SELECT pg_advisory_unlock(987654321)")
         conn.commit()
         cur.close()
@@ -326,132 +1372,21 @@ def ingest():
         return
 
     print(
-        f"[INGEST] Skanuję od bloku {start_block + 1} do {latest_block} (krok {BLOCK_STEP})"
+        f"[INGEST] Skanuję od bloku {start_block + 1} do {latest_block} "
+        f"(okno startowe {current_step()}, max {BLOCK_STEP_MAX}, wątki {SCAN_WORKERS})"
     )
 
-    total_inserted = 0
-    total_logs = 0
-
-    cur = conn.cursor()
-
-    current_from = start_block + 1
-    while current_from <= latest_block:
-        current_to = min(current_from + BLOCK_STEP - 1, latest_block)
-
-        attempt = 0
-        while True:
-            try:
-                logs = w3.eth.get_logs(
-                    {
-                        "fromBlock": hex(int(current_from)),
-                        "toBlock": hex(int(current_to)),
-                        "address": pair_addresses_checksum,
-                        "topics": [SWAP_TOPIC],
-                    }
-                )
-                break  # sukces, wychodzimy z pętli retry
-            except Exception as e:
-                attempt += 1
-                print(
-                    f"[INGEST] get_logs failed for {current_from}-{current_to} "
-                    f"(attempt {attempt}/{MAX_RETRIES}): {e}"
-                )
-                if attempt >= MAX_RETRIES:
-                    print(
-                        f"[INGEST] ZA DUŻO BŁĘDÓW dla bloków {current_from}-{current_to}, "
-                        f"przerywam bieg bez aktualizacji kursora - spróbuję w następnym runie."
-                    )
-                    cur.close()
-                    conn.close()
-                    return
-
-                sleep_for = min(60.0, RETRY_SLEEP_BASE * attempt)
-                print(f"[INGEST] czekam {sleep_for:.1f}s przed kolejną próbą...")
-                time.sleep(sleep_for)
-
-        if logs:
-            print(f"[INGEST] Bloki {current_from}-{current_to}: {len(logs)} logów")
-        total_logs += len(logs)
-
-        rows_to_insert = []
-        for log in logs:
-            try:
-                pair_addr = log["address"].lower()
-                vee_addr = pair_to_vee.get(pair_addr)
-                if not vee_addr:
-                    # para spoza listy - ignorujemy
-                    continue
-
-                meta = get_pair_meta(pair_addr)
-                vee_is_token0 = meta["token0"] == vee_addr
-                vee_is_token1 = meta["token1"] == vee_addr
-                if not (vee_is_token0 or vee_is_token1):
-                    # coś bardzo nie tak, ale nie zabijamy ingestu
-                    continue
-
-                vee_amount_info = decode_swap(log, vee_is_token0=vee_is_token0)
-                if vee_amount_info is None:
-                    continue
-                vee_amount, a0in, a1in, a0out, a1out = vee_amount_info
-
-                block_number = int(log["blockNumber"])
-                ts = get_block_timestamp(block_number)
-
-                tx_hash = log["transactionHash"].hex()
-                log_index = int(log["logIndex"])
-
-                rows_to_insert.append(
-                    (
-                        pair_addr,
-                        vee_addr,
-                        block_number,
-                        tx_hash,
-                        log_index,
-                        datetime.fromtimestamp(ts, timezone.utc),
-                        str(vee_amount),
-                    )
-                )
-            except Exception as e:
-                print(
-                    f"[INGEST] ERROR parsing log in {current_from}-{current_to}: {e}"
-                )
-                traceback.print_exc()
-                continue
-
-        try:
-            if rows_to_insert:
-                execute_batch(
-                    cur,
-                    """
-                    INSERT INTO trades_ronin (
-                        pair_address,
-                        vee_address,
-                        block_number,
-                        tx_hash,
-                        log_index,
-                        ts,
-                        vee_amount
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (pair_address, tx_hash, log_index) DO NOTHING
-                    """,
-                    rows_to_insert,
-                )
-                total_inserted += cur.rowcount
-
-            # chunk przetworzony (nawet jeśli bez logów) -> przesuwamy cursor
-            save_last_block(conn, current_to)
-            conn.commit()
-        except Exception as e:
-            print(f"[INGEST] ERROR during insert/update batch: {e}")
-            conn.rollback()
-            cur.close()
-            conn.close()
-            return
-
-        current_from = current_to + 1
+    _, total_logs, total_inserted, ok = scan(
+        conn, cur, pool, ctx, start_block, latest_block
+    )
+    pool.shutdown(wait=True)
+    if not ok:
+        print("[INGEST] Bieg przerwany - spróbuję w następnym runie.")
+        cur.close()
+        conn.close()
+        return
 
     # zwolnij advisory lock
-    cur = conn.cursor()
     cur.execute("SELECT pg_advisory_unlock(987654321)")
     conn.commit()
     cur.close()
@@ -461,11 +1396,19 @@ def ingest():
     print(
         f"[INGEST] Zakończone. Znalazłem {total_logs} logów, wstawione nowe wiersze: ~{total_inserted}"
     )
+    RPC.report("[INGEST]")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="tryb demona: śledź nowe bloki na bieżąco (zamiast timera co 30 min)",
+    )
+    args = parser.parse_args()
     try:
-        ingest()
+        ingest(follow_mode=args.follow)
     except KeyboardInterrupt:
         print("[INGEST] Przerwane przez użytkownika.")
     except Exception as e:
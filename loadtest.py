@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Prosty load test API: N równoległych klientów (asyncio, keep-alive HTTP/1.1,
+bez dodatkowych zależności) wali w podane endpointy przez zadany czas
+i wypisuje req/s + latencje.
+
+Przykład:
+    python loadtest.py --clients 200 --duration 30 \
+        --path /api/market --path /api/market/0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0
+"""
+import argparse
+import asyncio
+import os
+import time
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API_BASE = os.getenv("API_BASE", "http://127.0.0.1:8000")
+
+
+def percentile(sorted_vals, p):
+    if not sorted_vals:
+        return 0.0
+    k = min(int(len(sorted_vals) * p), len(sorted_vals) - 1)
+    return sorted_vals[k]
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    status = int(status_line.split()[1])
+
+    length = 0
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value.strip())
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length:
+        await reader.readexactly(length)
+    return status
+
+
+async def client_loop(host, port, paths, stop_at, results, idx):
+    reader = writer = None
+    i = idx
+    while time.monotonic() < stop_at:
+        path = paths[i % len(paths)]
+        i += 1
+        t0 = time.monotonic()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(
+                f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1")
+            )
+            status = await asyncio.wait_for(read_response(reader), timeout=60)
+        except Exception:
+            results["errors"] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            continue
+
+        if status >= 400:
+            results["errors"] += 1
+            continue
+        results["latencies"].append(time.monotonic() - t0)
+
+    if writer is not None:
+        writer.close()
+
+
+async def run(args):
+    base = urlsplit(args.base)
+    host = base.hostname
+    port = base.port or 80
+    paths = args.paths or ["/api/market"]
+    results = {"latencies": [], "errors": 0}
+
+    started = time.monotonic()
+    stop_at = started + args.duration
+    await asyncio.gather(
+        *(
+            client_loop(host, port, paths, stop_at, results, n)
+            for n in range(args.clients)
+        )
+    )
+    elapsed = time.monotonic() - started
+
+    lat = sorted(results["latencies"])
+    ok = len(lat)
+    print(f"clients:   {args.clients}")
+    print(f"paths:     {', '.join(paths)}")
+    print(f"duration:  {elapsed:.1f}s")
+    print(f"requests:  {ok} ok, {results['errors']} errors")
+    print(f"rps:       {ok / elapsed:.1f}")
+    print(
+        "latency:   p50 {:.0f} ms | p95 {:.0f} ms | p99 {:.0f} ms".format(
+            percentile(lat, 0.50) * 1000,
+            percentile(lat, 0.95) * 1000,
+            percentile(lat, 0.99) * 1000,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base", default=API_BASE)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--path", action="append", dest="paths")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
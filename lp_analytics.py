@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Analityka pozycji LP (IL, IL annualized, net_effective_pct, wartości USD,
+target_weight) dla wielu portfeli naraz. Wspólne dla:
+
+- /api/lp/{wallet}/il – jeden portfel,
+- /api/lp/il/bulk – wiele portfeli jednym zapytaniem (dashboard).
+
+Wejście to kolumny (wiersze z bazy transponowane przez zip(*rows)), każda
+wielkość liczona jednym przebiegiem po kolumnach, wagi z sum per portfel
+(słownik, bez szukania po liście wyników). Cena VEE/USD przychodzi
+z zewnątrz – jedna na całe wywołanie. Bez numpy (nie ma go w
+requirements) – przebiegi to list comprehension na floatach.
+"""
+from datetime import datetime
+
+# kolumny wejścia, w tej kolejności SELECT w query_lp_positions*
+POSITION_COLUMNS = [
+    "wallet_address",
+    "pair_address",
+    "item_name",
+    "entry_ts",
+    "entry_user_vee",
+    "entry_user_item",
+    "last_ts",
+    "price_vee",
+    "user_vee",
+    "user_item",
+    "lp_apr",
+]
+
+# klucze wyniku per pozycja (format /api/lp/{wallet}/il)
+RESULT_KEYS = [
+    "pair_address",
+    "item_name",
+    "entry_ts",
+    "current_ts",
+    "days_in_position",
+    "entry_user_vee",
+    "entry_user_item",
+    "current_user_vee",
+    "current_user_item",
+    "price_vee_now",
+    "value_hodl_vee",
+    "value_lp_vee",
+    "il_vee",
+    "il_pct",
+    "il_annualized_pct",
+    "lp_apr",
+    "net_effective_pct",
+    "il_usd",
+    "value_hodl_usd",
+    "value_lp_usd",
+    "target_weight",
+]
+
+
+def to_columns(positions):
+    """
+    Lista dictów pozycji -> {kolumna: lista}.
+    """
+    return {c: [p.get(c) for p in positions] for c in POSITION_COLUMNS}
+
+
+def rows_to_columns(rows):
+    """
+    Wiersze (krotki / Recordy w kolejności POSITION_COLUMNS) -> {kolumna: lista}.
+    """
+    if not rows:
+        return {c: [] for c in POSITION_COLUMNS}
+    return dict(zip(POSITION_COLUMNS, map(list, zip(*rows))))
+
+
+def as_float(values):
+    return [float(v) if v is not None else 0.0 for v in values]
+
+
+def iso_column(values):
+    """
+    isoformat() po kolumnie – ts snapshotu jest wspólny dla całej rundy
+    ingest_lp_snapshots (wszystkie portfele i pary), więc liczymy raz na wartość.
+    """
+    seen = {}
+    out = []
+    for ts in values:
+        s = seen.get(ts)
+        if s is None:
+            s = seen[ts] = ts.isoformat() if isinstance(ts, datetime) else ts
+        out.append(s)
+    return out
+
+
+def days_between(t0, t1) -> float:
+    try:
+        return max((t1 - t0).total_seconds() / 86400.0, 0.0)
+    except Exception:
+        return 0.0
+
+
+def analyze(cols, vee_usd=None, prices=None, min_days_annualized=3.0):
+    """
+    Kolumny pozycji (to_columns / rows_to_columns) -> {wallet_address:
+    [wynik per pozycja]}, wynik w formacie
+    /api/lp/{wallet}/il (posortowany po net_effective_pct malejąco,
+    target_weight = udział w sumie dodatnich net_effective_pct portfela).
+
+    IL w VEE (jak calc_il w server.py):
+    value_hodl = entry_vee + entry_item * price_now
+    value_lp   = cur_vee   + cur_item   * price_now
+    il_vee     = value_lp - value_hodl
+    prices (pair_address -> price_vee) – cena bieżąca zamiast price_vee
+    z pozycji (tryb "na bloku N").
+    """
+    n = len(cols["pair_address"])
+
+    entry_vee = as_float(cols["entry_user_vee"])
+    entry_item = as_float(cols["entry_user_item"])
+    cur_vee = as_float(cols["user_vee"])
+    cur_item = as_float(cols["user_item"])
+    price = as_float(cols["price_vee"])
+    if prices:
+        price = [
+            float(prices[p]) if prices.get(p) is not None else x
+            for p, x in zip(cols["pair_address"], price)
+        ]
+
+    value_hodl = [v + i * p for v, i, p in zip(entry_vee, entry_item, price)]
+    value_lp = [v + i * p for v, i, p in zip(cur_vee, cur_item, price)]
+    il_vee = [lp - h if h > 0 else 0.0 for lp, h in zip(value_lp, value_hodl)]
+    il_pct = [il / h * 100.0 if h > 0 else 0.0 for il, h in zip(il_vee, value_hodl)]
+
+    days = [days_between(t0, t1) for t0, t1 in zip(cols["entry_ts"], cols["last_ts"])]
+    # annualizacja tylko jeśli pozycja jest starsza niż min_days_annualized
+    il_ann = [
+        None if d <= 0 or d < min_days_annualized else pct * (365.0 / max(d, 1e-6))
+        for pct, d in zip(il_pct, days)
+    ]
+
+    lp_apr = [float(a) if a is not None else None for a in cols["lp_apr"]]
+    net = [
+        a + ann if a is not None and ann is not None else a
+        for a, ann in zip(lp_apr, il_ann)
+    ]
+
+    if vee_usd and vee_usd > 0:
+        il_usd = [x * vee_usd for x in il_vee]
+        hodl_usd = [x * vee_usd for x in value_hodl]
+        lp_usd = [x * vee_usd for x in value_lp]
+    else:
+        il_usd = hodl_usd = lp_usd = [None] * n
+
+    wallets = cols["wallet_address"]
+    score = {}
+    for w, x in zip(wallets, net):
+        if x is not None and x > 0:
+            score[w] = score.get(w, 0.0) + x
+    weight = [
+        x / score[w] if x is not None and x > 0 else 0.0
+        for w, x in zip(wallets, net)
+    ]
+
+    entry_iso = iso_column(cols["entry_ts"])
+    last_iso = iso_column(cols["last_ts"])
+
+    out = {}
+    for row in zip(
+        wallets, cols["pair_address"], cols["item_name"], entry_iso, last_iso,
+        days, entry_vee, entry_item, cur_vee, cur_item, price, value_hodl,
+        value_lp, il_vee, il_pct, il_ann, lp_apr, net, il_usd, hodl_usd,
+        lp_usd, weight,
+    ):
+        results = out.get(row[0])
+        if results is None:
+            results = out[row[0]] = []
+        results.append(dict(zip(RESULT_KEYS, row[1:])))
+
+    for results in out.values():
+        results.sort(
+            key=lambda r: (
+                r["net_effective_pct"] is None,
+                -(r["net_effective_pct"] or -1e9),
+            )
+        )
+    return out
+
+
+def summarize(results):
+    """
+    Sumy portfela z wyników analyze(): wartości LP / hodl, IL w VEE i USD,
+    IL % od wartości hodl.
+    """
+    value_lp = sum(r["value_lp_vee"] for r in results)
+    value_hodl = sum(r["value_hodl_vee"] for r in results)
+    il_vee = sum(r["il_vee"] for r in results)
+    usd = [r["il_usd"] for r in results if r["il_usd"] is not None]
+    return {
+        "positions": len(results),
+        "value_lp_vee": value_lp,
+        "value_hodl_vee": value_hodl,
+        "il_vee": il_vee,
+        "il_pct": il_vee / value_hodl * 100.0 if value_hodl > 0 else 0.0,
+        "il_usd": sum(usd) if usd else None,
+    }
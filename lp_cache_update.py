@@ -1,11 +1,12 @@
 import os
 import psycopg2
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
-from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
-import json
 from datetime import datetime
 
+import rpc_client
+from ingest_lp_snapshots import get_wallets, read_lp_positions
+
 load_dotenv()
 
 DB_PARAMS = {
@@ -16,56 +17,21 @@ DB_PARAMS = {
     "password": os.getenv("DB_PASS"),
 }
 
-RPC_DEFAULT = "https://ronin-mainnet.g.alchemy.com/v2/IJPvvQ6YdcbcF85OD8jNsjBrpGo3-Xh0"
-RPC_RAW = os.getenv("RONIN_RPC", RPC_DEFAULT)
-if RPC_RAW.startswith("wss://"):
-    RPC_HTTP = "https://" + RPC_RAW.removeprefix("wss://")
-else:
-    RPC_HTTP = RPC_RAW
-
-w3 = Web3(Web3.HTTPProvider(RPC_HTTP))
-w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-
-ABI_ERC20 = json.loads("""
-[
-  {
-    "constant": true,
-    "inputs": [],
-    "name": "totalSupply",
-    "outputs": [{ "name": "", "type": "uint256" }],
-    "stateMutability": "view",
-    "type": "function"
-  },
-  {
-    "constant": true,
-    "inputs": [{ "name": "owner", "type": "address" }],
-    "name": "balanceOf",
-    "outputs": [{ "name": "", "type": "uint256" }],
-    "stateMutability": "view",
-    "type": "function"
-  }
-]
-""")
-
-# Twój LP wallet – możesz też wrzucić do .env jako LP_WALLET
-WALLET = os.getenv("LP_WALLET", "0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0")
-
+# RONIN_RPC (lista z failoverem), limit zapytań, retry, POA – rpc_client.py
+w3 = rpc_client.get_web3()
 
 def fetch_pairs():
     """
-    Bierzemy ostatnie snapshoty każdej pary z gex_snapshots,
+    Bierzemy aktualny stan każdej pary z gex_pair_state,
     żeby znać aktualne rezerwy VEE / item.
     """
     conn = psycopg2.connect(**DB_PARAMS)
     cur = conn.cursor()
     cur.execute("""
-        SELECT pair_address, item_name, reserve_vee, reserve_item
-        FROM gex_snapshots s
-        WHERE ts = (
-            SELECT MAX(ts)
-            FROM gex_snapshots s2
-            WHERE s2.pair_address = s.pair_address
-        )
+        SELECT s.pair_address, g.item_name, s.reserve_vee, s.reserve_item
+        FROM gex_pair_state s
+        JOIN gex_pairs g ON g.pair_address = s.pair_address
+        WHERE s.price_vee IS NOT NULL
     """)
     rows = cur.fetchall()
     cur.close()
@@ -73,45 +39,98 @@ def fetch_pairs():
     return rows
 
 
-def update_cache():
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
+def fetch_wallets(conn):
+    """
+    Włączone portfele z lp_wallets (bez tabeli – LP_WALLET). Tylko one –
+    /api/market/{wallet} też dociąga na żądanie wyłącznie portfele z lp_wallets.
+    """
+    wallets = get_wallets(conn)
+    conn.commit()
+    return sorted(wallets)
 
-    wallet = Web3.to_checksum_address(WALLET)
 
-    pairs = fetch_pairs()
-    print(f"Found {len(pairs)} pairs to refresh in LP cache.")
+def cache_rows(wallets, pairs, block=None):
+    """
+    Wiersze lp_cache (wallet, pair, item_name, lp_balance, lp_share,
+    user_vee, user_item) dla wszystkich (portfel, para) z jednej rundy
+    Multicall3 na bloku block (domyślnie bieżący).
+    pairs = [(pair_address, item_name, reserve_vee, reserve_item)].
+    Pary bez udanego odczytu pomijamy (zostaje poprzedni wpis).
+    Używane też przez server.py (portfel spoza cache, na żądanie).
+    """
+    if block is None:
+        block = w3.eth.block_number
+    wallets = [w.lower() for w in wallets]
+    positions = read_lp_positions([p[0].lower() for p in pairs], wallets, block)
+
+    rows = []
+    for wallet in wallets:
+        for (pair_address, item_name, reserve_vee, reserve_item) in pairs:
+            position = positions.get((wallet, pair_address.lower()))
+            if position is None:
+                continue
+            bal_f, share = position
+
+            user_vee  = share * float(reserve_vee or 0)
+            user_item = share * float(reserve_item or 0)
+            rows.append((
+                wallet, pair_address.lower(), item_name,
+                bal_f, share, user_vee, user_item,
+            ))
+    return rows
 
-    for (pair_address, item_name, reserve_vee, reserve_item) in pairs:
-        try:
-            pair_checksum = Web3.to_checksum_address(pair_address)
-            contract = w3.eth.contract(address=pair_checksum, abi=ABI_ERC20)
 
-            total = contract.functions.totalSupply().call()
-            bal = contract.functions.balanceOf(wallet).call()
+def store_rows(cur, rows, wallets):
+    """
+    W lp_cache trzymamy tylko otwarte pozycje: upsert wierszy z
+    lp_balance > 0, (portfel, para) odczytane z zerowym balansem usuwamy,
+    tak samo jak wiersze portfeli spoza wallets (wyłączone w lp_wallets).
+    """
+    cur.execute(
+        "DELETE FROM lp_cache WHERE wallet_address <> ALL(%s)",
+        (list(wallets),),
+    )
+    empty = [(r[0], r[1]) for r in rows if not r[3] > 0]
+    if empty:
+        execute_values(cur, """
+            DELETE FROM lp_cache c
+            USING (VALUES %s) AS t (wallet_address, pair_address)
+            WHERE c.wallet_address = t.wallet_address
+              AND c.pair_address = t.pair_address
+        """, empty)
+    rows = [r for r in rows if r[3] > 0]
+    if not rows:
+        return
+    execute_values(cur, """
+        INSERT INTO lp_cache (wallet_address, pair_address, item_name, ts, lp_balance, lp_share, user_vee, user_item)
+        VALUES %s
+        ON CONFLICT (wallet_address, pair_address)
+        DO UPDATE SET
+            ts = NOW(),
+            item_name = EXCLUDED.item_name,
+            lp_balance = EXCLUDED.lp_balance,
+            lp_share = EXCLUDED.lp_share,
+            user_vee = EXCLUDED.user_vee,
+            user_item = EXCLUDED.user_item;
+    """, rows, template="(%s, %s, %s, NOW(), %s, %s, %s, %s)")
 
-            total_f = total / 1e18 if total else 0.0
-            bal_f  = bal / 1e18 if bal else 0.0
-            share  = bal_f / total_f if total_f > 0 else 0.0
 
-            user_vee  = share * float(reserve_vee or 0)
-            user_item = share * float(reserve_item or 0)
+def update_cache():
+    conn = psycopg2.connect(**DB_PARAMS)
+    cur = conn.cursor()
+
+    wallets = fetch_wallets(conn)
+    pairs = fetch_pairs()
+    print(f"Found {len(pairs)} pairs x {len(wallets)} wallets to refresh in LP cache.")
+
+    # totalSupply + balanceOf wszystkich portfeli i par w jednej rundzie Multicall3
+    block = w3.eth.block_number
+    rows = cache_rows(wallets, pairs, block)
+    missing = len(pairs) * len(wallets) - len(rows)
+    if missing:
+        print(f"[ERROR] {missing} pozycji bez odczytu LP z bloku {block}")
 
-            cur.execute("""
-                INSERT INTO lp_cache (pair_address, item_name, ts, lp_balance, lp_share, user_vee, user_item)
-                VALUES (%s, %s, NOW(), %s, %s, %s, %s)
-                ON CONFLICT (pair_address)
-                DO UPDATE SET
-                    ts = NOW(),
-                    item_name = EXCLUDED.item_name,
-                    lp_balance = EXCLUDED.lp_balance,
-                    lp_share = EXCLUDED.lp_share,
-                    user_vee = EXCLUDED.user_vee,
-                    user_item = EXCLUDED.user_item;
-            """, (pair_address, item_name, bal_f, share, user_vee, user_item))
-
-        except Exception as e:
-            print(f"[ERROR] pair {pair_address}: {e}")
+    store_rows(cur, rows, wallets)
 
     conn.commit()
     cur.close()
@@ -122,3 +141,4 @@ if __name__ == "__main__":
     print(f"[{datetime.utcnow()}] Updating LP cache...")
     update_cache()
     print(f"[{datetime.utcnow()}] LP cache updated.")
+    rpc_client.get_client().report()
@@ -0,0 +1,28 @@
+-- lp_cache_wallet_migration.sql
+-- Jednorazowa migracja: lp_cache per portfel, klucz (wallet_address, pair_address).
+-- Dotychczasowe wiersze (jeden portfel, LP_WALLET) dostają jego adres.
+-- /api/market/{wallet} czyta wtedy tylko swój portfel po PK, a
+-- lp_cache_update.py odświeża wszystkie portfele jednym upsertem.
+-- Idempotentna, można puścić ponownie.
+
+BEGIN;
+
+ALTER TABLE lp_cache ADD COLUMN IF NOT EXISTS wallet_address text;
+
+UPDATE lp_cache
+SET wallet_address = LOWER('0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0')
+WHERE wallet_address IS NULL;
+
+ALTER TABLE lp_cache ALTER COLUMN wallet_address SET NOT NULL;
+
+ALTER TABLE lp_cache DROP CONSTRAINT IF EXISTS lp_cache_pkey;
+ALTER TABLE lp_cache ADD  CONSTRAINT lp_cache_pkey
+    PRIMARY KEY (wallet_address, pair_address);
+
+ALTER TABLE lp_cache DROP CONSTRAINT IF EXISTS lp_cache_wallet_address_lower;
+ALTER TABLE lp_cache ADD  CONSTRAINT lp_cache_wallet_address_lower
+    CHECK (wallet_address = LOWER(wallet_address));
+
+COMMIT;
+
+ANALYZE lp_cache;
@@ -0,0 +1,82 @@
+-- lp_ledger_schema.sql
+-- Księga pozycji LP z eventów (ingest_lp_events.py): Mint / Burn / Transfer
+-- tokenu LP par dla portfeli z lp_wallets. Źródłem prawdy jest lp_events,
+-- lp_ledger to jej złożenie (przeliczane od nowa dla dotkniętych par po
+-- każdym commicie i po reorgu). Kwoty w wei (numeric(78,0)) – bez
+-- zaokrągleń, dzielimy dopiero w API.
+
+-- kursor skanera (jak trades_cursor)
+CREATE TABLE IF NOT EXISTS lp_events_cursor (
+    id          integer PRIMARY KEY,
+    last_block  bigint NOT NULL
+);
+
+-- portfele objęte skanem: stan otwarcia (balanceOf) z bloku from_block,
+-- eventy od from_block + 1
+CREATE TABLE IF NOT EXISTS lp_events_wallets (
+    wallet_address  text PRIMARY KEY,
+    from_block      bigint NOT NULL,
+    CONSTRAINT lp_events_wallets_address_lower
+        CHECK (wallet_address = lower(wallet_address))
+);
+
+-- kind: open         – pozycja zastana przy starcie śledzenia (log_index = -1),
+--                      wartość = udział w rezerwach na from_block
+--       mint / burn  – Mint / Burn pary, kwoty z eventu
+--       transfer_in / transfer_out – przeniesienie LP (counterparty), wartość =
+--                      udział w rezerwach na końcu bloku (NULL, jeśli RPC nie
+--                      ma stanu z tego bloku)
+CREATE TABLE IF NOT EXISTS lp_events (
+    pair_address    text NOT NULL,
+    block_number    bigint NOT NULL,
+    log_index       integer NOT NULL,
+    wallet_address  text NOT NULL,
+    ts              timestamptz NOT NULL,
+    tx_hash         bytea,
+    kind            text NOT NULL,
+    counterparty    text,
+    lp_wei          numeric(78,0) NOT NULL,
+    vee_wei         numeric(78,0),
+    item_wei        numeric(78,0),
+    PRIMARY KEY (pair_address, block_number, log_index, wallet_address),
+    CONSTRAINT lp_events_kind
+        CHECK (kind IN ('open', 'mint', 'burn', 'transfer_in', 'transfer_out')),
+    CONSTRAINT lp_events_address_lower
+        CHECK (wallet_address = lower(wallet_address) AND pair_address = lower(pair_address))
+);
+
+-- reorg: kasowanie od bloku
+CREATE INDEX IF NOT EXISTS lp_events_block_idx
+ON lp_events (block_number);
+
+-- stan pozycji (wallet, para): balans LP + koszt (basis) przypadający na
+-- bieżący balans; basis_liq = sqrt(vee * item) wejścia (do oddzielenia fee
+-- od IL). Zerowy balans = pozycja zamknięta, kolejne wejście liczy się od nowa.
+CREATE TABLE IF NOT EXISTS lp_ledger (
+    wallet_address      text NOT NULL,
+    pair_address        text NOT NULL,
+    lp_wei              numeric(78,0) NOT NULL,
+    basis_vee_wei       numeric(78,0) NOT NULL,
+    basis_item_wei      numeric(78,0) NOT NULL,
+    basis_liq           numeric(78,0) NOT NULL,
+    deposited_vee_wei   numeric(78,0) NOT NULL,
+    deposited_item_wei  numeric(78,0) NOT NULL,
+    withdrawn_vee_wei   numeric(78,0) NOT NULL,
+    withdrawn_item_wei  numeric(78,0) NOT NULL,
+    basis_complete      boolean NOT NULL,
+    entry_ts            timestamptz,
+    entry_block         bigint,
+    last_block          bigint,
+    events              integer NOT NULL,
+    PRIMARY KEY (wallet_address, pair_address)
+);
+
+-- totalSupply LP + rezerwy pary na bloku (po każdym skanie) – z tego
+-- API liczy bieżący udział pozycji
+CREATE TABLE IF NOT EXISTS lp_pair_supply (
+    pair_address      text PRIMARY KEY,
+    block_number      bigint NOT NULL,
+    total_supply_wei  numeric(78,0) NOT NULL,
+    reserve_vee_wei   numeric(78,0) NOT NULL,
+    reserve_item_wei  numeric(78,0) NOT NULL
+);
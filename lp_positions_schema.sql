@@ -0,0 +1,74 @@
+-- lp_positions_schema.sql
+-- Pozycje LP per (portfel, para): snapshot wejścia + ostatni snapshot.
+-- /api/lp/{wallet}/il czyta stąd O(par) wierszy zamiast całej historii
+-- lp_snapshots. Utrzymywane przez ingest_lp_snapshots.py w tej samej
+-- transakcji co zapis lp_snapshots (ts = ts snapshotu).
+-- Reset pozycji: balans spadnie do zera (lp_share < LP_MIN_SHARE) ->
+-- closed_ts; kolejny niezerowy snapshot otwiera nową pozycję (nowe wejście).
+-- Co najwyżej jedna otwarta pozycja na (portfel, para).
+
+CREATE TABLE IF NOT EXISTS lp_positions (
+    wallet_address    text NOT NULL,
+    pair_address      text NOT NULL,
+    entry_ts          timestamptz NOT NULL,
+    closed_ts         timestamptz,
+    item_name         text,
+
+    entry_price_vee   numeric(38,18),
+    entry_lp_balance  numeric(38,18),
+    entry_user_vee    numeric(38,18),
+    entry_user_item   numeric(38,18),
+
+    last_ts           timestamptz NOT NULL,
+    price_vee         numeric(38,18),
+    lp_balance        numeric(38,18),
+    user_vee          numeric(38,18),
+    user_item         numeric(38,18),
+    lp_apr            numeric(38,18),
+
+    PRIMARY KEY (wallet_address, pair_address, entry_ts),
+    CONSTRAINT lp_positions_address_lower
+        CHECK (wallet_address = lower(wallet_address) AND pair_address = lower(pair_address))
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS lp_positions_open_idx
+ON lp_positions (wallet_address, pair_address)
+WHERE closed_ts IS NULL;
+
+-- Jednorazowy backfill z lp_snapshots (idempotentny): jedna otwarta pozycja
+-- na (portfel, para) od pierwszego do ostatniego snapshotu. Zerowych
+-- snapshotów w historii nie ma, więc starych resetów nie da się odtworzyć.
+
+INSERT INTO lp_positions (
+    wallet_address, pair_address, entry_ts, item_name,
+    entry_price_vee, entry_lp_balance, entry_user_vee, entry_user_item,
+    last_ts, price_vee, lp_balance, user_vee, user_item, lp_apr
+)
+SELECT
+    f.wallet_address,
+    f.pair_address,
+    f.ts,
+    l.item_name,
+    f.price_vee,
+    f.lp_balance,
+    f.user_vee,
+    f.user_item,
+    l.ts,
+    l.price_vee,
+    l.lp_balance,
+    l.user_vee,
+    l.user_item,
+    l.lp_apr
+FROM (
+    SELECT DISTINCT ON (wallet_address, pair_address) *
+    FROM lp_snapshots
+    ORDER BY wallet_address, pair_address, ts ASC
+) f
+JOIN (
+    SELECT DISTINCT ON (wallet_address, pair_address) *
+    FROM lp_snapshots
+    ORDER BY wallet_address, pair_address, ts DESC
+) l USING (wallet_address, pair_address)
+ON CONFLICT DO NOTHING;
+
+ANALYZE lp_positions;
@@ -0,0 +1,24 @@
+-- lp_wallets_schema.sql
+-- Rejestr portfeli LP śledzonych przez ingest_lp_snapshots.py (zamiast
+-- jednego LP_WALLET z .env). Adresy lowercase, jak w reszcie bazy.
+-- Wyłączenie portfela: enabled = FALSE (historia w lp_snapshots zostaje).
+
+CREATE TABLE IF NOT EXISTS lp_wallets (
+    wallet_address  text PRIMARY KEY,
+    label           text,
+    enabled         boolean NOT NULL DEFAULT TRUE,
+    added_at        timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT lp_wallets_address_lower
+        CHECK (wallet_address = lower(wallet_address))
+);
+
+-- dotychczasowy LP_WALLET (idempotentne)
+INSERT INTO lp_wallets (wallet_address, label)
+VALUES (lower('0x2aEb84d9b061C850B1F3C8C5200BaE14270D49f0'), 'LP_WALLET')
+ON CONFLICT (wallet_address) DO NOTHING;
+
+-- portfele, które mają już historię w lp_snapshots
+INSERT INTO lp_wallets (wallet_address)
+SELECT DISTINCT wallet_address
+FROM lp_snapshots
+ON CONFLICT (wallet_address) DO NOTHING;
@@ -0,0 +1,61 @@
+-- pair_hourly_schema.sql
+-- Godzinowy rollup per para (utrzymywany przez ingest_trades.py i ingest_pairs.py).
+-- pair_address zawsze lowercase, bucket = pełna godzina UTC.
+-- volume_vee trzymamy tak jak w trades_ronin (połowa in+out), API mnoży *2.
+
+CREATE TABLE IF NOT EXISTS pair_hourly (
+    pair_address  text           NOT NULL,
+    bucket        timestamptz    NOT NULL,
+    volume_vee    numeric(38,18) NOT NULL DEFAULT 0,
+    trade_count   integer        NOT NULL DEFAULT 0,
+    price_open    numeric(38,18),
+    price_high    numeric(38,18),
+    price_low     numeric(38,18),
+    price_close   numeric(38,18),
+    reserve_vee   numeric(38,18),
+    reserve_item  numeric(38,18),
+    last_ts       timestamptz,
+    PRIMARY KEY (pair_address, bucket)
+);
+
+-- Jednorazowy backfill z istniejącej historii (idempotentny, można puścić ponownie).
+
+INSERT INTO pair_hourly (
+    pair_address, bucket,
+    price_open, price_high, price_low, price_close,
+    reserve_vee, reserve_item, last_ts
+)
+SELECT
+    LOWER(pair_address),
+    date_trunc('hour', ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    (array_agg(price_vee ORDER BY ts ASC))[1],
+    MAX(price_vee),
+    MIN(price_vee),
+    (array_agg(price_vee ORDER BY ts DESC))[1],
+    (array_agg(reserve_vee ORDER BY ts DESC))[1],
+    (array_agg(reserve_item ORDER BY ts DESC))[1],
+    MAX(ts)
+FROM gex_snapshots
+GROUP BY 1, 2
+ON CONFLICT (pair_address, bucket) DO UPDATE SET
+    price_open   = EXCLUDED.price_open,
+    price_high   = EXCLUDED.price_high,
+    price_low    = EXCLUDED.price_low,
+    price_close  = EXCLUDED.price_close,
+    reserve_vee  = EXCLUDED.reserve_vee,
+    reserve_item = EXCLUDED.reserve_item,
+    last_ts      = EXCLUDED.last_ts;
+
+-- trades_ronin.vee_wei to surowe VEE in + VEE out w wei -> / 2e18 daje połowę w VEE
+INSERT INTO pair_hourly (pair_address, bucket, volume_vee, trade_count)
+SELECT
+    g.pair_address,
+    date_trunc('hour', t.ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    SUM(t.vee_wei) / 2e18,
+    COUNT(*)
+FROM trades_ronin t
+JOIN gex_pairs g ON g.pair_id = t.pair_id
+GROUP BY 1, 2
+ON CONFLICT (pair_address, bucket) DO UPDATE SET
+    volume_vee  = EXCLUDED.volume_vee,
+    trade_count = EXCLUDED.trade_count;
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Zapis snapshotów par: gex_snapshots + rollup cen w pair_hourly
++ stan bieżący w gex_pair_state. Wspólne dla:
+
+- ingest_pairs.py – polling getReserves (cała runda z jednego bloku),
+- ingest_trades.py – snapshoty z eventów Sync, dokładnie w blokach,
+  w których zmieniły się rezerwy.
+
+Wszystko w transakcji wołającego (commit / NOTIFY robi wołający).
+"""
+from psycopg2.extras import execute_values
+
+import partitions
+
+# cena jak w GEX UI: surowa (rezerwa VEE / rezerwa itemu) + 5% fee
+PRICE_MARKUP = 1.05
+
+
+def snapshot_row(
+    ts, block_number, pair_address, item_name, vee_address, item_address,
+    reserve_vee, reserve_item,
+):
+    """
+    Wiersz gex_snapshots z rezerw (już w jednostkach, nie wei).
+    Adresy w bazie trzymamy zawsze lowercase (checksum tylko do RPC),
+    dzięki temu odczyty robią zwykłe "=" po indeksach.
+    """
+    raw_price = reserve_vee / reserve_item if reserve_item > 0 else 0.0
+    return {
+        "ts": ts,
+        "block_number": block_number,
+        "pair_address": pair_address.lower(),
+        "item_name": item_name,
+        "price_vee": raw_price * PRICE_MARKUP,
+        "reserve_vee": reserve_vee,
+        "reserve_item": reserve_item,
+        "vee_address": vee_address.lower(),
+        "item_address": item_address.lower() if item_address else None,
+    }
+
+
+def reserves_differ(a, b):
+    """
+    (reserve_vee, reserve_item) vs to samo z bazy – numeric(38,18) po
+    przejściu przez float, więc porównanie ze względną tolerancją.
+    """
+    for x, y in zip(a, b):
+        if abs(x - y) > 1e-9 * max(abs(x), abs(y), 1e-18):
+            return True
+    return False
+
+
+def update_hourly_prices(cur, touched, clear_empty=False):
+    """
+    OHLC + ostatnie rezerwy w pair_hourly dla (pair_address, bucket),
+    liczone od nowa z gex_snapshots (po indeksie pair+ts) – snapshoty
+    mogą dochodzić w dowolnej kolejności (polling, Sync z backfillu,
+    kasowanie po reorgu), a wynik i tak jest dokładny.
+    Godziny bez snapshotów (np. po retencji) zostają bez zmian, chyba że
+    clear_empty (reorg skasował całą godzinę) – wtedy ceny / rezerwy
+    zerujemy do NULL, wolumen z trade'ów zostaje.
+    """
+    if not touched:
+        return
+    execute_values(
+        cur,
+        """
+        INSERT INTO pair_hourly (
+            pair_address, bucket,
+            price_open, price_high, price_low, price_close,
+            reserve_vee, reserve_item, last_ts
+        )
+        SELECT
+            t.pair_address,
+            t.bucket,
+            (array_agg(s.price_vee ORDER BY s.ts ASC))[1],
+            MAX(s.price_vee),
+            MIN(s.price_vee),
+            (array_agg(s.price_vee ORDER BY s.ts DESC))[1],
+            (array_agg(s.reserve_vee ORDER BY s.ts DESC))[1],
+            (array_agg(s.reserve_item ORDER BY s.ts DESC))[1],
+            MAX(s.ts)
+        FROM (VALUES %s) AS t (pair_address, bucket)
+        JOIN gex_snapshots s
+          ON s.pair_address = t.pair_address
+         AND s.ts >= t.bucket
+         AND s.ts <  t.bucket + INTERVAL '1 hour'
+        GROUP BY t.pair_address, t.bucket
+        ON CONFLICT (pair_address, bucket) DO UPDATE SET
+            price_open   = EXCLUDED.price_open,
+            price_high   = EXCLUDED.price_high,
+            price_low    = EXCLUDED.price_low,
+            price_close  = EXCLUDED.price_close,
+            reserve_vee  = EXCLUDED.reserve_vee,
+            reserve_item = EXCLUDED.reserve_item,
+            last_ts      = EXCLUDED.last_ts
+        """,
+        sorted(touched),
+        template="(%s, %s::timestamptz)",
+    )
+    if not clear_empty:
+        return
+    execute_values(
+        cur,
+        """
+        UPDATE pair_hourly h
+        SET price_open   = NULL,
+            price_high   = NULL,
+            price_low    = NULL,
+            price_close  = NULL,
+            reserve_vee  = NULL,
+            reserve_item = NULL,
+            last_ts      = NULL
+        FROM (VALUES %s) AS t (pair_address, bucket)
+        WHERE h.pair_address = t.pair_address
+          AND h.bucket = t.bucket
+          AND NOT EXISTS (
+              SELECT 1
+              FROM gex_snapshots s
+              WHERE s.pair_address = t.pair_address
+                AND s.ts >= t.bucket
+                AND s.ts <  t.bucket + INTERVAL '1 hour'
+          )
+        """,
+        sorted(touched),
+        template="(%s, %s::timestamptz)",
+    )
+
+
+# stan bieżący pary (gex_pair_state) – czytany zamiast historii;
+# ceny referencyjne z pair_hourly (ostatni close sprzed 24h / 7d)
+STATE_SQL = """
+    INSERT INTO gex_pair_state (
+        pair_address, ts, price_vee, reserve_vee, reserve_item,
+        price_24h_ago, price_7d_ago
+    )
+    SELECT
+        v.pair_address,
+        v.ts,
+        v.price_vee,
+        v.reserve_vee,
+        v.reserve_item,
+        (
+            SELECT h.price_close
+            FROM pair_hourly h
+            WHERE h.pair_address = v.pair_address
+              AND h.bucket <= v.ts - INTERVAL '24 hours'
+              AND h.price_close IS NOT NULL
+            ORDER BY h.bucket DESC
+            LIMIT 1
+        ),
+        (
+            SELECT h.price_close
+            FROM pair_hourly h
+            WHERE h.pair_address = v.pair_address
+              AND h.bucket <= v.ts - INTERVAL '7 days'
+              AND h.price_close IS NOT NULL
+            ORDER BY h.bucket DESC
+            LIMIT 1
+        )
+    FROM {source}
+    ON CONFLICT (pair_address) DO UPDATE SET
+        ts            = EXCLUDED.ts,
+        price_vee     = EXCLUDED.price_vee,
+        reserve_vee   = EXCLUDED.reserve_vee,
+        reserve_item  = EXCLUDED.reserve_item,
+        price_24h_ago = EXCLUDED.price_24h_ago,
+        price_7d_ago  = EXCLUDED.price_7d_ago
+    {guard}
+"""
+
+
+# ceny referencyjne wszystkich par względem ts rundy. STATE_SQL liczy je
+# tylko przy zapisie pary, a przy zapisie samych zmian para bez ruchu
+# trzymałaby price_24h_ago / price_7d_ago z chwili ostatniego zapisu
+REFERENCE_SQL = """
+    UPDATE gex_pair_state s
+    SET price_24h_ago = r.price_24h_ago,
+        price_7d_ago  = r.price_7d_ago
+    FROM (
+        SELECT
+            p.pair_address,
+            (
+                SELECT h.price_close
+                FROM pair_hourly h
+                WHERE h.pair_address = p.pair_address
+                  AND h.bucket <= %(ts)s - INTERVAL '24 hours'
+                  AND h.price_close IS NOT NULL
+                ORDER BY h.bucket DESC
+                LIMIT 1
+            ) AS price_24h_ago,
+            (
+                SELECT h.price_close
+                FROM pair_hourly h
+                WHERE h.pair_address = p.pair_address
+                  AND h.bucket <= %(ts)s - INTERVAL '7 days'
+                  AND h.price_close IS NOT NULL
+                ORDER BY h.bucket DESC
+                LIMIT 1
+            ) AS price_7d_ago
+        FROM gex_pair_state p
+    ) r
+    WHERE s.pair_address = r.pair_address
+      AND (s.price_24h_ago, s.price_7d_ago)
+          IS DISTINCT FROM (r.price_24h_ago, r.price_7d_ago)
+"""
+
+
+def refresh_reference_prices(cur, ts):
+    """
+    price_24h_ago / price_7d_ago w gex_pair_state dla wszystkich par
+    względem ts (2 odczyty po PK pair_hourly na parę). Zwraca liczbę par,
+    którym ceny referencyjne się zmieniły.
+    """
+    cur.execute(REFERENCE_SQL, {"ts": ts})
+    return cur.rowcount
+
+
+def write_snapshots(cur, rows):
+    """
+    rows = [snapshot_row(...)] (dowolne pary / bloki). gex_snapshots
+    (duplikat pary+ts = ten sam blok z pollingu i z Sync -> pomijamy),
+    przeliczenie dotkniętych godzin w pair_hourly, gex_pair_state
+    z najnowszego wiersza pary (starszy od stanu w bazie nic nie zmienia).
+    """
+    if not rows:
+        return
+
+    # gex_snapshots jest partycjonowana miesięcznie – partycja musi istnieć
+    partitions.ensure_partitions_for(cur, "gex_snapshots", {r["ts"] for r in rows})
+    execute_values(
+        cur,
+        """
+        INSERT INTO gex_snapshots (
+            ts, block_number, pair_address, item_name,
+            price_vee,
+            reserve_vee, reserve_item,
+            vee_address, item_address
+        ) VALUES %s
+        ON CONFLICT (pair_address, ts) DO NOTHING
+        """,
+        [
+            (
+                r["ts"],
+                r["block_number"],
+                r["pair_address"],
+                r["item_name"],
+                r["price_vee"],
+                r["reserve_vee"],
+                r["reserve_item"],
+                r["vee_address"],
+                r["item_address"],
+            )
+            for r in rows
+        ],
+    )
+
+    update_hourly_prices(
+        cur,
+        {
+            (r["pair_address"], r["ts"].replace(minute=0, second=0, microsecond=0))
+            for r in rows
+        },
+    )
+
+    latest = {}
+    for r in rows:
+        cur_latest = latest.get(r["pair_address"])
+        if cur_latest is None or r["ts"] > cur_latest["ts"]:
+            latest[r["pair_address"]] = r
+    execute_values(
+        cur,
+        STATE_SQL.format(
+            source="(VALUES %s) AS v (pair_address, ts, price_vee, reserve_vee, reserve_item)",
+            guard="""
+            WHERE gex_pair_state.ts IS NULL
+               OR gex_pair_state.ts <= EXCLUDED.ts
+            """,
+        ),
+        [
+            (r["pair_address"], r["ts"], r["price_vee"], r["reserve_vee"], r["reserve_item"])
+            for r in latest.values()
+        ],
+        template="(%s, %s::timestamptz, %s::numeric, %s::numeric, %s::numeric)",
+    )
+
+
+def delete_from_block(cur, fork, min_ts):
+    """
+    Reorg: kasuje snapshoty z bloków >= fork (ts >= min_ts – pruning
+    partycji), przelicza dotknięte godziny i cofa gex_pair_state
+    dotkniętych par do najnowszego pozostałego snapshotu.
+    Zwraca liczbę skasowanych snapshotów.
+    """
+    cur.execute(
+        """
+        DELETE FROM gex_snapshots
+        WHERE block_number >= %s
+          AND ts >= %s
+        RETURNING pair_address, ts
+        """,
+        (fork, min_ts),
+    )
+    removed = cur.fetchall()
+    if not removed:
+        return 0
+
+    update_hourly_prices(
+        cur,
+        {(p, ts.replace(minute=0, second=0, microsecond=0)) for p, ts in removed},
+        clear_empty=True,
+    )
+    cur.execute(
+        STATE_SQL.format(
+            source="""
+            unnest(%s::text[]) AS p (pair_address)
+            CROSS JOIN LATERAL (
+                SELECT s.pair_address, s.ts, s.price_vee, s.reserve_vee, s.reserve_item
+                FROM gex_snapshots s
+                WHERE s.pair_address = p.pair_address
+                ORDER BY s.ts DESC
+                LIMIT 1
+            ) v
+            """,
+            guard="",
+        ),
+        (sorted({p for p, _ in removed}),),
+    )
+    return len(removed)
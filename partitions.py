@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Miesięczne partycje (RANGE po ts) dla trades_ronin i gex_snapshots + retencja.
+
+- ensure_partitions_ahead() / ensure_partitions_for() – tworzą brakujące
+  partycje (wołane z ingest_trades.py / ingest_pairs.py przed insertem),
+- compact_and_drop() – stare partycje zwija do pair_hourly i kasuje,
+- migrate_table() – jednorazowa konwersja istniejącej tabeli na partycjonowaną.
+
+Partycje: <tabela>_pYYYY_MM, granice w UTC (pełne godziny nie przechodzą
+przez granicę miesiąca, więc rollup godzinowy z jednej partycji jest pełny).
+
+Uruchamiane np. raz dziennie z timera:
+    python partitions.py            # partycje do przodu + retencja
+    python partitions.py --migrate  # jednorazowo: konwersja starych tabel
+"""
+import argparse
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DB_PARAMS = {
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT"),
+    "dbname": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASS"),
+}
+
+# ile miesięcy do przodu trzymamy gotowe partycje
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "2"))
+# retencja surowych danych w dniach (0 = trzymamy wszystko);
+# starsze partycje są zwijane do pair_hourly i kasowane
+SNAPSHOT_RETENTION_DAYS = int(os.getenv("SNAPSHOT_RETENTION_DAYS", "90"))
+TRADES_RETENTION_DAYS = int(os.getenv("TRADES_RETENTION_DAYS", "0"))
+
+# indeksy zakładane na tabeli-rodzicu (PG propaguje je na partycje);
+# unikalne muszą zawierać klucz partycjonowania (ts)
+TABLE_INDEXES = {
+    "trades_ronin": [
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS trades_ronin_unique
+        ON trades_ronin (pair_id, tx_hash, log_index, ts)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS trades_ronin_pair_ts_idx
+        ON trades_ronin (pair_id, ts)
+        """,
+    ],
+    "gex_snapshots": [
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS gex_snapshots_pair_ts_uniq
+        ON gex_snapshots (pair_address, ts)
+        """,
+    ],
+}
+
+# constrainty, których CREATE TABLE (LIKE ...) nie kopiuje
+TABLE_EXTRA_DDL = {
+    "trades_ronin": [
+        """
+        ALTER TABLE trades_ronin
+        ADD FOREIGN KEY (pair_id) REFERENCES gex_pairs (pair_id)
+        """,
+    ],
+    "gex_snapshots": [],
+}
+
+RETENTION_DAYS = {
+    "trades_ronin": TRADES_RETENTION_DAYS,
+    "gex_snapshots": SNAPSHOT_RETENTION_DAYS,
+}
+
+# rollup partycji do pair_hourly przed skasowaniem ({part} = nazwa partycji)
+ROLLUP_SQL = {
+    "gex_snapshots": """
+        INSERT INTO pair_hourly (
+            pair_address, bucket,
+            price_open, price_high, price_low, price_close,
+            reserve_vee, reserve_item, last_ts
+        )
+        SELECT
+            pair_address,
+            date_trunc('hour', ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            (array_agg(price_vee ORDER BY ts ASC))[1],
+            MAX(price_vee),
+            MIN(price_vee),
+            (array_agg(price_vee ORDER BY ts DESC))[1],
+            (array_agg(reserve_vee ORDER BY ts DESC))[1],
+            (array_agg(reserve_item ORDER BY ts DESC))[1],
+            MAX(ts)
+        FROM {part}
+        GROUP BY 1, 2
+        ON CONFLICT (pair_address, bucket) DO UPDATE SET
+            price_open   = EXCLUDED.price_open,
+            price_high   = EXCLUDED.price_high,
+            price_low    = EXCLUDED.price_low,
+            price_close  = EXCLUDED.price_close,
+            reserve_vee  = EXCLUDED.reserve_vee,
+            reserve_item = EXCLUDED.reserve_item,
+            last_ts      = EXCLUDED.last_ts
+    """,
+    "trades_ronin": """
+        INSERT INTO pair_hourly (pair_address, bucket, volume_vee, trade_count)
+        SELECT
+            g.pair_address,
+            date_trunc('hour', t.ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            SUM(t.vee_wei) / 2e18,
+            COUNT(*)
+        FROM {part} t
+        JOIN gex_pairs g ON g.pair_id = t.pair_id
+        GROUP BY 1, 2
+        ON CONFLICT (pair_address, bucket) DO UPDATE SET
+            volume_vee  = EXCLUDED.volume_vee,
+            trade_count = EXCLUDED.trade_count
+    """,
+}
+
+PARTITION_RE = re.compile(r"_p(\d{4})_(\d{2})$")
+
+# (tabela, miesiąc) już sprawdzone w tym procesie (CREATE scommitowany)
+_READY = set()
+# (tabela, miesiąc) -> txid transakcji, która zrobiła CREATE, a jeszcze nie
+# wiemy, czy się scommitowała (rollback = partycji nie ma, trzeba od nowa)
+_PENDING = {}
+# tabela -> czy jest partycjonowana (cache na czas procesu)
+_PARTITIONED = {}
+
+
+def get_conn():
+    return psycopg2.connect(**DB_PARAMS)
+
+
+def month_start(ts: datetime) -> datetime:
+    ts = ts.astimezone(timezone.utc)
+    return datetime(ts.year, ts.month, 1, tzinfo=timezone.utc)
+
+
+def next_month(month: datetime) -> datetime:
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(cur, table: str) -> bool:
+    if table not in _PARTITIONED:
+        cur.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            (table,),
+        )
+        row = cur.fetchone()
+        _PARTITIONED[table] = bool(row) and row[0] == "p"
+    return _PARTITIONED[table]
+
+
+def create_partition(cur, table: str, month: datetime):
+    """
+    CREATE partycji w transakcji wołającego. Do _READY trafia dopiero, gdy
+    ta transakcja się scommituje (txid_status przy kolejnym wywołaniu) –
+    po rollbacku partycja zostanie utworzona ponownie.
+    """
+    key = (table, month)
+    if key in _READY:
+        return
+    txid = _PENDING.get(key)
+    if txid is not None:
+        cur.execute("SELECT txid_status(%s), txid_current_if_assigned()", (txid,))
+        status, current = cur.fetchone()
+        if status == "committed":
+            _PENDING.pop(key, None)
+            _READY.add(key)
+            return
+        if current == txid:
+            return
+    cur.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {partition_name(table, month)}
+        PARTITION OF {table}
+        FOR VALUES FROM (%s) TO (%s)
+        """,
+        (month, next_month(month)),
+    )
+    cur.execute("SELECT txid_current()")
+    _PENDING[key] = cur.fetchone()[0]
+
+
+def ensure_partitions_for(cur, table: str, timestamps):
+    """
+    Partycje dla miesięcy, w które wpadają podane ts (np. resync starych bloków).
+    Na niepartycjonowanej tabeli nic nie robi.
+    """
+    if not is_partitioned(cur, table):
+        return
+    for month in sorted({month_start(ts) for ts in timestamps}):
+        create_partition(cur, table, month)
+
+
+def ensure_partitions_ahead(cur, table: str, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """
+    Bieżący miesiąc + months_ahead do przodu.
+    """
+    if not is_partitioned(cur, table):
+        return
+    month = month_start(datetime.now(timezone.utc))
+    for _ in range(months_ahead + 1):
+        create_partition(cur, table, month)
+        month = next_month(month)
+
+
+def list_partitions(cur, table: str):
+    """
+    [(miesiąc, nazwa)] partycji tabeli, posortowane od najstarszej.
+    """
+    cur.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        (table,),
+    )
+    out = []
+    for (name,) in cur.fetchall():
+        m = PARTITION_RE.search(name)
+        if m:
+            out.append((datetime(int(m.group(1)), int(m.group(2)), 1, tzinfo=timezone.utc), name))
+    return sorted(out)
+
+
+def compact_and_drop(conn, table: str, retention_days: int):
+    """
+    Partycje w całości starsze niż retention_days: rollup do pair_hourly
+    i DROP (każda partycja w osobnej transakcji).
+    """
+    if retention_days <= 0:
+        return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+
+    cur = conn.cursor()
+    if not is_partitioned(cur, table):
+        cur.close()
+        return 0
+
+    dropped = 0
+    for month, name in list_partitions(cur, table):
+        if next_month(month) > cutoff:
+            break
+        cur.execute(ROLLUP_SQL[table].format(part=name))
+        rolled = cur.rowcount
+        cur.execute(f"DROP TABLE {name}")
+        conn.commit()
+        dropped += 1
+        print(f"[PART] {name}: zwinięte do pair_hourly ({rolled} godzin), partycja skasowana")
+    cur.close()
+    return dropped
+
+
+def migrate_table(conn, table: str):
+    """
+    Jednorazowo: zwykła tabela -> partycjonowana po ts (miesięcznie).
+    Stara zostaje jako <tabela>_unpartitioned do sprawdzenia / skasowania.
+    Trzymamy ACCESS EXCLUSIVE lock, więc ingesty muszą poczekać.
+    """
+    cur = conn.cursor()
+    if is_partitioned(cur, table):
+        print(f"[PART] {table}: już partycjonowana")
+        cur.close()
+        return
+
+    old = f"{table}_unpartitioned"
+    cur.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    cur.execute(f"SELECT MIN(ts), COUNT(*) FROM {table}")
+    min_ts, rows = cur.fetchone()
+
+    cur.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    cur.execute("SELECT indexname FROM pg_indexes WHERE tablename = %s", (old,))
+    for (index,) in cur.fetchall():
+        cur.execute(f"ALTER INDEX {index} RENAME TO {index}_unpart")
+
+    cur.execute(
+        f"""
+        CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        PARTITION BY RANGE (ts)
+        """
+    )
+    _PARTITIONED[table] = True
+    for ddl in TABLE_INDEXES[table] + TABLE_EXTRA_DDL[table]:
+        cur.execute(ddl)
+
+    if min_ts is not None:
+        month = month_start(min_ts)
+        last = month_start(datetime.now(timezone.utc))
+        while month < last:
+            create_partition(cur, table, month)
+            month = next_month(month)
+    ensure_partitions_ahead(cur, table)
+
+    cur.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    copied = cur.rowcount
+    conn.commit()
+
+    cur.execute(f"ANALYZE {table}")
+    conn.commit()
+    cur.close()
+    print(f"[PART] {table}: przeniesione {copied}/{rows} wierszy, stara tabela -> {old}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="przerób istniejące tabele na partycjonowane",
+    )
+    args = parser.parse_args()
+
+    conn = get_conn()
+    for table in TABLE_INDEXES:
+        if args.migrate:
+            migrate_table(conn, table)
+
+        cur = conn.cursor()
+        if not is_partitioned(cur, table):
+            print(f"[PART] {table}: nie jest partycjonowana (python partitions.py --migrate)")
+            cur.close()
+            continue
+        ensure_partitions_ahead(cur, table)
+        conn.commit()
+        cur.close()
+
+        compact_and_drop(conn, table, RETENTION_DAYS[table])
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
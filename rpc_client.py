@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Wspólny klient JSON-RPC (Ronin) dla ingestów: ingest_trades.py,
+ingest_pairs.py, ingest_lp_snapshots.py, lp_cache_update.py.
+
+- keep-alive: requests.Session z pulą połączeń per URL,
+- batch JSON-RPC (RPC_BATCH_SIZE wywołań w jednym POST),
+- token bucket (RPC_RATE_LIMIT zapytań/s, RPC_BURST) – pod limit providera,
+  wywołanie w batchu liczy się jak osobne zapytanie,
+- retry z backoffem i jitterem na błędach sieci / HTTP 429 / 5xx /
+  "rate limit" w odpowiedzi,
+- failover: RONIN_RPC może mieć kilka URL-i po przecinku; URL z błędem
+  odpoczywa RPC_FAILOVER_COOLDOWN sekund, w tym czasie idziemy następnym
+  (pierwszy zdrowy z listy ma pierwszeństwo),
+- liczniki per metoda (wywołania, błędy, retry, czas) – stats() / report().
+
+Błędy JSON-RPC (np. "block range too large", revert) nie są powtarzane –
+wraca odpowiedź z "error", decyzja należy do wołającego (web3 rzuca wyjątek).
+
+    w3 = rpc_client.get_web3()          # Web3 na kliencie (POA middleware)
+    rpc_client.get_client().batch([("eth_getBlockByNumber", ["0x1", False])])
+    rpc_client.get_client().report("[INGEST]")
+"""
+import os
+import random
+import threading
+import time
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.middleware import ExtraDataToPOAMiddleware
+from web3.providers.base import JSONBaseProvider
+
+load_dotenv()
+
+RPC_DEFAULT = "https://ronin-mainnet.g.alchemy.com/v2/IJPvvQ6YdcbcF85OD8jNsjBrpGo3-Xh0"
+# kilka endpointów po przecinku = failover w tej kolejności
+RPC_RAW = os.getenv("RONIN_RPC", RPC_DEFAULT)
+
+RPC_RATE_LIMIT = float(os.getenv("RPC_RATE_LIMIT", "25"))  # zapytań/s, 0 = bez limitu
+RPC_BURST = int(os.getenv("RPC_BURST", "50"))
+RPC_MAX_RETRIES = int(os.getenv("RPC_MAX_RETRIES", "5"))
+RPC_RETRY_BASE = float(os.getenv("RPC_RETRY_BASE", "0.5"))  # s, rośnie x2 z próbą
+RPC_RETRY_MAX = 30.0
+RPC_TIMEOUT = float(os.getenv("RPC_TIMEOUT", "30"))
+RPC_POOL_SIZE = int(os.getenv("RPC_POOL_SIZE", "16"))
+RPC_BATCH_SIZE = int(os.getenv("RPC_BATCH_SIZE", "100"))
+RPC_FAILOVER_COOLDOWN = float(os.getenv("RPC_FAILOVER_COOLDOWN", "30"))
+
+# Multicall3 (ten sam adres na wszystkich sieciach EVM); pusty
+# MULTICALL3_ADDRESS = fallback na osobne eth_call
+MULTICALL3_ADDRESS = os.getenv(
+    "MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11"
+).strip()
+MULTICALL_CHUNK = int(os.getenv("MULTICALL_CHUNK", "200"))
+SEL_AGGREGATE3 = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+# fragmenty komunikatów błędów JSON-RPC, które znaczą "zwolnij" (retry),
+# a nie "złe zapytanie"
+RATE_LIMIT_HINTS = ("rate limit", "too many requests", "exceeded its compute units", "capacity")
+RETRY_HTTP_STATUS = {429, 500, 502, 503, 504}
+
+
+def http_url(url: str) -> str:
+    """
+    wss:// / ws:// -> https:// / http:// (zapytania zawsze po HTTP).
+    """
+    if url.startswith("wss://"):
+        return "https://" + url.removeprefix("wss://")
+    if url.startswith("ws://"):
+        return "http://" + url.removeprefix("ws://")
+    return url
+
+
+RPC_RAW_URLS = [u.strip() for u in RPC_RAW.split(",") if u.strip()]
+RPC_URLS = [http_url(u) for u in RPC_RAW_URLS]
+# endpointy WebSocket z listy (subskrypcja newHeads w ingest_trades --follow)
+RPC_WS_URLS = [u for u in RPC_RAW_URLS if u.startswith(("wss://", "ws://"))]
+
+
+class RpcError(RuntimeError):
+    """
+    Odpowiedź z "error" (call / batch), brak wyniku albo wyczerpane retry.
+    """
+
+
+class TokenBucket:
+    """
+    rate tokenów/s, pojemność burst; acquire(n) czeka, aż będzie n tokenów.
+    Wspólny dla wszystkich wątków.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n=1):
+        """
+        Zwraca czas czekania (s). n większe niż burst (duży batch) bierzemy
+        porcjami po burst.
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while n > 0:
+            take = min(n, self.capacity)
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= take:
+                    self.tokens -= take
+                    n -= take
+                    continue
+                wait = (take - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+
+class RpcClient:
+    def __init__(
+        self,
+        urls=None,
+        rate=RPC_RATE_LIMIT,
+        burst=RPC_BURST,
+        max_retries=RPC_MAX_RETRIES,
+        timeout=RPC_TIMEOUT,
+        batch_size=RPC_BATCH_SIZE,
+    ):
+        self.urls = list(urls or RPC_URLS)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.bucket = TokenBucket(rate, burst)
+
+        self.sessions = {}
+        for url in self.urls:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=RPC_POOL_SIZE, max_retries=0
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Content-Type"] = "application/json"
+            self.sessions[url] = session
+
+        self.down_until = {url: 0.0 for url in self.urls}
+        self.ids = iter(range(1, 1 << 62))
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    # ---------- failover ----------
+
+    def pick_url(self):
+        """
+        Pierwszy URL z listy, który nie odpoczywa po błędzie; jak wszystkie
+        odpoczywają – ten, który wraca najwcześniej.
+        """
+        now = time.monotonic()
+        with self.lock:
+            for url in self.urls:
+                if self.down_until[url] <= now:
+                    return url
+            return min(self.urls, key=lambda u: self.down_until[u])
+
+    def mark_down(self, url):
+        if len(self.urls) < 2:
+            return
+        with self.lock:
+            self.down_until[url] = time.monotonic() + RPC_FAILOVER_COOLDOWN
+
+    # ---------- metryki ----------
+
+    def record(self, method, n, seconds, error=False, retry=False):
+        with self.lock:
+            m = self.metrics.get(method)
+            if m is None:
+                m = self.metrics[method] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "seconds": 0.0,
+                    "max_seconds": 0.0,
+                }
+            if retry:
+                m["retries"] += 1
+                return
+            m["calls"] += n
+            m["seconds"] += seconds
+            m["max_seconds"] = max(m["max_seconds"], seconds)
+            if error:
+                m["errors"] += 1
+
+    def stats(self):
+        """
+        {metoda: {calls, errors, retries, seconds, max_seconds, avg_ms}}
+        (avg_ms = średni czas HTTP na wywołanie; batch dzieli czas po równo).
+        """
+        with self.lock:
+            out = {}
+            for method, m in self.metrics.items():
+                d = dict(m)
+                d["avg_ms"] = 1000.0 * m["seconds"] / m["calls"] if m["calls"] else 0.0
+                out[method] = d
+            return out
+
+    def report(self, prefix="[RPC]"):
+        for method, m in sorted(self.stats().items()):
+            print(
+                f"{prefix} RPC {method}: {m['calls']} wywołań, {m['errors']} błędów, "
+                f"{m['retries']} retry, śr. {m['avg_ms']:.0f} ms, "
+                f"max {1000.0 * m['max_seconds']:.0f} ms"
+            )
+
+    # ---------- transport ----------
+
+    def post(self, body, methods):
+        """
+        POST gotowego body (pojedyncze zapytanie albo batch) z limitem,
+        retry i failoverem. methods = lista metod w body (limit i metryki).
+        Zwraca zdekodowany JSON.
+        """
+        method = methods[0] if len(set(methods)) == 1 else "batch"
+        attempt = 0
+        while True:
+            self.bucket.acquire(len(methods))
+            url = self.pick_url()
+            started = time.monotonic()
+            retry_after = None
+            try:
+                resp = self.sessions[url].post(url, data=body, timeout=self.timeout)
+                if resp.status_code in RETRY_HTTP_STATUS:
+                    retry_after = resp.headers.get("Retry-After")
+                    raise RpcError(f"HTTP {resp.status_code}")
+                resp.raise_for_status()
+                data = resp.json()
+                if self.is_rate_limited(data):
+                    raise RpcError(f"rate limit: {str(data)[:200]}")
+            except (requests.RequestException, ValueError, RpcError) as e:
+                elapsed = time.monotonic() - started
+                self.record(method, len(methods), elapsed, error=True)
+                self.mark_down(url)
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                self.record(method, 0, 0.0, retry=True)
+                sleep_for = self.backoff(attempt, retry_after)
+                print(
+                    f"[RPC] {method} na {self.short(url)} nie powiodło się "
+                    f"(próba {attempt}/{self.max_retries}): {e}; ponowię za {sleep_for:.1f}s"
+                )
+                time.sleep(sleep_for)
+                continue
+
+            self.record(
+                method, len(methods), time.monotonic() - started, error=self.has_error(data)
+            )
+            return data
+
+    @staticmethod
+    def has_error(data):
+        items = data if isinstance(data, list) else [data]
+        return any(isinstance(item, dict) and "error" in item for item in items)
+
+    @staticmethod
+    def is_rate_limited(data):
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            err = item.get("error") if isinstance(item, dict) else None
+            if err:
+                msg = str(err.get("message", "") if isinstance(err, dict) else err).lower()
+                code = err.get("code") if isinstance(err, dict) else None
+                if code == 429 or any(h in msg for h in RATE_LIMIT_HINTS):
+                    return True
+        return False
+
+    @staticmethod
+    def backoff(attempt, retry_after=None):
+        """
+        Wykładniczo od RPC_RETRY_BASE (max RPC_RETRY_MAX), jitter 50–150%,
+        żeby wątki nie wracały równo; Retry-After z 429 ma pierwszeństwo.
+        """
+        if retry_after:
+            try:
+                return min(RPC_RETRY_MAX, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(RPC_RETRY_MAX, RPC_RETRY_BASE * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def short(url):
+        # bez klucza API w logach
+        return url.split("//", 1)[-1].split("/", 1)[0]
+
+    # ---------- API ----------
+
+    def next_id(self):
+        with self.lock:
+            return next(self.ids)
+
+    def call(self, method, params):
+        """
+        Pojedyncze wywołanie, zwraca "result" albo rzuca RpcError.
+        """
+        payload = {"jsonrpc": "2.0", "id": self.next_id(), "method": method, "params": params}
+        data = self.post(Web3.to_json(payload).encode("utf-8"), [method])
+        if "error" in data:
+            raise RpcError(f"{method}: {data['error']}")
+        return data.get("result")
+
+    def batch(self, calls):
+        """
+        JSON-RPC batch: calls = [(method, params)], wyniki w tej samej
+        kolejności (po RPC_BATCH_SIZE wywołań na POST).
+        Błąd pojedynczego wywołania -> RpcError (całość i tak idzie do retry
+        u wołającego).
+        """
+        results = []
+        for i in range(0, len(calls), self.batch_size):
+            chunk = calls[i : i + self.batch_size]
+            first = self.next_id()
+            payload = [
+                {"jsonrpc": "2.0", "id": first + n, "method": method, "params": params}
+                for n, (method, params) in enumerate(chunk)
+            ]
+            data = self.post(Web3.to_json(payload).encode("utf-8"), [m for m, _ in chunk])
+            if not isinstance(data, list):
+                raise RpcError(f"RPC batch error: {data.get('error') if isinstance(data, dict) else data}")
+            by_id = {r.get("id"): r for r in data}
+            for n in range(len(chunk)):
+                r = by_id.get(first + n)
+                if r is None or "error" in r:
+                    raise RpcError(f"RPC batch error: {r.get('error') if r else 'missing'}")
+                results.append(r["result"])
+        return results
+
+
+class ClientProvider(JSONBaseProvider):
+    """
+    Provider web3 na RpcClient – w3.eth.* / kontrakty idą przez ten sam
+    limit, retry, failover i liczniki.
+    """
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def make_request(self, method, params):
+        body = self.encode_rpc_request(method, params)
+        return self.client.post(body, [method])
+
+    def make_batch_request(self, requests_):
+        body = self.encode_batch_rpc_request(requests_)
+        data = self.client.post(body, [m for m, _ in requests_])
+        if isinstance(data, list):
+            return sorted(data, key=lambda r: r.get("id", 0))
+        return data
+
+
+# klient i Web3 na proces (tworzone przy pierwszym użyciu)
+_CLIENT = {}
+
+
+def get_client() -> RpcClient:
+    if "client" not in _CLIENT:
+        _CLIENT["client"] = RpcClient()
+    return _CLIENT["client"]
+
+
+def get_web3() -> Web3:
+    if "w3" not in _CLIENT:
+        w3 = Web3(ClientProvider(get_client()))
+        # Ronin = POA
+        w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        _CLIENT["w3"] = w3
+    return _CLIENT["w3"]
+
+
+def multicall(calls, block, w3=None):
+    """
+    Multicall3.aggregate3 na bloku block: calls = [(target, callData)],
+    wynik = [(success, returnData)] w tej samej kolejności.
+    allowFailure=true – jedno zepsute wywołanie nie psuje całej rundy.
+    Po MULTICALL_CHUNK wywołań na eth_call. Bez MULTICALL3_ADDRESS:
+    osobne eth_call (też na tym samym bloku).
+    """
+    w3 = w3 or get_web3()
+    out = []
+    if not MULTICALL3_ADDRESS:
+        for target, data in calls:
+            try:
+                ret = w3.eth.call({"to": target, "data": data}, block)
+                out.append((True, bytes(ret)))
+            except Exception:
+                out.append((False, b""))
+        return out
+
+    for i in range(0, len(calls), MULTICALL_CHUNK):
+        chunk = calls[i : i + MULTICALL_CHUNK]
+        payload = SEL_AGGREGATE3 + w3.codec.encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, True, data) for target, data in chunk]],
+        )
+        ret = w3.eth.call(
+            {"to": Web3.to_checksum_address(MULTICALL3_ADDRESS), "data": payload},
+            block,
+        )
+        (results,) = w3.codec.decode(["(bool,bytes)[]"], bytes(ret))
+        out.extend((ok, bytes(data)) for ok, data in results)
+    return out
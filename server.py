@@ -1,16 +1,34 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.responses import PlainTextResponse
+from fastapi.responses import Response
 
+import asyncio
+import gzip
+import hashlib
+import math
 import os
+import re
 import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from email.utils import format_datetime, parsedate_to_datetime
 
-import psycopg2
 from dotenv import load_dotenv
 
+from db_pool import ConnectionPool, PoolTimeout
+import lp_analytics
+import lp_cache_update
+
+# brotli opcjonalnie – bez niego kompresujemy tylko gzipem
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 load_dotenv()
 
 app = FastAPI()
@@ -24,6 +42,17 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request, exc):
+    # przeciążenie DB: mówimy klientowi, żeby spróbował za chwilę
+    print("DB_POOL TIMEOUT:", repr(exc))
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     print("UNCAUGHT ERROR:", repr(exc))
@@ -41,6 +70,15 @@ DB_PARAMS = {
     "password": os.getenv("DB_PASS"),
 }
 
+# Pool połączeń do DB (wspólny dla wszystkich query helperów)
+DB_POOL = ConnectionPool(
+    DB_PARAMS,
+    minconn=int(os.getenv("DB_POOL_MIN", "2")),
+    maxconn=int(os.getenv("DB_POOL_MAX", "20")),
+    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30.0")),
+    check_idle=float(os.getenv("DB_POOL_CHECK_IDLE", "30")),
+)
+
 # Fee % od wolumenu, które trafia do LP (np. 0.05 = 5%)
 LP_FEE_RATE = float(os.getenv("LP_FEE_RATE", "0.05"))
 
@@ -53,11 +91,61 @@ VEE_PRICE_CACHE = {
     "price": VEE_USD_FALLBACK,
 }
 
+# /api/market/{wallet}: portfel z lp_wallets, którego nie ma w lp_cache,
+# dociągamy z RPC (Multicall3) i zapisujemy – potem odświeża go
+# lp_cache_update.py. Adresy spoza lp_wallets nie idą do RPC. Portfel bez
+# pozycji nie ma wierszy w lp_cache, więc ponowny odczyt najwcześniej po
+# LP_FETCH_RETRY_SECONDS. Równoległe requesty o ten sam portfel czekają
+# na jeden odczyt.
+LP_FETCH_CONCURRENCY = int(os.getenv("LP_FETCH_CONCURRENCY", "2"))
+LP_FETCH_RETRY_SECONDS = float(os.getenv("LP_FETCH_RETRY_SECONDS", "300"))
+LP_FETCH_SEMAPHORE = asyncio.Semaphore(LP_FETCH_CONCURRENCY)
+LP_FETCH_INFLIGHT = {}  # wallet -> asyncio.Task
+LP_FETCH_TRIED = {}  # wallet -> time.time() ostatniego odczytu z RPC
+WALLET_RE = re.compile(r"^0x[0-9a-f]{40}$")
+
+# /api/lp/il/bulk: maksymalna liczba portfeli w jednym requeście
+LP_BULK_MAX_WALLETS = int(os.getenv("LP_BULK_MAX_WALLETS", "200"))
+
 # Minimalna liczba dni pozycji, żeby liczyć IL annualized
 MIN_DAYS_FOR_IL_ANNUALIZED = float(os.getenv("MIN_DAYS_IL_ANNUALIZED", "3.0"))
 
+# Cache odpowiedzi /api/market. Unieważniany przez NOTIFY z ingest_pairs /
+# ingest_trades, TTL jako fallback (okna 24h/7d przesuwają się też bez nowych
+# danych, a listener może chwilowo nie działać).
+MARKET_CACHE_TTL = float(os.getenv("MARKET_CACHE_TTL", "60"))
+MARKET_NOTIFY_CHANNEL = "gex_market"
+
+MARKET_CACHE = {
+    "version": -1,  # wersja danych, z którą policzono payload
+    "ts": 0.0,
+    # rows, body (JSON), etag, last_modified, encoded (body per kodowanie)
+    "entry": None,
+}
+MARKET_STATE = {
+    "version": 0,  # podbijane przy każdym NOTIFY
+    "listener": None,
+    "listen_attempt_ts": 0.0,
+}
+MARKET_CACHE_LOCK = asyncio.Lock()
+
+# /api/history: rozdzielczość -> (krok bucketu, domyślny zakres wstecz)
+HISTORY_RESOLUTIONS = {
+    "5m": (timedelta(minutes=5), timedelta(days=1)),
+    "1h": (timedelta(hours=1), timedelta(days=30)),
+    "4h": (timedelta(hours=4), timedelta(days=120)),
+    "1d": (timedelta(days=1), timedelta(days=730)),
+}
+# Twardy limit punktów w jednej odpowiedzi (starszy koniec zakresu jest ucinany)
+HISTORY_MAX_POINTS = int(os.getenv("HISTORY_MAX_POINTS", "1000"))
+# Punkt odniesienia bucketów (musi się zgadzać z date_bin w SQL)
+HISTORY_ORIGIN = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+# Minimalny rozmiar body (bajty), od którego kompresujemy odpowiedź
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
 
-def get_vee_usd_price() -> float:
+
+async def get_vee_usd_price() -> float:
     """
     Cena VEE w USD z tabeli vee_price_snapshots, z prostym cachem.
     TTL cache: 240s. Jak coś pójdzie nie tak, trzymamy ostatnią znaną wartość.
@@ -67,14 +155,10 @@ def get_vee_usd_price() -> float:
         return VEE_PRICE_CACHE["price"]
 
     try:
-        conn = psycopg2.connect(**DB_PARAMS)
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT price_usd FROM vee_price_snapshots ORDER BY ts DESC LIMIT 1;"
-        )
-        row = cur.fetchone()
-        cur.close()
-        conn.close()
+        async with DB_POOL.connection() as conn:
+            row = await conn.fetchrow(
+                "SELECT price_usd FROM vee_price_snapshots ORDER BY ts DESC LIMIT 1;"
+            )
 
         if row and row[0] is not None:
             VEE_PRICE_CACHE["price"] = float(row[0])
@@ -89,85 +173,55 @@ def get_vee_usd_price() -> float:
 # ================== MARKET SNAPSHOTS ==================
 
 
-def query_latest():
+async def query_latest():
     """
-    Ostatni snapshot każdej pary z gex_snapshots
-    + wolumen 24h / 7d z trades_ronin
-    + zmiany ceny i wolumenu.
-    UWAGA: w trades_ronin trzymamy połowę volume (średnia z in/out),
+    Ostatni stan każdej pary + wolumen 24h / 7d + zmiany ceny i wolumenu.
+    Stan (cena, rezerwy, ceny sprzed 24h / 7d) z gex_pair_state (1 wiersz
+    na parę, utrzymywany przez ingest_pairs.py), wolumeny z godzinowego
+    rollupu pair_hourly (max 14*24 wiersze na parę), więc koszt nie rośnie
+    razem z historią trades_ronin / gex_snapshots.
+    Okna liczymy z dokładnością do pełnej godziny.
+    UWAGA: w pair_hourly trzymamy połowę volume (średnia z in/out),
     więc tutaj mnożymy wszystkie wolumeny *2, żeby zrównać się z danymi z GEX.
     """
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
-
     query = """
     WITH latest AS (
-        SELECT DISTINCT ON (pair_address)
-            pair_address,
-            LOWER(pair_address) AS pair_lower,
-            item_name,
-            price_vee,
-            reserve_vee,
-            reserve_item,
-            vee_address,
-            item_address,
-            ts
-        FROM gex_snapshots
-        ORDER BY pair_address, ts DESC
-    ),
-    vol24 AS (
         SELECT
-            LOWER(pair_address) AS pair_lower,
-            COALESCE(SUM(vee_amount), 0) AS volume_24h_vee,
-            COUNT(*) AS trades_24h
-        FROM trades_ronin
-        WHERE ts >= NOW() - INTERVAL '24 hours'
-        GROUP BY LOWER(pair_address)
+            p.pair_address,
+            p.item_name,
+            s.price_vee,
+            s.reserve_vee,
+            s.reserve_item,
+            p.vee_address,
+            p.item_address,
+            s.ts,
+            s.price_24h_ago,
+            s.price_7d_ago
+        FROM gex_pairs p
+        JOIN gex_pair_state s ON s.pair_address = p.pair_address
+        WHERE s.price_vee IS NOT NULL
     ),
-    vol7 AS (
+    vol AS (
         SELECT
-            LOWER(pair_address) AS pair_lower,
-            COALESCE(SUM(vee_amount), 0) AS volume_7d_vee,
-            COUNT(*) AS trades_7d
-        FROM trades_ronin
-        WHERE ts >= NOW() - INTERVAL '7 days'
-        GROUP BY LOWER(pair_address)
-    ),
-    price24 AS (
-        SELECT DISTINCT ON (pair_address)
             pair_address,
-            LOWER(pair_address) AS pair_lower,
-            price_vee AS price_24h_ago
-        FROM gex_snapshots
-        WHERE ts <= NOW() - INTERVAL '24 hours'
-        ORDER BY pair_address, ts DESC
-    ),
-    price7 AS (
-        SELECT DISTINCT ON (pair_address)
-            pair_address,
-            LOWER(pair_address) AS pair_lower,
-            price_vee AS price_7d_ago
-        FROM gex_snapshots
-        WHERE ts <= NOW() - INTERVAL '7 days'
-        ORDER BY pair_address, ts DESC
-    ),
-    vol24_prev AS (
-        SELECT
-            LOWER(pair_address) AS pair_lower,
-            COALESCE(SUM(vee_amount), 0) AS volume_24h_prev_vee
-        FROM trades_ronin
-        WHERE ts >= NOW() - INTERVAL '48 hours'
-          AND ts <  NOW() - INTERVAL '24 hours'
-        GROUP BY LOWER(pair_address)
-    ),
-    vol7_prev AS (
-        SELECT
-            LOWER(pair_address) AS pair_lower,
-            COALESCE(SUM(vee_amount), 0) AS volume_7d_prev_vee
-        FROM trades_ronin
-        WHERE ts >= NOW() - INTERVAL '14 days'
-          AND ts <  NOW() - INTERVAL '7 days'
-        GROUP BY LOWER(pair_address)
+            COALESCE(SUM(volume_vee)  FILTER (WHERE bucket >= NOW() - INTERVAL '24 hours'), 0)
+                AS volume_24h_vee,
+            COALESCE(SUM(trade_count) FILTER (WHERE bucket >= NOW() - INTERVAL '24 hours'), 0)
+                AS trades_24h,
+            COALESCE(SUM(volume_vee)  FILTER (WHERE bucket >= NOW() - INTERVAL '7 days'), 0)
+                AS volume_7d_vee,
+            COALESCE(SUM(trade_count) FILTER (WHERE bucket >= NOW() - INTERVAL '7 days'), 0)
+                AS trades_7d,
+            SUM(volume_vee) FILTER (
+                WHERE bucket >= NOW() - INTERVAL '48 hours'
+                  AND bucket <  NOW() - INTERVAL '24 hours'
+            ) AS volume_24h_prev_vee,
+            SUM(volume_vee) FILTER (
+                WHERE bucket <  NOW() - INTERVAL '7 days'
+            ) AS volume_7d_prev_vee
+        FROM pair_hourly
+        WHERE bucket >= NOW() - INTERVAL '14 days'
+        GROUP BY pair_address
     )
     SELECT
         l.pair_address,
@@ -178,71 +232,72 @@ def query_latest():
         l.vee_address,
         l.item_address,
         l.ts,
-        COALESCE(v24.volume_24h_vee, 0)     AS volume_24h_vee,
-        COALESCE(v24.trades_24h, 0)         AS volume_24h_trades,
-        COALESCE(v7.volume_7d_vee, 0)       AS volume_7d_vee,
-        COALESCE(v7.trades_7d, 0)           AS volume_7d_trades,
-        p24.price_24h_ago,
-        p7.price_7d_ago,
+        COALESCE(v.volume_24h_vee, 0)       AS volume_24h_vee,
+        COALESCE(v.trades_24h, 0)           AS volume_24h_trades,
+        COALESCE(v.volume_7d_vee, 0)        AS volume_7d_vee,
+        COALESCE(v.trades_7d, 0)            AS volume_7d_trades,
+        l.price_24h_ago,
+        l.price_7d_ago,
         CASE
-            WHEN p24.price_24h_ago IS NULL OR p24.price_24h_ago = 0 THEN NULL
-            ELSE ((l.price_vee - p24.price_24h_ago) / p24.price_24h_ago) * 100
+            WHEN l.price_24h_ago IS NULL OR l.price_24h_ago = 0 THEN NULL
+            ELSE ((l.price_vee - l.price_24h_ago) / l.price_24h_ago) * 100
         END AS price_change_24h_pct,
         CASE
-            WHEN p7.price_7d_ago IS NULL OR p7.price_7d_ago = 0 THEN NULL
-            ELSE ((l.price_vee - p7.price_7d_ago) / p7.price_7d_ago) * 100
+            WHEN l.price_7d_ago IS NULL OR l.price_7d_ago = 0 THEN NULL
+            ELSE ((l.price_vee - l.price_7d_ago) / l.price_7d_ago) * 100
         END AS price_change_7d_pct,
-        COALESCE(v24_prev.volume_24h_prev_vee, 0) AS volume_24h_prev_vee,
-        COALESCE(v7_prev.volume_7d_prev_vee, 0)   AS volume_7d_prev_vee,
+        COALESCE(v.volume_24h_prev_vee, 0)  AS volume_24h_prev_vee,
+        COALESCE(v.volume_7d_prev_vee, 0)   AS volume_7d_prev_vee,
         CASE
-            WHEN v24_prev.volume_24h_prev_vee IS NULL
-                 OR v24_prev.volume_24h_prev_vee = 0 THEN NULL
-            ELSE ( (COALESCE(v24.volume_24h_vee, 0) - v24_prev.volume_24h_prev_vee)
-                   / v24_prev.volume_24h_prev_vee ) * 100
+            WHEN v.volume_24h_prev_vee IS NULL
+                 OR v.volume_24h_prev_vee = 0 THEN NULL
+            ELSE ( (v.volume_24h_vee - v.volume_24h_prev_vee)
+                   / v.volume_24h_prev_vee ) * 100
         END AS volume_change_24h_pct,
         CASE
-            WHEN v7_prev.volume_7d_prev_vee IS NULL
-                 OR v7_prev.volume_7d_prev_vee = 0 THEN NULL
-            ELSE ( (COALESCE(v7.volume_7d_vee, 0) - v7_prev.volume_7d_prev_vee)
-                   / v7_prev.volume_7d_prev_vee ) * 100
+            WHEN v.volume_7d_prev_vee IS NULL
+                 OR v.volume_7d_prev_vee = 0 THEN NULL
+            ELSE ( (v.volume_7d_vee - v.volume_7d_prev_vee)
+                   / v.volume_7d_prev_vee ) * 100
         END AS volume_change_7d_pct
-    FROM latest    l
-    LEFT JOIN vol24       v24      ON v24.pair_lower      = l.pair_lower
-    LEFT JOIN vol7        v7       ON v7.pair_lower       = l.pair_lower
-    LEFT JOIN price24     p24      ON p24.pair_lower      = l.pair_lower
-    LEFT JOIN price7      p7       ON p7.pair_lower       = l.pair_lower
-    LEFT JOIN vol24_prev  v24_prev ON v24_prev.pair_lower = l.pair_lower
-    LEFT JOIN vol7_prev   v7_prev  ON v7_prev.pair_lower  = l.pair_lower;
+    FROM latest l
+    LEFT JOIN vol v ON v.pair_address = l.pair_address;
     """
 
-    cur.execute(query)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    columns = [
-        "pair_address",
-        "item_name",
-        "price_vee",
-        "reserve_vee",
-        "reserve_item",
-        "vee_address",
-        "item_address",
-        "ts",
-        "volume_24h_vee",
-        "volume_24h_trades",
-        "volume_7d_vee",
-        "volume_7d_trades",
-        "price_24h_ago",
-        "price_7d_ago",
-        "price_change_24h_pct",
-        "price_change_7d_pct",
-        "volume_24h_prev_vee",
-        "volume_7d_prev_vee",
-        "volume_change_24h_pct",
-        "volume_change_7d_pct",
-    ]
-
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(query)
+
+    return market_rows(rows)
+
+
+MARKET_COLUMNS = [
+    "pair_address",
+    "item_name",
+    "price_vee",
+    "reserve_vee",
+    "reserve_item",
+    "vee_address",
+    "item_address",
+    "ts",
+    "volume_24h_vee",
+    "volume_24h_trades",
+    "volume_7d_vee",
+    "volume_7d_trades",
+    "price_24h_ago",
+    "price_7d_ago",
+    "price_change_24h_pct",
+    "price_change_7d_pct",
+    "volume_24h_prev_vee",
+    "volume_7d_prev_vee",
+    "volume_change_24h_pct",
+    "volume_change_7d_pct",
+]
+
+
+def market_rows(rows, columns=MARKET_COLUMNS):
+    """
+    Wiersze z query_latest / query_market_at_block -> dicty dla JSON-a.
+    """
     out = []
     for row in rows:
         d = dict(zip(columns, row))
@@ -282,42 +337,346 @@ def query_latest():
     return out
 
 
+SQL_MARKET_AT_BLOCK = """
+    WITH latest AS (
+        SELECT
+            p.pair_address,
+            p.pair_id,
+            p.item_name,
+            s.price_vee,
+            s.reserve_vee,
+            s.reserve_item,
+            p.vee_address,
+            p.item_address,
+            s.ts,
+            s.block_number
+        FROM gex_pairs p
+        CROSS JOIN LATERAL (
+            SELECT ts, block_number, price_vee, reserve_vee, reserve_item
+            FROM gex_snapshots s
+            WHERE s.pair_address = p.pair_address
+              AND s.block_number <= $1
+            ORDER BY s.block_number DESC
+            LIMIT 1
+        ) s
+        WHERE s.price_vee IS NOT NULL
+    ),
+    asof AS (
+        SELECT COALESCE(
+            (SELECT ts FROM block_timestamps WHERE block_number = $1),
+            (SELECT MAX(ts) FROM latest)
+        ) AS ts
+    ),
+    vol AS (
+        SELECT
+            t.pair_id,
+            COALESCE(SUM(t.vee_wei) FILTER (WHERE t.ts > a.ts - INTERVAL '24 hours'), 0) / 2e18
+                AS volume_24h_vee,
+            COUNT(*) FILTER (WHERE t.ts > a.ts - INTERVAL '24 hours')
+                AS trades_24h,
+            COALESCE(SUM(t.vee_wei) FILTER (WHERE t.ts > a.ts - INTERVAL '7 days'), 0) / 2e18
+                AS volume_7d_vee,
+            COUNT(*) FILTER (WHERE t.ts > a.ts - INTERVAL '7 days')
+                AS trades_7d,
+            SUM(t.vee_wei) FILTER (
+                WHERE t.ts >  a.ts - INTERVAL '48 hours'
+                  AND t.ts <= a.ts - INTERVAL '24 hours'
+            ) / 2e18 AS volume_24h_prev_vee,
+            SUM(t.vee_wei) FILTER (
+                WHERE t.ts <= a.ts - INTERVAL '7 days'
+            ) / 2e18 AS volume_7d_prev_vee
+        FROM trades_ronin t
+        CROSS JOIN asof a
+        WHERE t.ts >  (SELECT ts FROM asof) - INTERVAL '14 days'
+          AND t.ts <= (SELECT ts FROM asof) + INTERVAL '1 hour'
+          AND t.block_number <= $1
+        GROUP BY t.pair_id
+    ),
+    ref AS (
+        SELECT
+            l.pair_address,
+            (
+                SELECT h.price_close
+                FROM pair_hourly h
+                WHERE h.pair_address = l.pair_address
+                  AND h.bucket <= a.ts - INTERVAL '24 hours'
+                  AND h.price_close IS NOT NULL
+                ORDER BY h.bucket DESC
+                LIMIT 1
+            ) AS price_24h_ago,
+            (
+                SELECT h.price_close
+                FROM pair_hourly h
+                WHERE h.pair_address = l.pair_address
+                  AND h.bucket <= a.ts - INTERVAL '7 days'
+                  AND h.price_close IS NOT NULL
+                ORDER BY h.bucket DESC
+                LIMIT 1
+            ) AS price_7d_ago
+        FROM latest l
+        CROSS JOIN asof a
+    )
+    SELECT
+        l.pair_address,
+        l.item_name,
+        l.price_vee,
+        l.reserve_vee,
+        l.reserve_item,
+        l.vee_address,
+        l.item_address,
+        l.ts,
+        COALESCE(v.volume_24h_vee, 0)       AS volume_24h_vee,
+        COALESCE(v.trades_24h, 0)           AS volume_24h_trades,
+        COALESCE(v.volume_7d_vee, 0)        AS volume_7d_vee,
+        COALESCE(v.trades_7d, 0)            AS volume_7d_trades,
+        r.price_24h_ago,
+        r.price_7d_ago,
+        CASE
+            WHEN r.price_24h_ago IS NULL OR r.price_24h_ago = 0 THEN NULL
+            ELSE ((l.price_vee - r.price_24h_ago) / r.price_24h_ago) * 100
+        END AS price_change_24h_pct,
+        CASE
+            WHEN r.price_7d_ago IS NULL OR r.price_7d_ago = 0 THEN NULL
+            ELSE ((l.price_vee - r.price_7d_ago) / r.price_7d_ago) * 100
+        END AS price_change_7d_pct,
+        COALESCE(v.volume_24h_prev_vee, 0)  AS volume_24h_prev_vee,
+        COALESCE(v.volume_7d_prev_vee, 0)   AS volume_7d_prev_vee,
+        CASE
+            WHEN v.volume_24h_prev_vee IS NULL
+                 OR v.volume_24h_prev_vee = 0 THEN NULL
+            ELSE ( (v.volume_24h_vee - v.volume_24h_prev_vee)
+                   / v.volume_24h_prev_vee ) * 100
+        END AS volume_change_24h_pct,
+        CASE
+            WHEN v.volume_7d_prev_vee IS NULL
+                 OR v.volume_7d_prev_vee = 0 THEN NULL
+            ELSE ( (v.volume_7d_vee - v.volume_7d_prev_vee)
+                   / v.volume_7d_prev_vee ) * 100
+        END AS volume_change_7d_pct,
+        l.block_number,
+        (SELECT ts FROM asof) AS asof_ts
+    FROM latest l
+    LEFT JOIN vol v ON v.pair_id = l.pair_id
+    LEFT JOIN ref r ON r.pair_address = l.pair_address;
+"""
+
+
+async def query_market_at_block(block: int):
+    """
+    Stan rynku "na bloku N": dla każdej pary ostatni snapshot z
+    gex_snapshots.block_number <= N (rundy ingest_pairs czytają wszystkie
+    pary z jednego bloku), wolumeny z trades_ronin do bloku N włącznie
+    w oknach 24h / 7d liczonych od ts bloku N, ceny sprzed 24h / 7d
+    z pair_hourly względem tego samego ts.
+    ts bloku: block_timestamps, a jak go tam nie ma – najnowszy snapshot <= N.
+    Zwraca (ts bloku, wiersze jak w query_latest + block_number).
+    """
+
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(SQL_MARKET_AT_BLOCK, block)
+
+    asof_ts = rows[0]["asof_ts"] if rows else None
+    return asof_ts, market_rows(rows, MARKET_COLUMNS + ["block_number"])
+
+
+def on_market_notify(connection, pid, channel, payload):
+    MARKET_STATE["version"] += 1
+
+
+async def ensure_market_listener():
+    """
+    Trzyma osobne połączenie z LISTEN gex_market. Jak padnie, próbujemy
+    się podpiąć ponownie (nie częściej niż co 30s), a do tego czasu
+    świeżość cache pilnuje sam TTL.
+    """
+    listener = MARKET_STATE["listener"]
+    if listener is not None and not listener.is_closed():
+        return
+
+    now = time.time()
+    if now - MARKET_STATE["listen_attempt_ts"] < 30:
+        return
+    MARKET_STATE["listen_attempt_ts"] = now
+
+    try:
+        MARKET_STATE["listener"] = await DB_POOL.listen(
+            MARKET_NOTIFY_CHANNEL, on_market_notify
+        )
+        # mogliśmy przegapić NOTIFY, kiedy nikt nie słuchał
+        MARKET_STATE["version"] += 1
+    except Exception as e:
+        MARKET_STATE["listener"] = None
+        print("ensure_market_listener ERROR:", repr(e))
+
+
+def market_cache_fresh() -> bool:
+    return (
+        MARKET_CACHE["entry"] is not None
+        and MARKET_CACHE["version"] == MARKET_STATE["version"]
+        and time.time() - MARKET_CACHE["ts"] < MARKET_CACHE_TTL
+    )
+
+
+async def get_market_cached() -> dict:
+    """
+    Wpis cache dla /api/market (rows, body, etag, last_modified, encoded).
+    Przy missie tylko jeden request liczy query_latest(), reszta czeka
+    na locku i dostaje gotowy wynik.
+    """
+    await ensure_market_listener()
+
+    if market_cache_fresh():
+        return MARKET_CACHE["entry"]
+
+    async with MARKET_CACHE_LOCK:
+        if market_cache_fresh():
+            return MARKET_CACHE["entry"]
+
+        # wersję bierzemy PRZED query – NOTIFY w trakcie liczenia
+        # oznaczy ten wynik jako nieaktualny
+        version = MARKET_STATE["version"]
+        ts = time.time()
+        rows = await query_latest()
+        body = JSONResponse(content=jsonable_encoder(rows)).body
+
+        last_modified = None
+        for row in rows:
+            if row.get("ts"):
+                row_ts = datetime.fromisoformat(row["ts"])
+                if last_modified is None or row_ts > last_modified:
+                    last_modified = row_ts
+
+        MARKET_CACHE["version"] = version
+        MARKET_CACHE["ts"] = ts
+        MARKET_CACHE["entry"] = {
+            "rows": rows,
+            "body": body,
+            "etag": make_etag(hashlib.sha1(body).hexdigest()),
+            "last_modified": last_modified,
+            "encoded": {},
+        }
+        return MARKET_CACHE["entry"]
+
+
+# ================== HTTP CACHE / KOMPRESJA ==================
+
+
+def make_etag(*parts) -> str:
+    """
+    Słaby ETag (W/"...") – ta sama treść niezależnie od Content-Encoding.
+    """
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return 'W/"%s"' % hashlib.sha1(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def validator_headers(etag: str, last_modified) -> dict:
+    # no-cache = przeglądarka może trzymać odpowiedź, ale zawsze rewaliduje
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified) -> bool:
+    """
+    If-None-Match ma pierwszeństwo, If-Modified-Since tylko bez niego.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def pick_encoding(request: Request, size: int):
+    if size < COMPRESS_MIN_BYTES:
+        return None
+    accept = request.headers.get("accept-encoding", "")
+    if brotli is not None and "br" in accept:
+        return "br"
+    if "gzip" in accept:
+        return "gzip"
+    return None
+
+
+def encode_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def not_modified_response(etag: str, last_modified) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+
+def json_body_response(
+    request: Request, body: bytes, etag: str, last_modified, encoded=None
+) -> Response:
+    """
+    Gotowy JSON + walidatory; duże body kompresujemy (br/gzip).
+    encoded: opcjonalny dict na już skompresowane wersje tego samego body.
+    """
+    headers = validator_headers(etag, last_modified)
+    encoding = pick_encoding(request, len(body))
+    if encoding is not None:
+        if encoded is not None:
+            if encoding not in encoded:
+                encoded[encoding] = encode_body(body, encoding)
+            body = encoded[encoding]
+        else:
+            body = encode_body(body, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # ================== LP SNAPSHOTS ==================
 
 
-def query_lp_latest(wallet: str):
+SQL_LP_LATEST = """
+    SELECT DISTINCT ON (pair_address)
+        pair_address,
+        item_name,
+        ts,
+        price_vee,
+        reserve_vee,
+        reserve_item,
+        lp_balance,
+        lp_share,
+        user_vee,
+        user_item,
+        volume_24h_vee,
+        volume_7d_vee,
+        lp_earn_vee_24h,
+        lp_earn_vee_7d,
+        lp_apr
+    FROM lp_snapshots
+    WHERE wallet_address = LOWER($1)
+    ORDER BY pair_address, ts DESC
+"""
+
+
+async def query_lp_latest(wallet: str):
     """
     Ostatni snapshot z lp_snapshots dla każdej pary.
     """
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT DISTINCT ON (pair_address)
-            pair_address,
-            item_name,
-            ts,
-            price_vee,
-            reserve_vee,
-            reserve_item,
-            lp_balance,
-            lp_share,
-            user_vee,
-            user_item,
-            volume_24h_vee,
-            volume_7d_vee,
-            lp_earn_vee_24h,
-            lp_earn_vee_7d,
-            lp_apr
-        FROM lp_snapshots
-        WHERE LOWER(wallet_address) = LOWER(%s)
-        ORDER BY pair_address, ts DESC
-        """,
-        (wallet,),
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(SQL_LP_LATEST, wallet)
 
     cols = [
         "pair_address",
@@ -363,54 +722,288 @@ def query_lp_latest(wallet: str):
     return result
 
 
-def query_lp_history(wallet: str):
+LP_POSITION_COLUMNS = [
+    "wallet_address",
+    "pair_address",
+    "item_name",
+    "entry_ts",
+    "entry_user_vee",
+    "entry_user_item",
+    "last_ts",
+    "price_vee",
+    "user_vee",
+    "user_item",
+    "lp_apr",
+]
+
+
+SQL_LP_POSITIONS_OPEN = """
+    SELECT
+        wallet_address,
+        pair_address,
+        item_name,
+        entry_ts,
+        entry_user_vee,
+        entry_user_item,
+        last_ts,
+        price_vee,
+        user_vee,
+        user_item,
+        lp_apr
+    FROM lp_positions
+    WHERE wallet_address = LOWER($1)
+      AND closed_ts IS NULL
+    ORDER BY pair_address
+"""
+
+
+SQL_LP_POSITIONS_ASOF = """
+    SELECT
+        p.wallet_address,
+        p.pair_address,
+        p.item_name,
+        p.entry_ts,
+        p.entry_user_vee,
+        p.entry_user_item,
+        s.ts AS last_ts,
+        s.price_vee,
+        s.user_vee,
+        s.user_item,
+        s.lp_apr
+    FROM lp_positions p
+    CROSS JOIN LATERAL (
+        SELECT ts, price_vee, user_vee, user_item, lp_apr
+        FROM lp_snapshots
+        WHERE wallet_address = p.wallet_address
+          AND pair_address = p.pair_address
+          AND ts <= $2
+        ORDER BY ts DESC
+        LIMIT 1
+    ) s
+    WHERE p.wallet_address = LOWER($1)
+      AND p.entry_ts <= $2
+      AND (p.closed_ts IS NULL OR p.closed_ts > $2)
+    ORDER BY p.pair_address
+"""
+
+
+async def query_lp_positions(wallet: str, asof_ts=None):
     """
-    Pełna historia LP dla walleta (pod liczenie IL).
+    Pozycje LP walleta (pod liczenie IL) z lp_positions: snapshot wejścia
+    + ostatni snapshot, 1 wiersz na otwartą pozycję (O(par), nie O(historii)).
+    asof_ts – pozycje otwarte w asof_ts, ostatni snapshot <= asof_ts
+    (1 odczyt po indeksie lp_snapshots na parę).
     """
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            pair_address,
-            item_name,
-            ts,
-            price_vee,
-            user_vee,
-            user_item,
-            lp_apr
-        FROM lp_snapshots
-        WHERE LOWER(wallet_address) = LOWER(%s)
-        ORDER BY pair_address, ts ASC
-        """,
-        (wallet,),
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    async with DB_POOL.connection() as conn:
+        if asof_ts is None:
+            rows = await conn.fetch(SQL_LP_POSITIONS_OPEN, wallet)
+        else:
+            rows = await conn.fetch(SQL_LP_POSITIONS_ASOF, wallet, asof_ts)
+    return lp_position_rows(rows)
 
-    cols = [
-        "pair_address",
-        "item_name",
-        "ts",
-        "price_vee",
-        "user_vee",
-        "user_item",
-        "lp_apr",
-    ]
 
+SQL_LP_POSITIONS_BULK = """
+    SELECT
+        wallet_address,
+        pair_address,
+        item_name,
+        entry_ts,
+        entry_user_vee::float8,
+        entry_user_item::float8,
+        last_ts,
+        price_vee::float8,
+        user_vee::float8,
+        user_item::float8,
+        lp_apr::float8
+    FROM lp_positions
+    WHERE wallet_address = ANY($1::text[])
+      AND closed_ts IS NULL
+    ORDER BY wallet_address, pair_address
+"""
+
+
+async def query_lp_positions_bulk(wallets):
+    """
+    Otwarte pozycje LP wielu portfeli jednym zapytaniem (po
+    lp_positions_open_idx), pod /api/lp/il/bulk – jako kolumny
+    (lp_analytics.POSITION_COLUMNS).
+    """
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(SQL_LP_POSITIONS_BULK, wallets)
+    # kolumny prosto z wierszy (bez dicta per pozycja), numeric jako float8
+    # z bazy (bez Decimal) – wejście lp_analytics
+    return lp_analytics.rows_to_columns(rows)
+
+
+def lp_position_rows(rows):
     out = []
     for r in rows:
-        d = dict(zip(cols, r))
-        for k in ["price_vee", "user_vee", "user_item", "lp_apr"]:
+        d = dict(zip(LP_POSITION_COLUMNS, r))
+        for k in ["entry_user_vee", "entry_user_item", "price_vee", "user_vee", "user_item", "lp_apr"]:
             if d.get(k) is not None:
                 d[k] = float(d[k])
-        # ts zostaje datetime
+        # entry_ts / last_ts zostają datetime
         out.append(d)
 
     return out
 
 
+# pozycje z lp_cache + czy portfel jest włączony w lp_wallets (oba po PK);
+# portfel bez wierszy w lp_cache daje jeden wiersz z pair_address = NULL
+SQL_LP_CACHE = """
+    SELECT
+        c.pair_address,
+        c.lp_balance,
+        c.lp_share,
+        c.user_vee,
+        c.user_item,
+        c.ts,
+        w.wallet_address IS NOT NULL AS registered
+    FROM (SELECT $1::text AS wallet_address) q
+    LEFT JOIN lp_wallets w
+      ON w.wallet_address = q.wallet_address
+     AND w.enabled = TRUE
+    LEFT JOIN lp_cache c
+      ON c.wallet_address = q.wallet_address
+"""
+
+
+async def query_lp_cache(wallet: str):
+    """
+    Pozycje LP portfela z lp_cache (odświeżane przez lp_cache_update.py)
+    i rejestracja w lp_wallets – jedno zapytanie, odczyty po PK.
+    Zwraca (wiersze, portfel z lp_wallets?).
+    """
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(SQL_LP_CACHE, wallet)
+    return [r for r in rows if r["pair_address"] is not None], rows[0]["registered"]
+
+
+async def fetch_lp_cache_wallet(wallet: str, market):
+    """
+    Portfel z lp_wallets spoza lp_cache: balanse wszystkich par z jednej
+    rundy Multicall3 (w wątku – rpc_client jest synchroniczny), zapis
+    pozycji z lp_balance > 0 do lp_cache jednym INSERT-em, zwraca wiersze
+    jak query_lp_cache().
+    """
+    pairs = [
+        (r["pair_address"], r["item_name"], r["reserve_vee"], r["reserve_item"])
+        for r in market
+    ]
+    LP_FETCH_TRIED[wallet] = time.time()
+    async with LP_FETCH_SEMAPHORE:
+        rows = await asyncio.to_thread(lp_cache_update.cache_rows, [wallet], pairs)
+    rows = [r for r in rows if r[3] > 0]
+    if not rows:
+        return []
+
+    _, pair_addresses, item_names, balances, shares, user_vee, user_item = zip(*rows)
+    async with DB_POOL.connection() as conn:
+        return await conn.fetch(
+            """
+            INSERT INTO lp_cache (
+                wallet_address, pair_address, item_name, ts,
+                lp_balance, lp_share, user_vee, user_item
+            )
+            SELECT $1, t.pair_address, t.item_name, NOW(),
+                   t.lp_balance, t.lp_share, t.user_vee, t.user_item
+            FROM unnest(
+                $2::text[], $3::text[], $4::float8[], $5::float8[], $6::float8[], $7::float8[]
+            ) AS t (pair_address, item_name, lp_balance, lp_share, user_vee, user_item)
+            ON CONFLICT (wallet_address, pair_address) DO UPDATE SET
+                ts = NOW(),
+                item_name = EXCLUDED.item_name,
+                lp_balance = EXCLUDED.lp_balance,
+                lp_share = EXCLUDED.lp_share,
+                user_vee = EXCLUDED.user_vee,
+                user_item = EXCLUDED.user_item
+            RETURNING pair_address, lp_balance, lp_share, user_vee, user_item, ts
+            """,
+            wallet,
+            list(pair_addresses),
+            list(item_names),
+            list(balances),
+            list(shares),
+            list(user_vee),
+            list(user_item),
+        )
+
+
+async def get_lp_cache_rows(wallet: str, lp_rows, registered, market):
+    """
+    lp_rows / registered z query_lp_cache(); pusty wynik dla portfela
+    z lp_wallets = portfel jeszcze nie w cache (albo bez pozycji) ->
+    odczyt z RPC, najwyżej raz na LP_FETCH_RETRY_SECONDS. Adres spoza
+    lp_wallets -> bez RPC i bez kolejnych zapytań.
+    Błąd RPC = brak LP w tej odpowiedzi.
+    """
+    if lp_rows or not registered or not WALLET_RE.match(wallet):
+        return lp_rows
+    if time.time() - LP_FETCH_TRIED.get(wallet, 0.0) < LP_FETCH_RETRY_SECONDS:
+        return lp_rows
+
+    task = LP_FETCH_INFLIGHT.get(wallet)
+    if task is None:
+        task = asyncio.ensure_future(fetch_lp_cache_wallet(wallet, market))
+        LP_FETCH_INFLIGHT[wallet] = task
+        task.add_done_callback(lambda _: LP_FETCH_INFLIGHT.pop(wallet, None))
+    try:
+        # shield: rozłączony klient nie przerywa odczytu innym czekającym
+        return await asyncio.shield(task)
+    except Exception as e:
+        print("LP_CACHE FETCH ERROR:", wallet, repr(e))
+        return []
+
+
+SQL_LP_POSITIONS_VERSION = """
+    SELECT
+        MAX(GREATEST(last_ts, closed_ts)) AS last_ts,
+        COUNT(*) AS positions
+    FROM lp_positions
+    WHERE wallet_address = LOWER($1)
+"""
+
+
+async def query_lp_positions_version(wallet: str):
+    """
+    Walidator dla /api/lp/{wallet}/il: najnowsza zmiana w lp_positions
+    (snapshot / zamknięcie) + liczba pozycji.
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetchrow(SQL_LP_POSITIONS_VERSION, wallet)
+
+
+async def query_lp_positions_bulk_version(wallets):
+    """
+    Walidator dla /api/lp/il/bulk: jak query_lp_positions_version,
+    dla wszystkich portfeli naraz.
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetchrow(
+            """
+            SELECT
+                MAX(GREATEST(last_ts, closed_ts)) AS last_ts,
+                COUNT(*) AS positions
+            FROM lp_positions
+            WHERE wallet_address = ANY($1::text[])
+            """,
+            wallets,
+        )
+
+
+async def query_enabled_wallets():
+    async with DB_POOL.connection() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT wallet_address
+            FROM lp_wallets
+            WHERE enabled
+            ORDER BY wallet_address
+            """
+        )
+    return [r["wallet_address"] for r in rows]
+
+
 def calc_il(entry_vee, entry_item, cur_vee, cur_item, price_vee):
     """
     IL w VEE:
@@ -438,168 +1031,219 @@ def calc_il(entry_vee, entry_item, cur_vee, cur_item, price_vee):
     return il, il_pct, value_hodl, value_lp
 
 
-def compute_lp_il_for_wallet(wallet: str):
+async def compute_lp_il_for_wallet(wallet: str, asof_ts=None, prices=None, vee_usd=None):
     """
-    IL per para + prosty scoring "net_effective_pct"
-    (lp_apr + IL annualized, jeśli ma sens).
+    IL per otwarta pozycja (wejście = pierwszy snapshot od ostatniego
+    resetu, z lp_positions) + prosty scoring "net_effective_pct"
+    (lp_apr + IL annualized, jeśli ma sens) – lp_analytics.analyze().
+    asof_ts / prices (pair_address -> price_vee) – tryb "na bloku N":
+    pozycje otwarte w asof_ts, snapshot LP do asof_ts, a cenę bieżącą z rynku na bloku.
     """
-    history = query_lp_history(wallet)
-    if not history:
+    positions = await query_lp_positions(wallet, asof_ts)
+    if not positions:
         return []
 
-    per_pair = {}
-    for row in history:
-        key = row["pair_address"].lower()
-        per_pair.setdefault(key, []).append(row)
-
-    results = []
+    if vee_usd is None:
+        vee_usd = await get_vee_usd_price()
+    results = lp_analytics.analyze(
+        lp_analytics.to_columns(positions), vee_usd, prices, MIN_DAYS_FOR_IL_ANNUALIZED
+    )
+    return results.get(wallet.lower(), [])
 
-    for key, rows in per_pair.items():
-        if not rows:
-            continue
 
-        rows_sorted = sorted(rows, key=lambda r: r["ts"])
-        entry = rows_sorted[0]
-        current = rows_sorted[-1]
+SQL_LP_LEDGER = """
+    SELECT
+        l.pair_address,
+        p.item_name,
+        l.lp_wei,
+        l.basis_vee_wei,
+        l.basis_item_wei,
+        l.basis_liq,
+        l.deposited_vee_wei,
+        l.deposited_item_wei,
+        l.withdrawn_vee_wei,
+        l.withdrawn_item_wei,
+        l.basis_complete,
+        l.entry_ts,
+        l.entry_block,
+        l.last_block,
+        l.events,
+        s.block_number AS supply_block,
+        s.total_supply_wei,
+        s.reserve_vee_wei,
+        s.reserve_item_wei
+    FROM lp_ledger l
+    JOIN lp_pair_supply s ON s.pair_address = l.pair_address
+    LEFT JOIN gex_pairs p ON p.pair_address = l.pair_address
+    WHERE l.wallet_address = LOWER($1)
+      AND l.lp_wei > 0
+    ORDER BY l.pair_address
+"""
+
+
+async def query_lp_ledger(wallet: str):
+    """
+    Otwarte pozycje walleta z lp_ledger (księga z eventów Mint / Burn /
+    Transfer, ingest_lp_events.py) + totalSupply i rezerwy pary z ostatniego
+    skanu (lp_pair_supply). Kwoty w wei.
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetch(SQL_LP_LEDGER, wallet)
 
-        entry_vee = entry.get("user_vee") or 0.0
-        entry_item = entry.get("user_item") or 0.0
-        cur_vee = current.get("user_vee") or 0.0
-        cur_item = current.get("user_item") or 0.0
 
-        price_now = current.get("price_vee") or 0.0
-        il_vee, il_pct, value_hodl, value_lp = calc_il(
-            entry_vee, entry_item, cur_vee, cur_item, price_now
+async def query_lp_ledger_version(wallet: str):
+    """
+    Walidator dla /api/lp/{wallet}/ledger: kursor skanera eventów
+    (księga i lp_pair_supply zmieniają się tylko razem z nim).
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetchval(
+            "SELECT last_block FROM lp_events_cursor WHERE id = 1"
         )
 
-        # ile dni w pozycji
-        try:
-            t0 = entry["ts"]
-            t1 = current["ts"]
-            delta_days = max((t1 - t0).total_seconds() / 86400.0, 0.0)
-        except Exception:
-            delta_days = 0.0
-
-        # annualizacja tylko jeśli pozycja jest starsza niż X dni
-        if (
-            delta_days <= 0
-            or il_pct is None
-            or delta_days < MIN_DAYS_FOR_IL_ANNUALIZED
-        ):
-            il_annualized_pct = None
-        else:
-            il_annualized_pct = il_pct * (365.0 / max(delta_days, 1e-6))
-
-        lp_apr = current.get("lp_apr")
-        if lp_apr is not None:
-            lp_apr = float(lp_apr)
-
-        net_effective_pct = None
-        if lp_apr is not None and il_annualized_pct is not None:
-            net_effective_pct = lp_apr + il_annualized_pct
-        elif lp_apr is not None:
-            net_effective_pct = lp_apr
-
-        vee_usd = get_vee_usd_price()
-        il_usd = None
-        value_hodl_usd = None
-        value_lp_usd = None
-        if vee_usd and vee_usd > 0:
-            il_usd = il_vee * vee_usd
-            value_hodl_usd = value_hodl * vee_usd
-            value_lp_usd = value_lp * vee_usd
-
-        results.append(
-            {
-                "pair_address": current["pair_address"],
-                "item_name": current.get("item_name"),
-                "entry_ts": entry["ts"].isoformat()
-                if isinstance(entry["ts"], datetime)
-                else entry["ts"],
-                "current_ts": current["ts"].isoformat()
-                if isinstance(current["ts"], datetime)
-                else current["ts"],
-                "days_in_position": delta_days,
-                "entry_user_vee": entry_vee,
-                "entry_user_item": entry_item,
-                "current_user_vee": cur_vee,
-                "current_user_item": cur_item,
-                "price_vee_now": price_now,
-                "value_hodl_vee": value_hodl,
-                "value_lp_vee": value_lp,
-                "il_vee": il_vee,
-                "il_pct": il_pct,
-                "il_annualized_pct": il_annualized_pct,
-                "lp_apr": lp_apr,
-                "net_effective_pct": net_effective_pct,
-                "il_usd": il_usd,
-                "value_hodl_usd": value_hodl_usd,
-                "value_lp_usd": value_lp_usd,
-            }
-        )
 
-    positive = [
-        r
-        for r in results
-        if r["net_effective_pct"] is not None and r["net_effective_pct"] > 0
-    ]
-    total_score = sum(r["net_effective_pct"] for r in positive) if positive else 0.0
-
-    for r in results:
-        if total_score > 0 and r in positive:
-            r["target_weight"] = r["net_effective_pct"] / total_score
-        else:
-            r["target_weight"] = 0.0
-
-    results.sort(
-        key=lambda r: (
-            r["net_effective_pct"] is None,
-            -(r["net_effective_pct"] or -1e9),
-        )
+def ledger_position(row) -> dict:
+    """
+    Pozycja z księgi -> IL i fee w VEE, liczone na intach (wei) do momentu
+    dzielenia:
+    - bieżące vee / item = udział (lp / totalSupply) w rezerwach,
+    - hodl = koszt wejścia (basis) po cenie bieżącej (calc_il),
+    - fee = wzrost sqrt(k) na LP ponad sqrt(vee * item) wejść (basis_liq),
+    - il_vee = wartość LP bez fee - hodl (sam IL, bez zarobionych fee).
+    """
+    lp = int(row["lp_wei"])
+    supply = int(row["total_supply_wei"])
+    reserve_vee = int(row["reserve_vee_wei"])
+    reserve_item = int(row["reserve_item_wei"])
+
+    cur_vee = cur_item = 0.0
+    price_now = None
+    fee_frac = 0.0
+    if supply > 0 and reserve_item > 0:
+        cur_vee = lp * reserve_vee // supply / 1e18
+        cur_item = lp * reserve_item // supply / 1e18
+        price_now = reserve_vee / reserve_item
+        liq_now = lp * math.isqrt(reserve_vee * reserve_item) // supply
+        if liq_now > 0:
+            fee_frac = max(0.0, 1.0 - int(row["basis_liq"]) / liq_now)
+
+    basis_vee = int(row["basis_vee_wei"]) / 1e18
+    basis_item = int(row["basis_item_wei"]) / 1e18
+    pnl_vee, pnl_pct, value_hodl, value_lp = calc_il(
+        basis_vee, basis_item, cur_vee, cur_item, price_now
     )
-    return results
+    fees_vee = fee_frac * value_lp
+    il_vee = value_lp - fees_vee - value_hodl
+    il_pct = (il_vee / value_hodl) * 100.0 if value_hodl > 0 else 0.0
+
+    return {
+        "pair_address": row["pair_address"],
+        "item_name": row["item_name"],
+        "entry_ts": row["entry_ts"].isoformat() if row["entry_ts"] else None,
+        "entry_block": row["entry_block"],
+        "last_event_block": row["last_block"],
+        "events": row["events"],
+        "lp_balance": lp / 1e18,
+        "lp_share": lp / supply if supply > 0 else 0.0,
+        "basis_vee": basis_vee,
+        "basis_item": basis_item,
+        "basis_complete": row["basis_complete"],
+        "current_user_vee": cur_vee,
+        "current_user_item": cur_item,
+        "price_vee_now": price_now,
+        "value_hodl_vee": value_hodl,
+        "value_lp_vee": value_lp,
+        "fees_vee": fees_vee,
+        "il_vee": il_vee,
+        "il_pct": il_pct,
+        "pnl_vee": pnl_vee,
+        "pnl_pct": pnl_pct,
+        "deposited_vee": int(row["deposited_vee_wei"]) / 1e18,
+        "deposited_item": int(row["deposited_item_wei"]) / 1e18,
+        "withdrawn_vee": int(row["withdrawn_vee_wei"]) / 1e18,
+        "withdrawn_item": int(row["withdrawn_item_wei"]) / 1e18,
+    }
 
 
 # ================== ROUTES ==================
 
 
+async def market_at_block_response(request: Request, block: int):
+    """
+    /api/market?block=N – liczone za każdym razem (bez cache marketu),
+    ETag z treści, więc dociągnięte później snapshoty dla bloku N
+    dają nowy ETag.
+    """
+    asof_ts, rows = await query_market_at_block(block)
+    if asof_ts is None:
+        raise HTTPException(status_code=404, detail=f"Brak snapshotów do bloku {block}")
+    body = JSONResponse(content=jsonable_encoder(rows)).body
+    etag = make_etag(block, hashlib.sha1(body).hexdigest())
+    if is_not_modified(request, etag, asof_ts):
+        return not_modified_response(etag, asof_ts)
+    return json_body_response(request, body, etag, asof_ts)
+
+
 @app.get("/api/market")
-def get_latest_snapshots_with_volume():
+async def get_latest_snapshots_with_volume(
+    request: Request,
+    block: Optional[int] = Query(None, ge=0),
+):
     """
     Lista wszystkich par z ceną + volume (bez LP).
+    Gotowy JSON (i jego skompresowane wersje) prosto z cache.
+    ?block=N – stan rynku na bloku N (query_market_at_block).
     """
-    return query_latest()
+    if block is not None:
+        return await market_at_block_response(request, block)
+
+    entry = await get_market_cached()
+    if is_not_modified(request, entry["etag"], entry["last_modified"]):
+        return not_modified_response(entry["etag"], entry["last_modified"])
+    return json_body_response(
+        request,
+        entry["body"],
+        entry["etag"],
+        entry["last_modified"],
+        encoded=entry["encoded"],
+    )
 
 
 @app.get("/api/market/{wallet}")
-def get_latest_snapshots_with_volume_and_lp(wallet: str):
+async def get_latest_snapshots_with_volume_and_lp(wallet: str, request: Request):
     """
     Market + LP dla portfela.
-    LP bierzemy z tabeli lp_cache (single wallet), wallet w URL
-    jest tu tylko po to, żeby front miał ładne /api/market/{wallet}.
+    LP portfela z lp_cache (jeden odczyt po PK); portfela z lp_wallets
+    jeszcze nie ma w cache -> odczyt z RPC i zapis (get_lp_cache_rows).
+    Bazę marketu bierzemy z cache (równolegle z lp_cache),
+    na kopii wierszy dokładamy tylko pola LP.
+    ETag = ETag marketu + stan lp_cache, więc 304 nie wymaga budowania JSON-a.
     """
-    data = query_latest()
-
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            LOWER(pair_address) AS pair_lower,
-            lp_balance,
-            lp_share,
-            user_vee,
-            user_item
-        FROM lp_cache
-        """
+    wallet = wallet.lower()
+    entry, (lp_rows, registered) = await asyncio.gather(
+        get_market_cached(), query_lp_cache(wallet)
+    )
+    lp_rows = await get_lp_cache_rows(wallet, lp_rows, registered, entry["rows"])
+
+    last_modified = entry["last_modified"]
+    for lp_row in lp_rows:
+        lp_ts = lp_row["ts"]
+        if lp_ts is not None and (last_modified is None or lp_ts > last_modified):
+            last_modified = lp_ts
+    etag = make_etag(
+        entry["etag"],
+        wallet,
+        len(lp_rows),
+        last_modified.isoformat() if last_modified else None,
     )
-    lp_rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    data = [dict(row) for row in entry["rows"]]
 
     lp_by_pair = {}
-    for pair_lower, lp_balance, lp_share, user_vee, user_item in lp_rows:
-        lp_by_pair[pair_lower] = {
+    for pair_address, lp_balance, lp_share, user_vee, user_item, *_ in lp_rows:
+        lp_by_pair[pair_address] = {
             "lp_balance": float(lp_balance or 0),
             "lp_share": float(lp_share or 0),
             "user_vee": float(user_vee or 0),
@@ -607,8 +1251,6 @@ def get_latest_snapshots_with_volume_and_lp(wallet: str):
         }
 
     for row in data:
-        pair_lower = row["pair_address"].lower()
-
         row["lp_balance"] = 0.0
         row["lp_share"] = 0.0
         row["user_item"] = 0.0
@@ -616,7 +1258,7 @@ def get_latest_snapshots_with_volume_and_lp(wallet: str):
         row["lp_earn_vee_24h"] = 0.0
         row["lp_earn_vee_7d"] = 0.0
 
-        lp_info = lp_by_pair.get(pair_lower)
+        lp_info = lp_by_pair.get(row["pair_address"])
         if not lp_info:
             continue
 
@@ -634,85 +1276,384 @@ def get_latest_snapshots_with_volume_and_lp(wallet: str):
             row["lp_earn_vee_24h"] = vol24 * LP_FEE_RATE * lp_share
             row["lp_earn_vee_7d"] = vol7 * LP_FEE_RATE * lp_share
 
-    return data
+    body = JSONResponse(content=jsonable_encoder(data)).body
+    return json_body_response(request, body, etag, last_modified)
 
 
-@app.get("/api/history/{pair_address}")
-def get_pair_history(pair_address: str):
+def floor_to_step(ts: datetime, step: timedelta) -> datetime:
+    return ts - ((ts - HISTORY_ORIGIN) % step)
+
+
+SQL_PAIR_HISTORY_HOURLY = """
+    SELECT
+        date_bin($2::interval, bucket, TIMESTAMPTZ '2000-01-01 00:00:00+00') AS b,
+        (array_agg(price_open ORDER BY bucket ASC)
+            FILTER (WHERE price_open IS NOT NULL))[1]     AS price_open,
+        MAX(price_high)                                   AS price_high,
+        MIN(price_low)                                    AS price_low,
+        (array_agg(price_close ORDER BY bucket DESC)
+            FILTER (WHERE price_close IS NOT NULL))[1]    AS price_close,
+        (array_agg(reserve_vee ORDER BY bucket DESC)
+            FILTER (WHERE reserve_vee IS NOT NULL))[1]    AS reserve_vee,
+        (array_agg(reserve_item ORDER BY bucket DESC)
+            FILTER (WHERE reserve_item IS NOT NULL))[1]   AS reserve_item,
+        SUM(volume_vee)                                   AS volume_vee,
+        SUM(trade_count)                                  AS trades
+    FROM pair_hourly
+    WHERE pair_address = LOWER($1)
+      AND bucket >= $3
+      AND bucket <  $4
+    GROUP BY 1
+    ORDER BY 1
+"""
+
+
+async def query_pair_history_hourly(pair_address: str, step, start, end):
     """
-    Historia ceny, rezerw i dziennego wolumenu dla pary.
-    Volume per day mnożymy *2, bo w trades_ronin jest połowa.
+    Buckety 1h/4h/1d z rollupu pair_hourly.
     """
-    conn = psycopg2.connect(**DB_PARAMS)
-    cur = conn.cursor()
+    async with DB_POOL.connection() as conn:
+        return await conn.fetch(
+            SQL_PAIR_HISTORY_HOURLY,
+            pair_address,
+            step,
+            start,
+            end,
+        )
+
 
-    cur.execute(
-        """
-        SELECT ts, price_vee, reserve_vee, reserve_item
+SQL_PAIR_HISTORY_RAW = """
+    WITH s AS (
+        SELECT
+            date_bin($2::interval, ts, TIMESTAMPTZ '2000-01-01 00:00:00+00') AS b,
+            (array_agg(price_vee ORDER BY ts ASC))[1]     AS price_open,
+            MAX(price_vee)                                AS price_high,
+            MIN(price_vee)                                AS price_low,
+            (array_agg(price_vee ORDER BY ts DESC))[1]    AS price_close,
+            (array_agg(reserve_vee ORDER BY ts DESC))[1]  AS reserve_vee,
+            (array_agg(reserve_item ORDER BY ts DESC))[1] AS reserve_item
         FROM gex_snapshots
-        WHERE LOWER(pair_address) = LOWER(%s)
-        ORDER BY ts ASC
-        """,
-        (pair_address,),
+        WHERE pair_address = LOWER($1)
+          AND ts >= $3
+          AND ts <  $4
+        GROUP BY 1
+    ),
+    t AS (
+        SELECT
+            date_bin($2::interval, tr.ts, TIMESTAMPTZ '2000-01-01 00:00:00+00') AS b,
+            SUM(tr.vee_wei) / 2e18 AS volume_vee,
+            COUNT(*)               AS trades
+        FROM trades_ronin tr
+        JOIN gex_pairs g ON g.pair_id = tr.pair_id
+        WHERE g.pair_address = LOWER($1)
+          AND tr.ts >= $3
+          AND tr.ts <  $4
+        GROUP BY 1
     )
-    snap_rows = cur.fetchall()
-    snapshots = [
-        {
-            "ts": row[0].isoformat(),
-            "price_vee": float(row[1]) if row[1] is not None else None,
-            "reserve_vee": float(row[2]) if row[2] is not None else None,
-            "reserve_item": float(row[3]) if row[3] is not None else None,
-        }
-        for row in snap_rows
-    ]
+    SELECT
+        COALESCE(s.b, t.b) AS b,
+        s.price_open,
+        s.price_high,
+        s.price_low,
+        s.price_close,
+        s.reserve_vee,
+        s.reserve_item,
+        t.volume_vee,
+        t.trades
+    FROM s
+    FULL JOIN t ON t.b = s.b
+    ORDER BY 1
+"""
+
+
+async def query_pair_history_raw(pair_address: str, step, start, end):
+    """
+    Buckety poniżej godziny (5m) liczone z surowych gex_snapshots / trades_ronin.
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetch(SQL_PAIR_HISTORY_RAW, pair_address, step, start, end)
 
-    cur.execute(
-        """
-        SELECT date_trunc('day', ts) AS day, SUM(vee_amount) AS volume_vee
-        FROM trades_ronin
-        WHERE LOWER(pair_address) = LOWER(%s)
-        GROUP BY 1
-        ORDER BY 1
-        """,
-        (pair_address,),
+
+async def query_pair_history_version(pair_address: str):
+    """
+    Walidator historii pary z pair_hourly: ostatni snapshot + liczba
+    trade'ów (łapie też trade'y doingestowane do starszych godzin).
+    """
+    async with DB_POOL.connection() as conn:
+        return await conn.fetchrow(
+            """
+            SELECT
+                MAX(last_ts)      AS last_ts,
+                MAX(bucket) FILTER (WHERE trade_count > 0) AS last_trade_bucket,
+                SUM(trade_count)  AS trades
+            FROM pair_hourly
+            WHERE pair_address = LOWER($1)
+            """,
+            pair_address,
+        )
+
+
+@app.get("/api/history/{pair_address}")
+async def get_pair_history(
+    pair_address: str,
+    request: Request,
+    from_ts: Optional[datetime] = Query(None, alias="from"),
+    to_ts: Optional[datetime] = Query(None, alias="to"),
+    resolution: str = "1h",
+):
+    """
+    Historia pary w bucketach OHLC: cena open/high/low/close, ostatnie
+    rezerwy w buckecie i wolumen VEE. Zakres from/to (ISO), rozdzielczość
+    5m/1h/4h/1d, max HISTORY_MAX_POINTS punktów (starszy koniec jest ucinany).
+    Volume mnożymy *2, bo w pair_hourly (i vee_wei / 2e18) jest połowa.
+    """
+    if resolution not in HISTORY_RESOLUTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"resolution must be one of: {', '.join(HISTORY_RESOLUTIONS)}",
+        )
+    step, default_span = HISTORY_RESOLUTIONS[resolution]
+
+    if from_ts is not None and from_ts.tzinfo is None:
+        from_ts = from_ts.replace(tzinfo=timezone.utc)
+    if to_ts is not None and to_ts.tzinfo is None:
+        to_ts = to_ts.replace(tzinfo=timezone.utc)
+
+    # granice wyrównane do bucketów – zmieniają się najwyżej raz na krok,
+    # więc ETag pozostaje stabilny między kolejnymi odświeżeniami
+    end = floor_to_step(to_ts or datetime.now(timezone.utc), step) + step
+    start = floor_to_step(from_ts or (end - default_span), step)
+    start = max(start, end - step * HISTORY_MAX_POINTS)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+
+    version = await query_pair_history_version(pair_address)
+    last_modified = version["last_ts"]
+    if version["last_trade_bucket"] is not None and (
+        last_modified is None or version["last_trade_bucket"] > last_modified
+    ):
+        last_modified = version["last_trade_bucket"]
+    etag = make_etag(
+        pair_address.lower(),
+        resolution,
+        start.isoformat(),
+        end.isoformat(),
+        version["last_ts"],
+        version["last_trade_bucket"],
+        version["trades"],
     )
-    vol_rows = cur.fetchall()
-    volumes = [
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    if step >= timedelta(hours=1):
+        rows = await query_pair_history_hourly(pair_address, step, start, end)
+    else:
+        rows = await query_pair_history_raw(pair_address, step, start, end)
+
+    def num(v):
+        return float(v) if v is not None else None
+
+    buckets = [
         {
-            "day": row[0].date().isoformat(),
-            "volume_vee": float(row[1]) * 2.0 if row[1] is not None else 0.0,
+            "ts": row["b"].isoformat(),
+            "price_open": num(row["price_open"]),
+            "price_high": num(row["price_high"]),
+            "price_low": num(row["price_low"]),
+            "price_close": num(row["price_close"]),
+            "reserve_vee": num(row["reserve_vee"]),
+            "reserve_item": num(row["reserve_item"]),
+            "volume_vee": float(row["volume_vee"]) * 2.0
+            if row["volume_vee"] is not None
+            else 0.0,
+            "trades": int(row["trades"] or 0),
         }
-        for row in vol_rows
+        for row in rows
     ]
 
-    cur.close()
-    conn.close()
+    body = JSONResponse(
+        content={
+            "pair_address": pair_address,
+            "resolution": resolution,
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "buckets": buckets,
+        }
+    ).body
+    return json_body_response(request, body, etag, last_modified)
 
-    return {"snapshots": snapshots, "daily_volume": volumes}
+
+@app.get("/api/lp/il/bulk")
+async def api_get_lp_il_bulk(
+    request: Request,
+    wallets: Optional[str] = Query(None),
+):
+    """
+    IL / net_effective_pct / target_weight dla wielu portfeli jednym
+    przebiegiem lp_analytics (dashboard). ?wallets=0x..,0x.. (domyślnie
+    wszystkie włączone z lp_wallets); wynik per portfel jak /il + sumy.
+    """
+    if wallets:
+        wallet_list = sorted({w.strip().lower() for w in wallets.split(",") if w.strip()})
+        bad = [w for w in wallet_list if not WALLET_RE.match(w)]
+        if bad:
+            raise HTTPException(status_code=400, detail=f"Nieprawidłowy adres portfela: {bad[0]}")
+    else:
+        wallet_list = await query_enabled_wallets()
+    if len(wallet_list) > LP_BULK_MAX_WALLETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Za dużo portfeli ({len(wallet_list)} > {LP_BULK_MAX_WALLETS})",
+        )
+
+    version, vee_usd = await asyncio.gather(
+        query_lp_positions_bulk_version(wallet_list),
+        get_vee_usd_price(),
+    )
+    last_modified = version["last_ts"]
+    etag = make_etag(
+        ",".join(wallet_list), last_modified, version["positions"], vee_usd
+    )
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    columns = await query_lp_positions_bulk(wallet_list)
+    results = lp_analytics.analyze(
+        columns, vee_usd, None, MIN_DAYS_FOR_IL_ANNUALIZED
+    )
+    payload = {
+        "vee_usd_price": vee_usd,
+        "wallets": {
+            w: {
+                "summary": lp_analytics.summarize(results.get(w, [])),
+                "pairs": results.get(w, []),
+            }
+            for w in wallet_list
+        },
+    }
+    body = JSONResponse(content=jsonable_encoder(payload)).body
+    return json_body_response(request, body, etag, last_modified)
 
 
 @app.get("/api/lp/{wallet}")
-def api_get_lp_latest(wallet: str):
-    return query_lp_latest(wallet)
+async def api_get_lp_latest(wallet: str):
+    return await query_lp_latest(wallet)
 
 
 @app.get("/api/lp/{wallet}/il")
-def api_get_lp_il(wallet: str):
-    results = compute_lp_il_for_wallet(wallet)
-    vee_usd = get_vee_usd_price()
-    return {
+async def api_get_lp_il(
+    wallet: str,
+    request: Request,
+    block: Optional[int] = Query(None, ge=0),
+):
+    """
+    ?block=N – IL na bloku N: snapshoty LP do ts bloku, ceny par z bloku N
+    (vee_usd_price zostaje bieżąca, historycznej nie trzymamy).
+    """
+    version, vee_usd = await asyncio.gather(
+        query_lp_positions_version(wallet),
+        get_vee_usd_price(),
+    )
+    last_modified = version["last_ts"]
+
+    asof_ts = None
+    prices = None
+    market_tag = None
+    if block is not None:
+        asof_ts, market = await query_market_at_block(block)
+        if asof_ts is None:
+            raise HTTPException(status_code=404, detail=f"Brak snapshotów do bloku {block}")
+        prices = {r["pair_address"]: r["price_vee"] for r in market}
+        market_tag = hashlib.sha1(
+            repr(sorted(prices.items())).encode("utf-8")
+        ).hexdigest()
+        if last_modified is not None:
+            last_modified = min(last_modified, asof_ts)
+
+    etag = make_etag(
+        wallet, last_modified, version["positions"], vee_usd, block, market_tag
+    )
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    results = await compute_lp_il_for_wallet(wallet, asof_ts, prices, vee_usd)
+    payload = {
         "wallet": wallet,
         "vee_usd_price": vee_usd,
         "pairs": results,
     }
+    if block is not None:
+        payload["block_number"] = block
+        payload["asof_ts"] = asof_ts
+    body = JSONResponse(content=jsonable_encoder(payload)).body
+    return json_body_response(request, body, etag, last_modified)
+
+
+@app.get("/api/lp/{wallet}/ledger")
+async def api_get_lp_ledger(wallet: str, request: Request):
+    """
+    Pozycje LP z księgi eventów (dokładny koszt wejścia, IL bez fee,
+    fee z wzrostu sqrt(k), wpłaty / wypłaty) na bloku ostatniego skanu
+    ingest_lp_events.py. /il liczy dalej ze snapshotów lp_positions.
+    """
+    wallet = wallet.lower()
+    if not WALLET_RE.match(wallet):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy adres portfela")
+
+    block, vee_usd = await asyncio.gather(
+        query_lp_ledger_version(wallet),
+        get_vee_usd_price(),
+    )
+    etag = make_etag(wallet, block, vee_usd)
+    if is_not_modified(request, etag, None):
+        return not_modified_response(etag, None)
+
+    rows = await query_lp_ledger(wallet)
+    positions = [ledger_position(r) for r in rows]
+    if vee_usd and vee_usd > 0:
+        for p in positions:
+            p["il_usd"] = p["il_vee"] * vee_usd
+            p["fees_usd"] = p["fees_vee"] * vee_usd
+            p["value_lp_usd"] = p["value_lp_vee"] * vee_usd
+
+    payload = {
+        "wallet": wallet,
+        "block_number": block,
+        "vee_usd_price": vee_usd,
+        "pairs": positions,
+    }
+    body = JSONResponse(content=jsonable_encoder(payload)).body
+    return json_body_response(request, body, etag, None)
 
 
 @app.get("/api/vee_price")
-def api_get_vee_price():
-    price = get_vee_usd_price()
+async def api_get_vee_price():
+    price = await get_vee_usd_price()
     return {"vee_usd": price}
 
 
+@app.get("/api/db/pool")
+async def api_get_db_pool_stats():
+    return DB_POOL.stats()
+
+
+@app.on_event("startup")
+async def open_db_pool():
+    # jak DB jeszcze nie wstała, pool otworzy się leniwie przy pierwszym requeście
+    try:
+        await DB_POOL.open()
+    except Exception as e:
+        print("DB_POOL open ERROR:", repr(e))
+    await ensure_market_listener()
+
+
+@app.on_event("shutdown")
+async def close_db_pool():
+    listener = MARKET_STATE["listener"]
+    if listener is not None and not listener.is_closed():
+        await listener.close()
+    await DB_POOL.close()
+
+
 @app.get("/api/mm/log", response_class=PlainTextResponse)
 def get_mm_log():
     try:
@@ -0,0 +1,72 @@
+-- trades_ronin_compact_migration.sql
+-- Migracja trades_ronin do kompaktowego formatu:
+--   pair_address text  -> pair_id integer (gex_pairs.pair_id)
+--   vee_address text   -> usunięte (jest w gex_pairs)
+--   tx_hash text       -> bytea (32 bajty)
+--   vee_amount numeric -> vee_wei numeric(78,0) = surowe VEE in + VEE out w wei
+--                         (stary vee_amount = vee_wei / 2e18)
+--   id bigserial       -> usunięte (klucz: pair_id, tx_hash, log_index)
+--
+-- Wymaga address_lowercase_migration.sql (adresy lowercase).
+-- Zatrzymaj ingest_trades.py na czas migracji. Stara tabela zostaje jako
+-- trades_ronin_old – po sprawdzeniu danych można ją skasować (na dole).
+
+BEGIN;
+
+-- krótki klucz pary
+ALTER TABLE gex_pairs
+    ADD COLUMN IF NOT EXISTS pair_id integer GENERATED BY DEFAULT AS IDENTITY;
+CREATE UNIQUE INDEX IF NOT EXISTS gex_pairs_pair_id_uniq ON gex_pairs (pair_id);
+
+-- pary, które są w trades_ronin, a nie ma ich w gex_pairs (np. usunięte)
+INSERT INTO gex_pairs (pair_address, vee_address, enabled)
+SELECT DISTINCT t.pair_address, t.vee_address, FALSE
+FROM trades_ronin t
+WHERE NOT EXISTS (
+    SELECT 1 FROM gex_pairs g WHERE g.pair_address = t.pair_address
+)
+ON CONFLICT (pair_address) DO NOTHING;
+
+CREATE TABLE trades_ronin_new (
+    block_number bigint        NOT NULL,
+    ts           timestamptz   NOT NULL,
+    pair_id      integer       NOT NULL REFERENCES gex_pairs (pair_id),
+    log_index    integer       NOT NULL,
+    tx_hash      bytea         NOT NULL,
+    vee_wei      numeric(78,0) NOT NULL
+);
+
+INSERT INTO trades_ronin_new (block_number, ts, pair_id, log_index, tx_hash, vee_wei)
+SELECT
+    t.block_number,
+    t.ts,
+    g.pair_id,
+    t.log_index,
+    decode(CASE WHEN t.tx_hash LIKE '0x%' THEN substr(t.tx_hash, 3) ELSE t.tx_hash END, 'hex'),
+    ROUND(t.vee_amount * 2e18)
+FROM trades_ronin t
+JOIN gex_pairs g ON g.pair_address = t.pair_address
+ORDER BY t.pair_address, t.ts;
+
+ALTER TABLE trades_ronin RENAME TO trades_ronin_old;
+ALTER INDEX IF EXISTS trades_ronin_unique      RENAME TO trades_ronin_old_unique;
+ALTER INDEX IF EXISTS trades_ronin_pair_ts_idx RENAME TO trades_ronin_old_pair_ts_idx;
+ALTER TABLE trades_ronin_new RENAME TO trades_ronin;
+
+CREATE UNIQUE INDEX trades_ronin_unique ON trades_ronin (pair_id, tx_hash, log_index);
+CREATE INDEX trades_ronin_pair_ts_idx   ON trades_ronin (pair_id, ts);
+
+COMMIT;
+
+ANALYZE trades_ronin;
+
+-- kontrola: liczba wierszy i wolumen muszą się zgadzać
+SELECT
+    (SELECT COUNT(*) FROM trades_ronin_old)                 AS rows_old,
+    (SELECT COUNT(*) FROM trades_ronin)                     AS rows_new,
+    (SELECT SUM(vee_amount) FROM trades_ronin_old)          AS volume_old,
+    (SELECT SUM(vee_wei) / 2e18 FROM trades_ronin)          AS volume_new,
+    pg_size_pretty(pg_total_relation_size('trades_ronin_old')) AS size_old,
+    pg_size_pretty(pg_total_relation_size('trades_ronin'))     AS size_new;
+
+-- DROP TABLE trades_ronin_old;